@@ -0,0 +1,66 @@
+"""
+Celery task throughput with a per-call MongoClient versus the shared worker client.
+
+Runs the task bodies in-process against the MongoDB from DB_URL (a local mongod container works as
+a stand-in) in a scratch database, once creating a fresh MongoClient per task as the tasks used to
+and once through the shared, pooled client of services/db.py, and reports tasks/sec for each.
+
+Usage:
+    python -m benchmarks.celery_tasks --tasks 500
+"""
+
+import argparse
+import json
+import time
+from unittest.mock import patch
+
+from pymongo import MongoClient
+
+from config.settings import DB_NAME, DB_URL
+from services import db as worker_db
+from services.tasks import analyze_article, send_welcome_email
+
+
+def run_tasks(count: int, article_ids: list[str]) -> float:
+    started = time.perf_counter()
+    for i in range(count):
+        send_welcome_email(f"bench{i}@example.com", "Bench")
+        analyze_article(article_ids[i % len(article_ids)])
+    return 2 * count / (time.perf_counter() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tasks", type=int, default=500)
+    parser.add_argument("--db", default=f"{DB_NAME}_bench")
+    args = parser.parse_args()
+
+    admin = MongoClient(DB_URL)
+    seeded = admin[args.db].articles.insert_many(
+        [{"title": f"Bench {i}", "content": "word " * 200, "tags": ["bench"]} for i in range(100)]
+    )
+    article_ids = [str(inserted_id) for inserted_id in seeded.inserted_ids]
+    clients = []
+
+    def fresh_db():
+        # The previous behaviour: a new client (and socket pool) for every task invocation.
+        client = MongoClient(DB_URL)
+        clients.append(client)
+        return client[args.db]
+
+    try:
+        with patch("services.tasks.get_db", fresh_db):
+            per_call = run_tasks(args.tasks, article_ids)
+        with patch("services.tasks.get_db", lambda: worker_db.get_client()[args.db]):
+            shared = run_tasks(args.tasks, article_ids)
+    finally:
+        for client in clients:
+            client.close()
+        worker_db.close_client()
+        admin.drop_database(args.db)
+        admin.close()
+    print(json.dumps({"tasks_per_sec": {"per_call_client": round(per_call, 1), "shared_client": round(shared, 1)}}))
+
+
+if __name__ == "__main__":
+    main()
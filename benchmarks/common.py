@@ -0,0 +1,95 @@
+import math
+import random
+import time
+from datetime import datetime, timedelta, timezone
+
+WORDS = (
+    "python fastapi mongodb redis celery docker nginx async await cursor index query search token "
+    "article author tag stream cache worker queue latency throughput benchmark schema model router "
+    "service deploy cluster replica shard pool socket event loop thread process memory disk network"
+).split()
+
+TAGS = ["python", "fastapi", "mongodb", "redis", "celery", "docker", "devops", "testing", "performance", "api"]
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    """
+    Return the nearest-rank percentile of a list of samples.
+
+    Args:
+        samples (list[float]): Measured values.
+        pct (float): Percentile in the range 0-100.
+
+    Returns:
+        float: The percentile value, or 0.0 for an empty list.
+    """
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def summarize(samples: list[float]) -> dict:
+    """
+    Summarize latency samples (in seconds) as milliseconds.
+
+    Args:
+        samples (list[float]): Latencies in seconds.
+
+    Returns:
+        dict: Sample count, mean, p50, p95 and p99 in milliseconds.
+    """
+    return {
+        "count": len(samples),
+        "mean_ms": round(sum(samples) / len(samples) * 1000, 3) if samples else 0.0,
+        "p50_ms": round(percentile(samples, 50) * 1000, 3),
+        "p95_ms": round(percentile(samples, 95) * 1000, 3),
+        "p99_ms": round(percentile(samples, 99) * 1000, 3),
+    }
+
+
+def random_article(rng: random.Random, author: str = "benchmark") -> dict:
+    """
+    Generate a synthetic article document.
+
+    Args:
+        rng (random.Random): Seeded random generator, so corpora are reproducible.
+        author (str): Value of the 'author' field.
+
+    Returns:
+        dict: An article document ready to be inserted.
+    """
+    created_at = datetime(2025, 1, 1, tzinfo=timezone.utc) + timedelta(seconds=rng.randrange(365 * 86400))
+    return {
+        "title": " ".join(rng.choices(WORDS, k=rng.randint(3, 8))).capitalize(),
+        "content": " ".join(rng.choices(WORDS, k=rng.randint(50, 400))),
+        "tags": rng.sample(TAGS, k=rng.randint(1, 4)),
+        "author": author,
+        "created_at": created_at.isoformat(),
+    }
+
+
+def seed_articles(collection, size: int, seed: int = 42, chunk: int = 1000):
+    """
+    Replace the contents of a collection with a reproducible synthetic corpus.
+
+    Args:
+        collection: A pymongo collection.
+        size (int): Number of articles to insert.
+        seed (int): Random seed.
+        chunk (int): Number of documents per insert_many call.
+    """
+    rng = random.Random(seed)
+    collection.delete_many({})
+    for start in range(0, size, chunk):
+        collection.insert_many([random_article(rng) for _ in range(min(chunk, size - start))])
+
+
+def timed(func, *args, **kwargs) -> float:
+    """
+    Call a function and return the elapsed wall-clock time in seconds.
+    """
+    started = time.perf_counter()
+    func(*args, **kwargs)
+    return time.perf_counter() - started
@@ -0,0 +1,72 @@
+"""
+Compare two benchmarks.run reports and flag regressions.
+
+Prints, per scenario, the requests/sec and p95 latency of both reports with the relative change, and
+exits with status 1 if any scenario lost more than '--threshold' percent of its throughput or gained
+more than that in p95 latency.
+
+Usage:
+    python -m benchmarks.compare baseline.json candidate.json --threshold 10
+"""
+
+import argparse
+import json
+import sys
+
+
+def change(before: float, after: float) -> float:
+    return (after - before) / before * 100 if before else 0.0
+
+
+def compare(baseline: dict, candidate: dict, threshold: float) -> tuple[list[dict], bool]:
+    """
+    Compare the scenarios present and not skipped in both reports.
+
+    Returns:
+        tuple[list[dict], bool]: One row per scenario, and whether any scenario regressed.
+    """
+    rows, regressed = [], False
+    for name, before in baseline["scenarios"].items():
+        after = candidate["scenarios"].get(name)
+        if after is None or "skipped" in before or "skipped" in after:
+            continue
+        rps_change = change(before["rps"], after["rps"])
+        p95_change = change(before["p95_ms"], after["p95_ms"])
+        row_regressed = rps_change < -threshold or p95_change > threshold
+        regressed = regressed or row_regressed
+        rows.append(
+            {
+                "scenario": name,
+                "rps": [before["rps"], after["rps"], round(rps_change, 1)],
+                "p95_ms": [before["p95_ms"], after["p95_ms"], round(p95_change, 1)],
+                "regressed": row_regressed,
+            }
+        )
+    return rows, regressed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("baseline")
+    parser.add_argument("candidate")
+    parser.add_argument("--threshold", type=float, default=10.0, help="Tolerated change in percent.")
+    args = parser.parse_args()
+    with open(args.baseline, encoding="utf-8") as file:
+        baseline = json.load(file)
+    with open(args.candidate, encoding="utf-8") as file:
+        candidate = json.load(file)
+
+    rows, regressed = compare(baseline, candidate, args.threshold)
+    print(f"{'scenario':<14}{'rps before':>12}{'rps after':>12}{'%':>8}{'p95 before':>12}{'p95 after':>12}{'%':>8}")
+    for row in rows:
+        (rps_before, rps_after, rps_change), (p95_before, p95_after, p95_change) = row["rps"], row["p95_ms"]
+        flag = "  REGRESSION" if row["regressed"] else ""
+        print(
+            f"{row['scenario']:<14}{rps_before:>12}{rps_after:>12}{rps_change:>8}"
+            f"{p95_before:>12}{p95_after:>12}{p95_change:>8}{flag}"
+        )
+    sys.exit(1 if regressed else 0)
+
+
+if __name__ == "__main__":
+    main()
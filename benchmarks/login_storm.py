@@ -0,0 +1,76 @@
+"""
+Article-read latency during a login storm.
+
+Measures GET /api/v1/articles/{id}/ latency on a running API, first on its own and then while a
+burst of concurrent logins hammers bcrypt. With hashing on the worker pool the two read summaries
+should stay close; logins beyond the pool's queue are rejected with 503 and counted.
+
+Usage:
+    python -m benchmarks.login_storm --base-url http://localhost:8000 --duration 10 --logins 50
+"""
+
+import argparse
+import asyncio
+import json
+import time
+import uuid
+
+import httpx
+
+from benchmarks.common import summarize
+
+
+async def read_loop(client: httpx.AsyncClient, url: str, headers: dict, deadline: float, samples: list):
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        response = await client.get(url, headers=headers)
+        response.raise_for_status()
+        samples.append(time.perf_counter() - started)
+
+
+async def login_loop(client: httpx.AsyncClient, credentials: dict, deadline: float, outcomes: dict):
+    while time.perf_counter() < deadline:
+        response = await client.post("/api/v1/auth/login/", data=credentials)
+        outcomes[response.status_code] = outcomes.get(response.status_code, 0) + 1
+
+
+async def measure(base_url: str, duration: float, readers: int, logins: int) -> dict:
+    email = f"storm-{uuid.uuid4().hex[:8]}@example.com"
+    credentials = {"username": email, "password": "stormpassword1"}
+    limits = httpx.Limits(max_connections=readers + logins + 1)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30) as client:
+        user = {"email": email, "name": "Storm", "password": credentials["password"]}
+        await client.post("/api/v1/auth/register/", json=user)
+        token = (await client.post("/api/v1/auth/login/", data=credentials)).json()["access_token"]
+        headers = {"Authorization": f"Bearer {token}"}
+        article = await client.post(
+            "/api/v1/articles/", json={"title": "Storm", "content": "Read me.", "tags": []}, headers=headers
+        )
+        url = f"/api/v1/articles/{article.json()['id']}/"
+
+        baseline: list[float] = []
+        deadline = time.perf_counter() + duration
+        await asyncio.gather(*(read_loop(client, url, headers, deadline, baseline) for _ in range(readers)))
+
+        during_storm: list[float] = []
+        outcomes: dict = {}
+        deadline = time.perf_counter() + duration
+        await asyncio.gather(
+            *(read_loop(client, url, headers, deadline, during_storm) for _ in range(readers)),
+            *(login_loop(client, credentials, deadline, outcomes) for _ in range(logins)),
+        )
+    return {"reads_baseline": summarize(baseline), "reads_during_storm": summarize(during_storm), "logins": outcomes}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--readers", type=int, default=10)
+    parser.add_argument("--logins", type=int, default=50)
+    args = parser.parse_args()
+    print(json.dumps(asyncio.run(measure(args.base_url, args.duration, args.readers, args.logins)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
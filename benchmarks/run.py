@@ -0,0 +1,213 @@
+"""
+Reproducible load test of the main API endpoints.
+
+Seeds a scratch database with a synthetic corpus, then drives register, login, list (plain, by tag,
+by search), tag suggestions, get and analyze with a concurrent async client and reports
+requests/sec and latency percentiles per scenario as JSON. Save the output of two commits and diff
+them with benchmarks.compare.
+
+By default the app runs in-process (httpx ASGITransport) against the MongoDB from DB_URL, in a
+'<DB_NAME>_bench' database that is dropped afterwards; Celery tasks are published to an in-memory
+broker, so analyze measures the API side only. '--backend mongomock' uses mongomock-motor instead of
+MongoDB (pip install mongomock-motor); it has no text index, so the search scenario is skipped, and no
+$substrCP, so list scenarios request explicit fields instead of the default summary with its excerpt.
+'--base-url' targets a running deployment instead, seeding through the API.
+
+Usage:
+    python -m benchmarks.run --corpus 10000 --requests 500 --concurrency 20 --output baseline.json
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import subprocess
+import time
+import uuid
+from datetime import datetime, timezone
+
+import httpx
+
+from benchmarks.common import TAGS, WORDS, random_article, summarize
+
+SCENARIOS = ("register", "login", "list", "list_tags", "list_search", "tag_suggest", "get_article", "analyze")
+PASSWORD = "benchpassword1"
+MONGOMOCK_LIST_FIELDS = "title,tags,author,created_at,version"
+
+
+async def drive(client: httpx.AsyncClient, requests: int, concurrency: int, make_request) -> dict:
+    """
+    Send 'requests' requests from 'concurrency' concurrent workers and summarize them.
+
+    Args:
+        client (httpx.AsyncClient): Client bound to the API.
+        requests (int): Total number of requests.
+        concurrency (int): Number of requests in flight at once.
+        make_request: Coroutine function (client, i) returning an httpx.Response.
+
+    Returns:
+        dict: Requests/sec, latency summary and response counts by status code.
+    """
+    latencies: list[float] = []
+    statuses: dict[str, int] = {}
+    counter = iter(range(requests))
+
+    async def worker():
+        for i in counter:
+            started = time.perf_counter()
+            response = await make_request(client, i)
+            latencies.append(time.perf_counter() - started)
+            statuses[str(response.status_code)] = statuses.get(str(response.status_code), 0) + 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    return {"rps": round(requests / elapsed, 1), **summarize(latencies), "statuses": statuses}
+
+
+async def seed_in_process(app, backend: str, db_name: str, corpus: int, seed: int):
+    """
+    Attach a scratch database to the app and fill it with the synthetic corpus.
+
+    Returns:
+        A coroutine function dropping the scratch database.
+    """
+    if backend == "mongomock":
+        from mongomock_motor import AsyncMongoMockClient
+
+        client = AsyncMongoMockClient()
+    else:
+        from motor.motor_asyncio import AsyncIOMotorClient
+
+        from config.indexes import ensure_indexes
+        from config.settings import DB_URL
+
+        client = AsyncIOMotorClient(DB_URL)
+    app.mongodb_client = client
+    app.mongodb = client[db_name]
+    await client.drop_database(db_name)
+    if backend != "mongomock":
+        await ensure_indexes(app.mongodb)
+
+    rng = random.Random(seed)
+    for start in range(0, corpus, 1000):
+        await app.mongodb.articles.insert_many([random_article(rng) for _ in range(min(1000, corpus - start))])
+
+    async def cleanup():
+        await client.drop_database(db_name)
+        client.close()
+
+    return cleanup
+
+
+async def seed_remote(client: httpx.AsyncClient, headers: dict, corpus: int, seed: int):
+    rng = random.Random(seed)
+    for _ in range(corpus):
+        article = random_article(rng)
+        payload = {key: article[key] for key in ("title", "content", "tags")}
+        (await client.post("/api/v1/articles/", json=payload, headers=headers)).raise_for_status()
+
+
+async def run(args) -> dict:
+    cleanup = None
+    mongomock = args.backend == "mongomock" and not args.base_url
+    if args.base_url:
+        transport, base_url = None, args.base_url
+    else:
+        from config.celery import celery_app
+        from main import app
+        from services.outbox import outbox
+        from utils.response_cache import article_cache
+
+        celery_app.conf.update(broker_url="memory://", result_backend="cache+memory://")
+        article_cache.enabled = not args.no_cache
+        outbox.use_transactions = args.backend != "mongomock"
+        cleanup = await seed_in_process(app, args.backend, args.db, args.corpus, args.seed)
+        transport, base_url = httpx.ASGITransport(app=app), "http://bench"
+
+    limits = httpx.Limits(max_connections=args.concurrency + 1)
+    async with httpx.AsyncClient(transport=transport, base_url=base_url, limits=limits, timeout=60) as client:
+        email = f"bench-{uuid.uuid4().hex[:8]}@example.com"
+        await client.post("/api/v1/auth/register/", json={"email": email, "name": "Bench", "password": PASSWORD})
+        login = {"username": email, "password": PASSWORD}
+        token = (await client.post("/api/v1/auth/login/", data=login)).json()["access_token"]
+        headers = {"Authorization": f"Bearer {token}"}
+        if args.base_url:
+            await seed_remote(client, headers, args.corpus, args.seed)
+        list_url = "/api/v1/articles/?" + (f"fields={MONGOMOCK_LIST_FIELDS}&" if mongomock else "")
+        listed = (await client.get(f"{list_url}limit=100", headers=headers)).json()["items"]
+        article_ids = [article["id"] for article in listed]
+        rng = random.Random(args.seed)
+
+        requests = {
+            "register": lambda c, i: c.post(
+                "/api/v1/auth/register/",
+                json={"email": f"bench-{uuid.uuid4().hex}@example.com", "name": "Bench", "password": PASSWORD},
+            ),
+            "login": lambda c, i: c.post("/api/v1/auth/login/", data=login),
+            "list": lambda c, i: c.get(list_url, headers=headers),
+            "list_tags": lambda c, i: c.get(f"{list_url}tags={rng.choice(TAGS)}", headers=headers),
+            "list_search": lambda c, i: c.get(f"{list_url}search={rng.choice(WORDS)}", headers=headers),
+            "tag_suggest": lambda c, i: c.get(f"/api/v1/articles/tags?prefix={rng.choice(TAGS)[:2]}", headers=headers),
+            "get_article": lambda c, i: c.get(f"/api/v1/articles/{rng.choice(article_ids)}/", headers=headers),
+            "analyze": lambda c, i: c.post(f"/api/v1/articles/{rng.choice(article_ids)}/analyze/", headers=headers),
+        }
+        results = {}
+        try:
+            for name in args.scenarios:
+                if name == "list_search" and mongomock:
+                    results[name] = {"skipped": "mongomock has no text index"}
+                    continue
+                # Password hashing is deliberately slow: use fewer requests for the auth scenarios.
+                count = args.requests if name not in ("register", "login") else max(1, args.requests // 10)
+                results[name] = await drive(client, count, args.concurrency, requests[name])
+        finally:
+            if cleanup is not None:
+                await cleanup()
+    return results
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    from config.settings import DB_NAME
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--corpus", type=int, default=1000, help="Number of seeded articles.")
+    parser.add_argument("--requests", type=int, default=500, help="Requests per scenario (a tenth for auth).")
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=list(SCENARIOS))
+    parser.add_argument("--backend", choices=["mongo", "mongomock"], default="mongo")
+    parser.add_argument("--base-url", help="Benchmark a running API instead of the in-process app.")
+    parser.add_argument("--no-cache", action="store_true", help="Disable the response cache (in-process only).")
+    parser.add_argument("--db", default=f"{DB_NAME}_bench")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="Write the results to this JSON file as well.")
+    args = parser.parse_args()
+
+    report = {
+        "meta": {
+            "commit": git_commit(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "backend": "remote" if args.base_url else args.backend,
+            "corpus": args.corpus,
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "cache": not args.no_cache,
+        },
+        "scenarios": asyncio.run(run(args)),
+    }
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(output + "\n")
+    print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""
+Throughput of the production server as the number of worker processes grows.
+
+Starts `gunicorn main:app` (configured by gunicorn.conf.py) with each worker count in turn and
+drives the same load against it from several client processes, so that the load generator is not
+the bottleneck, then reports requests/sec, the speedup over the first worker count and latency
+percentiles. The API's dependencies (DB_URL, CACHE_REDIS_URL) must be reachable; '--anonymous
+--path /' only requests the root page, which measures the server topology without the database.
+
+Usage:
+    python -m benchmarks.scaling --workers 1 2 4 --clients 4 --path "/api/v1/articles/?limit=20"
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import subprocess
+import sys
+import time
+import uuid
+
+import httpx
+
+from benchmarks.common import summarize
+
+PASSWORD = "scalingpassword1"
+
+
+async def load(base_url: str, path: str, headers: dict, requests: int, concurrency: int) -> tuple:
+    latencies: list[float] = []
+    statuses: dict[str, int] = {}
+    counter = iter(range(requests))
+    limits = httpx.Limits(max_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, headers=headers, limits=limits, timeout=60) as client:
+
+        async def worker():
+            for _ in counter:
+                started = time.perf_counter()
+                response = await client.get(path)
+                latencies.append(time.perf_counter() - started)
+                statuses[str(response.status_code)] = statuses.get(str(response.status_code), 0) + 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        return time.perf_counter() - started, latencies, statuses
+
+
+def run_client(base_url: str, path: str, headers: dict, requests: int, concurrency: int) -> tuple:
+    return asyncio.run(load(base_url, path, headers, requests, concurrency))
+
+
+def start_server(workers: int, port: int) -> subprocess.Popen:
+    env = {**os.environ, "WEB_WORKERS": str(workers), "WEB_BIND": f"127.0.0.1:{port}"}
+    return subprocess.Popen(
+        [sys.executable, "-m", "gunicorn", "main:app"], env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+
+
+def wait_until_ready(base_url: str, server: subprocess.Popen, timeout: float = 30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError(f"Server exited with code {server.returncode}")
+        try:
+            if httpx.get(f"{base_url}/", timeout=1).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError("Server did not become ready")
+
+
+def authenticate(base_url: str) -> dict:
+    email = f"scaling-{uuid.uuid4().hex[:8]}@example.com"
+    with httpx.Client(base_url=base_url, timeout=30) as client:
+        client.post("/api/v1/auth/register/", json={"email": email, "name": "Scaling", "password": PASSWORD})
+        response = client.post("/api/v1/auth/login/", data={"username": email, "password": PASSWORD})
+        response.raise_for_status()
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+def measure(args, workers: int) -> dict:
+    """
+    Start the server with 'workers' processes, load it from 'args.clients' processes and stop it.
+
+    Returns:
+        dict: Requests/sec, latency summary and response counts by status code.
+    """
+    base_url = f"http://127.0.0.1:{args.port}"
+    server = start_server(workers, args.port)
+    try:
+        wait_until_ready(base_url, server)
+        headers = {} if args.anonymous else authenticate(base_url)
+        client_args = (base_url, args.path, headers, args.requests, args.concurrency)
+        # Warm up every worker (caches, connection pools) before measuring.
+        run_client(base_url, args.path, headers, workers * args.concurrency, args.concurrency)
+        with multiprocessing.Pool(args.clients) as pool:
+            results = pool.starmap(run_client, [client_args] * args.clients)
+    finally:
+        server.terminate()
+        server.wait(timeout=60)
+    latencies = [latency for _, client_latencies, _ in results for latency in client_latencies]
+    statuses: dict[str, int] = {}
+    for _, _, client_statuses in results:
+        for code, count in client_statuses.items():
+            statuses[code] = statuses.get(code, 0) + count
+    elapsed = max(client_elapsed for client_elapsed, _, _ in results)
+    return {
+        "workers": workers,
+        "rps": round(len(latencies) / elapsed, 1),
+        **summarize(latencies),
+        "statuses": statuses,
+    }
+
+
+def main():
+    cpus = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count() or 1
+    default_workers = sorted({1, *(2**i for i in range(1, cpus.bit_length()) if 2**i <= cpus), cpus})
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, nargs="+", default=default_workers, help="Worker counts to compare.")
+    parser.add_argument("--clients", type=int, default=cpus, help="Number of load generating processes.")
+    parser.add_argument("--requests", type=int, default=2000, help="Requests per client process.")
+    parser.add_argument("--concurrency", type=int, default=20, help="Requests in flight per client process.")
+    parser.add_argument("--path", default="/api/v1/articles/?limit=20")
+    parser.add_argument("--anonymous", action="store_true", help="Do not log in (for public paths such as '/').")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--output", help="Write the results to this JSON file as well.")
+    args = parser.parse_args()
+
+    results = []
+    print(f"{'workers':>8}{'rps':>10}{'speedup':>9}{'p50 ms':>9}{'p95 ms':>9}  statuses")
+    for workers in args.workers:
+        result = measure(args, workers)
+        result["speedup"] = round(result["rps"] / results[0]["rps"], 2) if results else 1.0
+        results.append(result)
+        print(
+            f"{workers:>8}{result['rps']:>10}{result['speedup']:>9}{result['p50_ms']:>9}{result['p95_ms']:>9}"
+            f"  {result['statuses']}"
+        )
+    if args.output:
+        report = {"meta": {"cpus": cpus, "clients": args.clients, "path": args.path}, "results": results}
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(json.dumps(report, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Search latency against collection size.
+
+Seeds a scratch database with synthetic articles at several sizes and compares p50/p99 latency of the
+full-text search pipeline used by list_articles with the unanchored case-insensitive $regex it replaced.
+
+Usage:
+    python -m benchmarks.search_latency --sizes 1000 10000 100000 --queries 200
+"""
+
+import argparse
+import json
+import random
+
+from pymongo import MongoClient
+
+from benchmarks.common import WORDS, seed_articles, summarize, timed
+from config.settings import DB_NAME, DB_URL
+from utils.search import ARTICLES_TEXT_INDEX, text_search_pipeline
+
+PAGE = 20
+
+
+def run_text_search(collection, term: str):
+    list(collection.aggregate(text_search_pipeline(term, [], None, PAGE + 1)))
+
+
+def run_regex_search(collection, term: str):
+    query = {"$or": [{"title": {"$regex": term, "$options": "i"}}, {"content": {"$regex": term, "$options": "i"}}]}
+    list(collection.find(query).limit(PAGE + 1))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 50000])
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--db", default=f"{DB_NAME}_bench")
+    args = parser.parse_args()
+
+    client = MongoClient(DB_URL)
+    collection = client[args.db]["articles"]
+    rng = random.Random(7)
+    terms = [" ".join(rng.sample(WORDS, k=rng.randint(1, 2))) for _ in range(args.queries)]
+    results = []
+    try:
+        for size in args.sizes:
+            seed_articles(collection, size)
+            collection.create_indexes([ARTICLES_TEXT_INDEX])
+            for mode, runner in (("text", run_text_search), ("regex", run_regex_search)):
+                samples = [timed(runner, collection, term) for term in terms]
+                results.append({"size": size, "mode": mode, **summarize(samples)})
+                row = results[-1]
+                print(f"{size:>8} {mode:<6} p50={row['p50_ms']:>9.3f}ms p99={row['p99_ms']:>9.3f}ms")
+    finally:
+        client.drop_database(args.db)
+        client.close()
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
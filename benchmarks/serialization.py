@@ -0,0 +1,116 @@
+"""
+Serialization cost of a list response: change_id_name + pydantic versus $project + orjson.
+
+The default run is in-process and needs no database: it encodes a list of synthetic article
+documents the way the router used to (change_id_name on every document, Article models, then
+FastAPI's response_model validation and JSON encoding) and the way it does now (documents already
+shaped by the article $project stage, encoded with orjson). With --mongo the documents are also read
+from the MongoDB in DB_URL, so the cost of the server-side projection is included.
+
+Usage:
+    python -m benchmarks.serialization --docs 10000 --rounds 5 [--mongo]
+"""
+
+import argparse
+import copy
+import json
+import random
+from typing import Optional
+
+from bson import ObjectId
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel
+from pymongo import MongoClient
+
+from benchmarks.common import random_article, summarize, timed
+from config.settings import DB_NAME, DB_URL
+from models.article import Article
+from utils.id import change_id_name
+from utils.serialization import article_projection, dump_json
+
+
+class ArticlePage(BaseModel):
+    # Full articles, as list pages were returned before the summary view.
+    items: list[Article]
+    next_cursor: Optional[str] = None
+
+
+def pydantic_path(documents: list[dict]) -> bytes:
+    items = []
+    for document in documents:
+        change_id_name(document)
+        items.append(Article(**document))
+    page = ArticlePage(items=items)
+    # What FastAPI does with the returned model for response_model=ArticlePage.
+    validated = ArticlePage.model_validate(page.model_dump())
+    return json.dumps(jsonable_encoder(validated)).encode()
+
+
+def orjson_path(documents: list[dict]) -> bytes:
+    return dump_json({"items": documents, "next_cursor": None})
+
+
+def project(document: dict) -> dict:
+    """
+    Apply the article $project stage in Python, to feed the in-process run.
+    """
+    return {
+        "id": str(document["_id"]),
+        "title": document["title"],
+        "content": document["content"],
+        "tags": document.get("tags", []),
+        "author": document.get("author"),
+        "created_at": document.get("created_at"),
+        "score": None,
+        "version": document.get("version", 0),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--docs", type=int, default=10000)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--mongo", action="store_true", help="Also read the documents from MongoDB.")
+    parser.add_argument("--db", default=f"{DB_NAME}_bench")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    raw = [{"_id": ObjectId(), **random_article(rng)} for _ in range(args.docs)]
+    projected = [project(document) for document in raw]
+    assert json.loads(pydantic_path(copy.deepcopy(raw))) == json.loads(orjson_path(projected))
+
+    results = {
+        "docs": args.docs,
+        "encode": {
+            "change_id_name_pydantic": summarize(
+                [timed(pydantic_path, copy.deepcopy(raw)) for _ in range(args.rounds)]
+            ),
+            "project_orjson": summarize([timed(orjson_path, projected) for _ in range(args.rounds)]),
+        },
+    }
+
+    if args.mongo:
+        client = MongoClient(DB_URL)
+        collection = client[args.db].articles
+        collection.delete_many({})
+        collection.insert_many(raw)
+        try:
+            results["fetch_and_encode"] = {
+                "change_id_name_pydantic": summarize(
+                    [timed(lambda: pydantic_path(list(collection.find()))) for _ in range(args.rounds)]
+                ),
+                "project_orjson": summarize(
+                    [
+                        timed(lambda: orjson_path(list(collection.aggregate([article_projection()]))))
+                        for _ in range(args.rounds)
+                    ]
+                ),
+            }
+        finally:
+            client.drop_database(args.db)
+            client.close()
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
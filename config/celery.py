@@ -1,15 +1,65 @@
 from celery import Celery
+from celery.signals import beat_init
+from kombu import Queue
 
+from config.settings import (
+    CELERY_PREFETCH_MULTIPLIER,
+    CELERY_VISIBILITY_TIMEOUT_SECONDS,
+    OUTBOX_DRAIN_INTERVAL_SECONDS,
+    STATS_RECONCILE_INTERVAL_SECONDS,
+)
 from services import tasks
+from services.db import get_db
 
 celery_app = Celery("worker", broker="redis://redis:6379/0", backend="redis://redis:6379/0")
 
 celery_app.autodiscover_tasks(["services.tasks"])
 
+# One queue per task class, each consumed by its own worker pool (see docker-compose.yml), so a
+# backlog of emails or batch jobs never delays the analyses users are waiting for.
+TASK_QUEUES = ("interactive", "email", "batch")
+
+celery_app.conf.task_queues = [Queue(name, routing_key=name) for name in TASK_QUEUES]
+celery_app.conf.task_default_queue = "batch"
+celery_app.conf.task_routes = {
+    "services.tasks.analyze_article": {"queue": "interactive"},
+    "services.tasks.send_welcome_email": {"queue": "email"},
+    "services.tasks.drain_outbox": {"queue": "email"},
+    "services.tasks.analyze_articles_bulk": {"queue": "batch"},
+    "services.tasks.log_articles_count_task": {"queue": "batch"},
+    "services.tasks.reconcile_article_stats": {"queue": "batch"},
+}
+# Redis emulates message priorities with one list per priority step; within a queue, the lists
+# are polled lowest step first. The order in which a worker polls its queues is left to the
+# default round robin, so a worker consuming several queues serves them fairly.
+celery_app.conf.broker_transport_options = {
+    "priority_steps": list(range(10)),
+    "visibility_timeout": CELERY_VISIBILITY_TIMEOUT_SECONDS,
+}
+celery_app.conf.task_default_priority = tasks.DEFAULT_PRIORITY
+# Prefetched messages bypass priorities and sit idle behind long tasks: reserve one at a time.
+celery_app.conf.worker_prefetch_multiplier = CELERY_PREFETCH_MULTIPLIER
+
 celery_app.conf.beat_schedule = {
     "log-articles-count-daily": {
         "task": "services.tasks.log_articles_count_task",
         "schedule": 86400,  # 24 hours = 86400 seconds
     },
+    "reconcile-article-stats": {
+        "task": "services.tasks.reconcile_article_stats",
+        "schedule": STATS_RECONCILE_INTERVAL_SECONDS,
+    },
+    "drain-outbox": {
+        "task": "services.tasks.drain_outbox",
+        "schedule": OUTBOX_DRAIN_INTERVAL_SECONDS,
+    },
 }
 celery_app.conf.timezone = "UTC"
+
+
+@beat_init.connect
+def seed_article_stats(**kwargs):
+    # Until a first full recount, the statistics counters only hold the writes made since they were
+    # deployed: start one right away instead of waiting STATS_RECONCILE_INTERVAL_SECONDS.
+    if not tasks.stats_reconciled(get_db()):
+        tasks.reconcile_article_stats.delay()
@@ -1,6 +1,62 @@
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo.read_preferences import make_read_preference, read_pref_mode_from_name
 
-from config.settings import DB_NAME, DB_URL
+from config.indexes import ensure_indexes
+from config.metrics import mongo_command_metrics, mongo_pool_metrics
+from config.settings import (
+    DB_NAME,
+    DB_URL,
+    ENSURE_INDEXES_ON_STARTUP,
+    MONGO_COMPRESSORS,
+    MONGO_CONNECT_TIMEOUT_MS,
+    MONGO_HEAVY_READ_MAX_STALENESS_SECONDS,
+    MONGO_HEAVY_READ_PREFERENCE,
+    MONGO_MAX_POOL_SIZE,
+    MONGO_MIN_POOL_SIZE,
+    MONGO_RETRY_READS,
+    MONGO_RETRY_WRITES,
+    MONGO_SERVER_SELECTION_TIMEOUT_MS,
+    MONGO_WAIT_QUEUE_TIMEOUT_MS,
+)
+
+# Read preference of heavy reads that tolerate replication lag (article lists and exports).
+# Everything else, writes and authentication included, uses the client default: the primary.
+HEAVY_READ_PREFERENCE = make_read_preference(
+    read_pref_mode_from_name(MONGO_HEAVY_READ_PREFERENCE), None, MONGO_HEAVY_READ_MAX_STALENESS_SECONDS
+)
+
+
+def mongo_client_options(max_pool_size: int = MONGO_MAX_POOL_SIZE, min_pool_size: int = MONGO_MIN_POOL_SIZE) -> dict:
+    """
+    Build the MongoDB client options shared by the API and the Celery workers.
+
+    Timeouts set to 0 are left out, so the value from DB_URL or the driver default applies.
+    Compressors the server or the installed packages do not support are skipped by the driver
+    (zstd needs the 'zstandard' package, snappy 'python-snappy'; zlib is always available).
+
+    Args:
+        max_pool_size (int): Maximum number of connections per server.
+        min_pool_size (int): Number of connections kept open per server.
+
+    Returns:
+        dict: Keyword arguments for MongoClient / AsyncIOMotorClient.
+    """
+    options = {
+        "maxPoolSize": max_pool_size,
+        "minPoolSize": min_pool_size,
+        "retryReads": MONGO_RETRY_READS,
+        "retryWrites": MONGO_RETRY_WRITES,
+        "event_listeners": [mongo_command_metrics, mongo_pool_metrics],
+    }
+    if MONGO_COMPRESSORS:
+        options["compressors"] = MONGO_COMPRESSORS
+    timeouts = {
+        "waitQueueTimeoutMS": MONGO_WAIT_QUEUE_TIMEOUT_MS,
+        "connectTimeoutMS": MONGO_CONNECT_TIMEOUT_MS,
+        "serverSelectionTimeoutMS": MONGO_SERVER_SELECTION_TIMEOUT_MS,
+    }
+    options.update({name: value for name, value in timeouts.items() if value})
+    return options
 
 
 class MongoDBConnector:
@@ -8,8 +64,10 @@ class MongoDBConnector:
         self.app = app
 
     async def startup_db_client(self):
-        self.app.mongodb_client = AsyncIOMotorClient(DB_URL)
+        self.app.mongodb_client = AsyncIOMotorClient(DB_URL, **mongo_client_options())
         self.app.mongodb = self.app.mongodb_client[DB_NAME]
+        if ENSURE_INDEXES_ON_STARTUP:
+            await ensure_indexes(self.app.mongodb)
 
     async def shutdown_db_client(self):
         self.app.mongodb_client.close()
@@ -0,0 +1,232 @@
+"""
+Declarative registry of the MongoDB indexes the application relies on.
+
+Indexes are applied idempotently at startup (see config/db.py) and can be checked or applied
+from the command line:
+
+    python -m config.indexes            # create missing indexes
+    python -m config.indexes --check    # report drift only, exit code 1 if any
+    python -m config.indexes --fix      # also rebuild indexes whose definition changed
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+import time
+
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import ASCENDING, DESCENDING, IndexModel
+from pymongo.errors import OperationFailure
+
+from config.settings import DB_NAME, DB_URL, LOGS_TTL_SECONDS
+from utils.search import ARTICLES_TEXT_INDEX
+
+logger = logging.getLogger(__name__)
+
+INDEXES = {
+    "users": [
+        IndexModel([("email", ASCENDING)], name="users_email_unique", unique=True),
+    ],
+    "articles": [
+        IndexModel([("tags", ASCENDING)], name="articles_tags"),
+        IndexModel([("author", ASCENDING), ("created_at", DESCENDING)], name="articles_author_created_at"),
+        IndexModel([("created_at", DESCENDING), ("_id", DESCENDING)], name="articles_created_at_id"),
+        ARTICLES_TEXT_INDEX,
+    ],
+    "article_stats": [
+        IndexModel([("kind", ASCENDING), ("articles", DESCENDING)], name="article_stats_kind_articles"),
+        IndexModel([("kind", ASCENDING), ("key", DESCENDING)], name="article_stats_kind_key"),
+    ],
+    "outbox": [
+        IndexModel([("status", ASCENDING), ("available_at", ASCENDING)], name="outbox_status_available_at"),
+        IndexModel([("claim", ASCENDING)], name="outbox_claim", sparse=True),
+    ],
+    "logs": [
+        IndexModel([("created_at", ASCENDING)], name="logs_created_at_ttl", expireAfterSeconds=LOGS_TTL_SECONDS),
+    ],
+}
+
+# Options that change index behaviour, with the value MongoDB assumes when the option is absent.
+_COMPARED_OPTIONS = {
+    "unique": False,
+    "sparse": False,
+    "expireAfterSeconds": None,
+    "partialFilterExpression": None,
+    "weights": None,
+    "default_language": None,
+}
+
+PROGRESS_INTERVAL = 5
+
+
+def _index_signature(index: dict) -> tuple:
+    """
+    Build a comparable signature of an index definition or of an existing index.
+
+    Text indexes are stored by MongoDB with an internal key ({'_fts': 'text', '_ftsx': 1}),
+    so they are compared by their weights and language instead of their key.
+    """
+    is_text = "weights" in index
+    if is_text:
+        key = ("text",)
+    else:
+        key = tuple((field, int(direction)) for field, direction in index["key"].items())
+    options = []
+    for option, default in _COMPARED_OPTIONS.items():
+        value = index.get(option, default)
+        if option == "default_language" and is_text:
+            value = value or "english"
+        if option == "weights" and value:
+            value = tuple(sorted((field, int(weight)) for field, weight in value.items()))
+        options.append((option, value))
+    return key, tuple(options)
+
+
+def diff_indexes(declared: list[IndexModel], existing: list[dict]) -> dict:
+    """
+    Compare declared indexes of a collection with the ones that exist in the database.
+
+    Args:
+        declared (list[IndexModel]): Indexes from the registry.
+        existing (list[dict]): Index documents returned by list_indexes().
+
+    Returns:
+        dict: Names of 'missing', 'changed' and 'unexpected' indexes.
+    """
+    existing_by_name = {index["name"]: index for index in existing if index["name"] != "_id_"}
+    declared_by_name = {model.document["name"]: model.document for model in declared}
+    missing, changed = [], []
+    for name, document in declared_by_name.items():
+        if name not in existing_by_name:
+            missing.append(name)
+        elif _index_signature(document) != _index_signature(existing_by_name[name]):
+            changed.append(name)
+    unexpected = [name for name in existing_by_name if name not in declared_by_name]
+    return {"missing": missing, "changed": changed, "unexpected": unexpected}
+
+
+async def index_drift(db) -> dict:
+    """
+    Report drift between the registry and the actual indexes of every registered collection.
+
+    Args:
+        db: Motor database.
+
+    Returns:
+        dict: Collection name mapped to the result of diff_indexes.
+    """
+    drift = {}
+    for collection_name, declared in INDEXES.items():
+        existing = await db[collection_name].list_indexes().to_list(length=None)
+        drift[collection_name] = diff_indexes(declared, existing)
+    return drift
+
+
+async def _report_build_progress(db, collection_name: str):
+    """
+    Periodically log the progress message of running index builds on a collection.
+
+    Requires the inprog privilege; without it progress is simply not reported.
+    """
+    namespace = f"{db.name}.{collection_name}"
+    while True:
+        await asyncio.sleep(PROGRESS_INTERVAL)
+        try:
+            operations = await db.client.admin.aggregate(
+                [{"$currentOp": {}}, {"$match": {"ns": namespace, "command.createIndexes": {"$exists": True}}}]
+            ).to_list(length=None)
+        except OperationFailure:
+            return
+        for operation in operations:
+            if operation.get("msg"):
+                logger.info("Index build on %s: %s", namespace, operation["msg"])
+
+
+async def ensure_indexes(db, fix: bool = False) -> dict:
+    """
+    Create missing indexes from the registry. Safe to run repeatedly.
+
+    Indexes whose definition changed are only rebuilt when 'fix' is set, because dropping an index
+    on a live collection is not something to do implicitly at startup. A TTL change is applied in
+    place with collMod either way.
+
+    Args:
+        db: Motor database.
+        fix (bool): Drop and recreate indexes whose definition differs from the registry.
+
+    Returns:
+        dict: The drift that remains after applying the registry.
+    """
+    drift = await index_drift(db)
+    for collection_name, declared in INDEXES.items():
+        collection = db[collection_name]
+        report = drift[collection_name]
+        for model in declared:
+            document = model.document
+            name = document["name"]
+            if name in report["changed"] and "expireAfterSeconds" in document:
+                await db.command(
+                    "collMod",
+                    collection_name,
+                    index={"name": name, "expireAfterSeconds": document["expireAfterSeconds"]},
+                )
+                logger.info("Updated TTL of index %s on %s", name, collection_name)
+                report["changed"].remove(name)
+            elif name in report["changed"] and fix:
+                await collection.drop_index(name)
+                report["changed"].remove(name)
+                report["missing"].append(name)
+        to_build = [model for model in declared if model.document["name"] in report["missing"]]
+        for position, model in enumerate(to_build, start=1):
+            name = model.document["name"]
+            logger.info("Building index %s on %s (%d/%d)", name, collection_name, position, len(to_build))
+            started = time.perf_counter()
+            progress = asyncio.create_task(_report_build_progress(db, collection_name))
+            try:
+                await collection.create_indexes([model])
+            except OperationFailure as error:
+                logger.error("Failed to build index %s on %s: %s", name, collection_name, error)
+                continue
+            finally:
+                progress.cancel()
+            report["missing"].remove(name)
+            logger.info("Built index %s on %s in %.2fs", name, collection_name, time.perf_counter() - started)
+        for name in report["changed"]:
+            logger.warning("Index %s on %s differs from the registry", name, collection_name)
+        for name in report["unexpected"]:
+            logger.warning("Index %s on %s is not declared in the registry", name, collection_name)
+    return drift
+
+
+def has_drift(drift: dict) -> bool:
+    return any(names for report in drift.values() for names in report.values())
+
+
+async def _run(check: bool, fix: bool) -> int:
+    client = AsyncIOMotorClient(DB_URL)
+    try:
+        db = client[DB_NAME]
+        drift = await index_drift(db) if check else await ensure_indexes(db, fix=fix)
+    finally:
+        client.close()
+    for collection_name, report in drift.items():
+        for kind, names in report.items():
+            for name in names:
+                print(f"{collection_name}: {kind} index {name}")
+    if not has_drift(drift):
+        print("Indexes match the registry")
+    return int(check and has_drift(drift))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Apply or check the MongoDB index registry.")
+    parser.add_argument("--check", action="store_true", help="only report drift, exit with code 1 if any")
+    parser.add_argument("--fix", action="store_true", help="rebuild indexes whose definition changed")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    sys.exit(asyncio.run(_run(args.check, args.fix)))
+
+
+if __name__ == "__main__":
+    main()
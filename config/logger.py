@@ -1,16 +1,134 @@
+import atexit
+import json
 import logging
+import os
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
+from config.settings import LOG_BACKUP_COUNT, LOG_FLUSH_EVERY, LOG_FLUSH_INTERVAL_SECONDS, LOG_FORMAT, LOG_MAX_BYTES
 
-def get_logger(log_file: str):
+TEXT_FORMAT = "%(asctime)s %(levelname)s %(message)s"
+
+_listeners: dict[str, QueueListener] = {}
+_lock = threading.Lock()
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    Format log records as one JSON object per line.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "time": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(payload, ensure_ascii=False)
+
+
+class BatchingRotatingFileHandler(RotatingFileHandler):
+    """
+    Size-rotated file handler that flushes to disk in batches instead of after every record.
+
+    The stream is flushed every 'flush_every' records; the queue listener also calls force_flush
+    whenever the queue runs dry, so a quiet log never keeps lines buffered for long.
+    """
+
+    def __init__(self, filename: str, max_bytes: int, backup_count: int, flush_every: int):
+        super().__init__(filename, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8")
+        self.flush_every = flush_every
+        self._unflushed = 0
+
+    def flush(self):
+        # StreamHandler.emit() calls flush() after each record: only count it here.
+        self._unflushed += 1
+        if self._unflushed >= self.flush_every:
+            self.force_flush()
+
+    def force_flush(self):
+        if self._unflushed:
+            super().flush()
+            self._unflushed = 0
+
+
+class BatchingQueueListener(QueueListener):
+    """
+    Queue listener that flushes its batching handlers whenever no record arrives for 'flush_interval' seconds.
+    """
+
+    def __init__(self, log_queue, *handlers, flush_interval: float):
+        super().__init__(log_queue, *handlers, respect_handler_level=True)
+        self.flush_interval = flush_interval
+
+    def dequeue(self, block):
+        while True:
+            try:
+                return self.queue.get(block, timeout=self.flush_interval)
+            except queue.Empty:
+                for handler in self.handlers:
+                    if isinstance(handler, BatchingRotatingFileHandler):
+                        handler.force_flush()
+
+
+def get_logger(log_file: str, json_format: bool | None = None):
+    """
+    Return the logger writing to a log file, configuring it on first use only.
+
+    Records are put on an in-memory queue and written to the file by a background listener
+    thread, so callers never block on disk I/O. The file is rotated by size.
+
+    Args:
+        log_file (str): Path of the log file; also used as the logger name.
+        json_format (bool, optional): Write JSON lines instead of text. Defaults to LOG_FORMAT == "json".
+
+    Returns:
+        logging.Logger: The configured logger.
+    """
     logger = logging.getLogger(log_file)
-    logger.setLevel(logging.INFO)
-    handler = logging.FileHandler(log_file, encoding="utf-8")
-    formatter = logging.Formatter("%(asctime)s %(levelname)s %(message)s")
-    handler.setFormatter(formatter)
-    logger.addHandler(handler)
+    if log_file in _listeners:
+        return logger
+    with _lock:
+        if log_file in _listeners:
+            return logger
+        if json_format is None:
+            json_format = LOG_FORMAT == "json"
+        os.makedirs(os.path.dirname(os.path.abspath(log_file)), exist_ok=True)
+        handler = BatchingRotatingFileHandler(log_file, LOG_MAX_BYTES, LOG_BACKUP_COUNT, LOG_FLUSH_EVERY)
+        handler.setFormatter(JsonFormatter() if json_format else logging.Formatter(TEXT_FORMAT))
+        log_queue = queue.SimpleQueue()
+        listener = BatchingQueueListener(log_queue, handler, flush_interval=LOG_FLUSH_INTERVAL_SECONDS)
+        listener.start()
+        logger.setLevel(logging.INFO)
+        logger.addHandler(QueueHandler(log_queue))
+        logger.propagate = False
+        _listeners[log_file] = listener
     return logger
 
 
 def write_log(log_line, log_file="logs/general_logs.log"):
     logger = get_logger(log_file)
     logger.info(log_line)
+
+
+def shutdown_logging():
+    """
+    Stop all queue listeners, writing out every queued record and closing the log files.
+    """
+    with _lock:
+        while _listeners:
+            log_file, listener = _listeners.popitem()
+            listener.stop()
+            for handler in listener.handlers:
+                handler.close()
+            logger = logging.getLogger(log_file)
+            for handler in list(logger.handlers):
+                if isinstance(handler, QueueHandler):
+                    logger.removeHandler(handler)
+
+
+atexit.register(shutdown_logging)
@@ -0,0 +1,269 @@
+import os
+import time
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+from pymongo import monitoring
+
+FAST_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template.",
+    ["method", "route", "status"],
+)
+REQUESTS_IN_FLIGHT = Gauge(
+    "http_requests_in_flight",
+    "HTTP requests currently being served.",
+    ["method"],
+    multiprocess_mode="livesum",
+)
+MONGO_COMMAND_DURATION = Histogram(
+    "mongodb_command_duration_seconds",
+    "MongoDB command round-trip time by collection and command.",
+    ["collection", "command", "outcome"],
+    buckets=FAST_BUCKETS,
+)
+PASSWORD_HASH_DURATION = Histogram(
+    "password_hash_duration_seconds",
+    "Time spent hashing or verifying a password on the hashing pool, queue wait included.",
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+MONGO_POOL_WAIT = Histogram(
+    "mongodb_pool_wait_seconds",
+    "Time spent waiting to check a connection out of the MongoDB connection pool.",
+    ["outcome"],
+    buckets=FAST_BUCKETS,
+)
+MONGO_POOL_CHECKED_OUT = Gauge(
+    "mongodb_pool_checked_out_connections",
+    "MongoDB connections currently checked out of the pool.",
+    multiprocess_mode="livesum",
+)
+MONGO_POOL_CONNECTIONS = Gauge(
+    "mongodb_pool_connections",
+    "Open MongoDB connections, in use or idle.",
+    multiprocess_mode="livesum",
+)
+ARTICLE_CHANGES = Counter(
+    "article_change_events",
+    "Article change stream events received, by operation.",
+    ["operation"],
+)
+ARTICLE_FEED_SUBSCRIBERS = Gauge(
+    "article_feed_subscribers",
+    "Clients currently subscribed to the live article feed.",
+    multiprocess_mode="livesum",
+)
+ARTICLE_FEED_OVERFLOWS = Counter(
+    "article_feed_overflows",
+    "Live article feed subscribers dropped because their buffer was full.",
+)
+CELERY_TASK_DURATION = Histogram(
+    "celery_task_duration_seconds",
+    "Celery task run time.",
+    ["task", "state"],
+)
+CELERY_QUEUE_WAIT = Histogram(
+    "celery_task_queue_wait_seconds",
+    "Time between publishing a Celery task and a worker starting it.",
+    ["task"],
+)
+
+
+class MetricsMiddleware:
+    """
+    Pure ASGI middleware recording request latency per route template and in-flight requests.
+
+    Latency is labelled with the route path template (e.g. '/api/v1/articles/{article_id}/'), never
+    the raw path, to keep label cardinality bounded. Being a plain ASGI callable, it adds no task or
+    body buffering of its own, unlike a BaseHTTPMiddleware.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        method = scope["method"]
+        status_code = 500
+
+        async def send_with_status(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        in_flight = REQUESTS_IN_FLIGHT.labels(method)
+        in_flight.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            in_flight.dec()
+            # The router stores the matched route in the scope it was given.
+            route = getattr(scope.get("route"), "path", "<unmatched>")
+            REQUEST_LATENCY.labels(method, route, str(status_code)).observe(time.perf_counter() - started)
+
+
+class MongoCommandMetrics(monitoring.CommandListener):
+    """
+    pymongo command listener timing every command by collection and command name.
+
+    Pass an instance in 'event_listeners' when creating a client. The duration is the one measured
+    by the driver, so the listener only does a dict insert and pop per command.
+    """
+
+    def __init__(self):
+        self._collections = {}
+
+    def started(self, event):
+        command = event.command
+        collection = command.get("collection") if event.command_name == "getMore" else command.get(event.command_name)
+        self._collections[(event.connection_id, event.request_id)] = collection if isinstance(collection, str) else ""
+
+    def succeeded(self, event):
+        self._observe(event, "success")
+
+    def failed(self, event):
+        self._observe(event, "failure")
+
+    def _observe(self, event, outcome: str):
+        collection = self._collections.pop((event.connection_id, event.request_id), "")
+        MONGO_COMMAND_DURATION.labels(collection, event.command_name, outcome).observe(event.duration_micros / 1e6)
+
+
+mongo_command_metrics = MongoCommandMetrics()
+
+
+class MongoPoolMetrics(monitoring.ConnectionPoolListener):
+    """
+    pymongo connection pool listener reporting how long operations wait for a pooled connection.
+
+    A growing wait time means the pool (MONGO_MAX_POOL_SIZE) is too small for the load, or that
+    connections are held too long.
+    """
+
+    def connection_check_out_started(self, event):
+        pass
+
+    def connection_checked_out(self, event):
+        MONGO_POOL_WAIT.labels("success").observe(event.duration or 0.0)
+        MONGO_POOL_CHECKED_OUT.inc()
+
+    def connection_check_out_failed(self, event):
+        MONGO_POOL_WAIT.labels(event.reason).observe(event.duration or 0.0)
+
+    def connection_checked_in(self, event):
+        MONGO_POOL_CHECKED_OUT.dec()
+
+    def connection_created(self, event):
+        MONGO_POOL_CONNECTIONS.inc()
+
+    def connection_ready(self, event):
+        pass
+
+    def connection_closed(self, event):
+        MONGO_POOL_CONNECTIONS.dec()
+
+    def pool_created(self, event):
+        pass
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        pass
+
+    def pool_closed(self, event):
+        pass
+
+
+mongo_pool_metrics = MongoPoolMetrics()
+
+
+class StatsCollector:
+    """
+    Collector exporting the in-process cache and hashing pool counters at scrape time.
+
+    The stats are only read when /metrics is scraped, so the request path pays nothing. Hit ratios
+    are derived from the hits and misses counters in queries.
+
+    Attributes:
+        response_cache_stats: Callable returning ResponseCache.stats().
+        auth_cache_stats: Callable returning utils.auth.auth_cache_stats().
+        hashing_stats: Callable returning HashingPool.stats().
+    """
+
+    def __init__(self, response_cache_stats, auth_cache_stats, hashing_stats):
+        self.response_cache_stats = response_cache_stats
+        self.auth_cache_stats = auth_cache_stats
+        self.hashing_stats = hashing_stats
+
+    def collect(self):
+        hits = CounterMetricFamily("cache_hits", "Cache hits.", labels=["cache"])
+        misses = CounterMetricFamily("cache_misses", "Cache misses.", labels=["cache"])
+        entries = GaugeMetricFamily("cache_entries", "Entries held by in-process caches.", labels=["cache"])
+        response_stats = self.response_cache_stats()
+        caches = {f"response_l1_{route}": stats for route, stats in response_stats["l1"].items()}
+        caches.update({f"auth_{name}": stats for name, stats in self.auth_cache_stats().items()})
+        for name, stats in caches.items():
+            hits.add_metric([name], stats["hits"])
+            misses.add_metric([name], stats["misses"])
+            entries.add_metric([name], stats["size"])
+        hits.add_metric(["response_l2"], response_stats["l2"]["hits"])
+        misses.add_metric(["response_l2"], response_stats["l2"]["misses"])
+        yield from (hits, misses, entries)
+
+        hashing = self.hashing_stats()
+        yield GaugeMetricFamily("hashing_pool_in_flight", "Password hashes running.", value=hashing["in_flight"])
+        yield GaugeMetricFamily(
+            "hashing_pool_queue_depth", "Password hashes waiting for a worker.", value=hashing["queue_depth"]
+        )
+        yield CounterMetricFamily(
+            "hashing_pool_rejected", "Password hashes rejected with 503.", value=hashing["rejected"]
+        )
+
+
+def build_registry(*collectors) -> CollectorRegistry:
+    """
+    Build the registry exposed on /metrics; call once per process.
+
+    With PROMETHEUS_MULTIPROC_DIR set (several server or worker processes), the metric values are
+    read from the shared directory at scrape time; 'collectors' then report live values of the
+    scraped process only.
+
+    Args:
+        *collectors: Extra collectors, e.g. a StatsCollector.
+
+    Returns:
+        CollectorRegistry: The default registry, or a multiprocess one.
+    """
+    registry = REGISTRY
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    for collector in collectors:
+        registry.register(collector)
+    return registry
+
+
+def render_metrics(registry: CollectorRegistry) -> tuple[bytes, str]:
+    """
+    Render a registry in the Prometheus text format.
+
+    Returns:
+        tuple[bytes, str]: The payload and its content type.
+    """
+    return generate_latest(registry), CONTENT_TYPE_LATEST
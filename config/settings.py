@@ -10,3 +10,95 @@ ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES"))
 DB_URL = os.getenv("DB_URL")
 DB_NAME = os.getenv("DB_NAME")
 LOGS_DIR = os.path.join(os.getcwd(), "logs")
+
+ARTICLES_PAGE_SIZE = int(os.getenv("ARTICLES_PAGE_SIZE", 20))
+ARTICLES_MAX_PAGE_SIZE = int(os.getenv("ARTICLES_MAX_PAGE_SIZE", 100))
+EXPORT_BATCH_SIZE = int(os.getenv("EXPORT_BATCH_SIZE", 500))
+EXPORT_MAX_BATCH_SIZE = int(os.getenv("EXPORT_MAX_BATCH_SIZE", 5000))
+BULK_MAX_OPERATIONS = int(os.getenv("BULK_MAX_OPERATIONS", 1000))
+ARTICLE_EXCERPT_LENGTH = int(os.getenv("ARTICLE_EXCERPT_LENGTH", 200))
+
+LOGS_TTL_SECONDS = int(os.getenv("LOGS_TTL_SECONDS", 30 * 24 * 60 * 60))
+ENSURE_INDEXES_ON_STARTUP = os.getenv("ENSURE_INDEXES_ON_STARTUP", "true").lower() == "true"
+
+AUTH_CACHE_TTL_SECONDS = int(os.getenv("AUTH_CACHE_TTL_SECONDS", 60))
+AUTH_CACHE_MAX_SIZE = int(os.getenv("AUTH_CACHE_MAX_SIZE", 10000))
+
+HASH_POOL_KIND = os.getenv("HASH_POOL_KIND", "thread")
+HASH_POOL_WORKERS = int(os.getenv("HASH_POOL_WORKERS", min(4, os.cpu_count() or 1)))
+HASH_POOL_MAX_QUEUE = int(os.getenv("HASH_POOL_MAX_QUEUE", 64))
+
+JOB_WAIT_MAX_SECONDS = float(os.getenv("JOB_WAIT_MAX_SECONDS", 30))
+JOB_STREAM_TIMEOUT_SECONDS = float(os.getenv("JOB_STREAM_TIMEOUT_SECONDS", 120))
+JOB_POLL_INTERVAL_SECONDS = float(os.getenv("JOB_POLL_INTERVAL_SECONDS", 0.5))
+
+MONGO_MAX_POOL_SIZE = int(os.getenv("MONGO_MAX_POOL_SIZE", 100))
+MONGO_MIN_POOL_SIZE = int(os.getenv("MONGO_MIN_POOL_SIZE", 0))
+# Timeouts left at 0 are not passed to the client: the value from DB_URL or the driver default applies.
+MONGO_WAIT_QUEUE_TIMEOUT_MS = int(os.getenv("MONGO_WAIT_QUEUE_TIMEOUT_MS", 0))
+MONGO_CONNECT_TIMEOUT_MS = int(os.getenv("MONGO_CONNECT_TIMEOUT_MS", 0))
+MONGO_SERVER_SELECTION_TIMEOUT_MS = int(os.getenv("MONGO_SERVER_SELECTION_TIMEOUT_MS", 0))
+MONGO_COMPRESSORS = os.getenv("MONGO_COMPRESSORS", "")
+MONGO_RETRY_READS = os.getenv("MONGO_RETRY_READS", "true").lower() == "true"
+MONGO_RETRY_WRITES = os.getenv("MONGO_RETRY_WRITES", "true").lower() == "true"
+MONGO_HEAVY_READ_PREFERENCE = os.getenv("MONGO_HEAVY_READ_PREFERENCE", "secondaryPreferred")
+MONGO_HEAVY_READ_MAX_STALENESS_SECONDS = int(os.getenv("MONGO_HEAVY_READ_MAX_STALENESS_SECONDS", -1))
+
+CELERY_MONGO_MAX_POOL_SIZE = int(os.getenv("CELERY_MONGO_MAX_POOL_SIZE", 10))
+CELERY_MONGO_MIN_POOL_SIZE = int(os.getenv("CELERY_MONGO_MIN_POOL_SIZE", 0))
+CELERY_PREFETCH_MULTIPLIER = int(os.getenv("CELERY_PREFETCH_MULTIPLIER", 1))
+# Tasks acknowledged late are redelivered when not acknowledged within this delay, so it must
+# exceed the run time (queue wait included) of the longest task, e.g. a full bulk analysis.
+CELERY_VISIBILITY_TIMEOUT_SECONDS = int(os.getenv("CELERY_VISIBILITY_TIMEOUT_SECONDS", 6 * 60 * 60))
+
+ADMIN_EMAILS = {email.strip() for email in os.getenv("ADMIN_EMAILS", "").split(",") if email.strip()}
+ANALYSIS_BATCH_SIZE = int(os.getenv("ANALYSIS_BATCH_SIZE", 500))
+STATS_RECONCILE_INTERVAL_SECONDS = int(os.getenv("STATS_RECONCILE_INTERVAL_SECONDS", 86400))
+
+OUTBOX_TRANSACTIONS_ENABLED = os.getenv("OUTBOX_TRANSACTIONS_ENABLED", "true").lower() == "true"
+OUTBOX_DRAIN_INTERVAL_SECONDS = float(os.getenv("OUTBOX_DRAIN_INTERVAL_SECONDS", 10))
+OUTBOX_BATCH_SIZE = int(os.getenv("OUTBOX_BATCH_SIZE", 100))
+OUTBOX_MAX_BATCHES = int(os.getenv("OUTBOX_MAX_BATCHES", 10))
+OUTBOX_CLAIM_TIMEOUT_SECONDS = int(os.getenv("OUTBOX_CLAIM_TIMEOUT_SECONDS", 300))
+OUTBOX_MAX_ATTEMPTS = int(os.getenv("OUTBOX_MAX_ATTEMPTS", 5))
+OUTBOX_RETRY_SECONDS = int(os.getenv("OUTBOX_RETRY_SECONDS", 60))
+
+EMAIL_SENDER = os.getenv("EMAIL_SENDER", "log")
+EMAIL_FROM = os.getenv("EMAIL_FROM", "ArticleHub <no-reply@articlehub.local>")
+EMAIL_SMTP_HOST = os.getenv("EMAIL_SMTP_HOST", "localhost")
+EMAIL_SMTP_PORT = int(os.getenv("EMAIL_SMTP_PORT", 25))
+EMAIL_SMTP_USERNAME = os.getenv("EMAIL_SMTP_USERNAME", "")
+EMAIL_SMTP_PASSWORD = os.getenv("EMAIL_SMTP_PASSWORD", "")
+EMAIL_SMTP_STARTTLS = os.getenv("EMAIL_SMTP_STARTTLS", "false").lower() == "true"
+EMAIL_SMTP_TIMEOUT_SECONDS = float(os.getenv("EMAIL_SMTP_TIMEOUT_SECONDS", 10))
+
+LOG_FORMAT = os.getenv("LOG_FORMAT", "text")
+LOG_MAX_BYTES = int(os.getenv("LOG_MAX_BYTES", 10 * 1024 * 1024))
+LOG_BACKUP_COUNT = int(os.getenv("LOG_BACKUP_COUNT", 5))
+LOG_FLUSH_EVERY = int(os.getenv("LOG_FLUSH_EVERY", 100))
+LOG_FLUSH_INTERVAL_SECONDS = float(os.getenv("LOG_FLUSH_INTERVAL_SECONDS", 1))
+
+CACHE_ENABLED = os.getenv("CACHE_ENABLED", "true").lower() == "true"
+CACHE_REDIS_URL = os.getenv("CACHE_REDIS_URL", "redis://redis:6379/1")
+CACHE_REDIS_RETRY_SECONDS = float(os.getenv("CACHE_REDIS_RETRY_SECONDS", 30))
+CACHE_L1_MAX_SIZE = int(os.getenv("CACHE_L1_MAX_SIZE", 1000))
+CACHE_L1_TTL_SECONDS = float(os.getenv("CACHE_L1_TTL_SECONDS", 5))
+CACHE_TTL_ARTICLE_SECONDS = int(os.getenv("CACHE_TTL_ARTICLE_SECONDS", 300))
+CACHE_TTL_ARTICLE_LIST_SECONDS = int(os.getenv("CACHE_TTL_ARTICLE_LIST_SECONDS", 60))
+TAG_INDEX_TTL_SECONDS = float(os.getenv("TAG_INDEX_TTL_SECONDS", 30))
+
+CHANGE_STREAM_ENABLED = os.getenv("CHANGE_STREAM_ENABLED", "true").lower() == "true"
+CHANGE_STREAM_RETRY_SECONDS = float(os.getenv("CHANGE_STREAM_RETRY_SECONDS", 5))
+CHANGE_STREAM_TOKEN_SAVE_SECONDS = float(os.getenv("CHANGE_STREAM_TOKEN_SAVE_SECONDS", 1))
+ARTICLE_FEED_BUFFER_SIZE = int(os.getenv("ARTICLE_FEED_BUFFER_SIZE", 100))
+ARTICLE_FEED_TIMEOUT_SECONDS = float(os.getenv("ARTICLE_FEED_TIMEOUT_SECONDS", 300))
+
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() == "true"
+CELERY_METRICS_PORT = int(os.getenv("CELERY_METRICS_PORT", 0))
+
+WEB_BIND = os.getenv("WEB_BIND", "0.0.0.0:8000")
+WEB_WORKERS = int(os.getenv("WEB_WORKERS", 0))
+WEB_TIMEOUT_SECONDS = int(os.getenv("WEB_TIMEOUT_SECONDS", 60))
+WEB_GRACEFUL_TIMEOUT_SECONDS = int(os.getenv("WEB_GRACEFUL_TIMEOUT_SECONDS", 30))
+WEB_KEEPALIVE_SECONDS = int(os.getenv("WEB_KEEPALIVE_SECONDS", 5))
+WEB_MAX_REQUESTS = int(os.getenv("WEB_MAX_REQUESTS", 0))
@@ -0,0 +1,82 @@
+"""
+Gunicorn configuration for running the API in production: `gunicorn main:app`.
+
+Gunicorn supervises WEB_WORKERS uvicorn worker processes (one per available CPU by default), each
+with its own event loop on uvloop and httptools. The application is imported once in the master
+and forked into the workers (preload_app), so workers start fast and share the imported code
+copy-on-write. Nothing that must not cross a fork is created at import: the MongoDB client is
+opened by MongoDBConnector on each worker's startup, and the Redis client, hashing pool executor
+and log listener threads are all created on first use.
+
+Signals: HUP starts fresh workers and retires the old ones gracefully, TERM drains in-flight
+requests for up to WEB_GRACEFUL_TIMEOUT_SECONDS, TTIN/TTOU add or remove a worker. Since the
+application and its settings are preloaded, HUP forks the new workers from the master with the code
+and configuration it started with: it recycles workers but does not pick up a deploy or a changed
+environment, which need a restart of the master.
+"""
+
+import glob
+import os
+import tempfile
+
+from uvicorn_worker import UvicornWorker
+
+from config.settings import (
+    METRICS_ENABLED,
+    WEB_BIND,
+    WEB_GRACEFUL_TIMEOUT_SECONDS,
+    WEB_KEEPALIVE_SECONDS,
+    WEB_MAX_REQUESTS,
+    WEB_TIMEOUT_SECONDS,
+    WEB_WORKERS,
+)
+
+# Metrics of all workers are aggregated through files in this directory. It must be set before
+# prometheus_client is imported, i.e. before the application is preloaded.
+if METRICS_ENABLED:
+    os.environ.setdefault("PROMETHEUS_MULTIPROC_DIR", os.path.join(tempfile.gettempdir(), "articlehub-metrics"))
+    os.makedirs(os.environ["PROMETHEUS_MULTIPROC_DIR"], exist_ok=True)
+
+
+class ProductionUvicornWorker(UvicornWorker):
+    """
+    Uvicorn worker pinned to uvloop and httptools, failing at startup if either is missing.
+    """
+
+    CONFIG_KWARGS = {"loop": "uvloop", "http": "httptools", "lifespan": "on"}
+
+
+def default_workers() -> int:
+    """
+    Return the number of CPUs this process may run on (which honours CPU pinning of the container).
+    """
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+bind = WEB_BIND
+workers = WEB_WORKERS or default_workers()
+worker_class = ProductionUvicornWorker
+preload_app = True
+timeout = WEB_TIMEOUT_SECONDS
+graceful_timeout = WEB_GRACEFUL_TIMEOUT_SECONDS
+keepalive = WEB_KEEPALIVE_SECONDS
+max_requests = WEB_MAX_REQUESTS
+max_requests_jitter = WEB_MAX_REQUESTS // 10
+
+
+def on_starting(server):
+    multiproc_dir = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+    if multiproc_dir:
+        # Values left over by a previous run would be added to the new ones.
+        for path in glob.glob(os.path.join(multiproc_dir, "*.db")):
+            os.remove(path)
+
+
+def child_exit(server, worker):
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        from prometheus_client import multiprocess
+
+        multiprocess.mark_process_dead(worker.pid)
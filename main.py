@@ -4,20 +4,48 @@ from fastapi import FastAPI
 from fastapi.responses import HTMLResponse
 
 from config.db import MongoDBConnector
-from config.settings import LOGS_DIR
+from config.logger import shutdown_logging
+from config.metrics import MetricsMiddleware
+from config.settings import (
+    CHANGE_STREAM_ENABLED,
+    CHANGE_STREAM_RETRY_SECONDS,
+    CHANGE_STREAM_TOKEN_SAVE_SECONDS,
+    LOGS_DIR,
+    METRICS_ENABLED,
+)
 from routers.articles import router as articles_router
 from routers.auth import router as auth_router
+from routers.metrics import router as metrics_router
+from services.changes import ChangeStreamWatcher, article_feed
+from utils.auth import hashing_pool
+from utils.response_cache import article_cache
 
 os.makedirs(LOGS_DIR, exist_ok=True)
 
 app = FastAPI()
 app.include_router(auth_router)
 app.include_router(articles_router)
+if METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+    app.include_router(metrics_router)
 
 db_connector = MongoDBConnector(app)
+change_watcher = ChangeStreamWatcher(
+    app,
+    article_feed,
+    article_cache,
+    retry_seconds=CHANGE_STREAM_RETRY_SECONDS,
+    token_save_seconds=CHANGE_STREAM_TOKEN_SAVE_SECONDS,
+    enabled=CHANGE_STREAM_ENABLED,
+)
 
 app.add_event_handler("startup", db_connector.startup_db_client)
+app.add_event_handler("startup", change_watcher.start)
+app.add_event_handler("shutdown", change_watcher.stop)
 app.add_event_handler("shutdown", db_connector.shutdown_db_client)
+app.add_event_handler("shutdown", hashing_pool.shutdown)
+app.add_event_handler("shutdown", shutdown_logging)
+app.add_event_handler("shutdown", article_cache.close)
 
 
 @app.get("/", response_class=HTMLResponse, include_in_schema=False)
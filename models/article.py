@@ -1,6 +1,8 @@
-from typing import List, Optional
+from typing import List, Literal, Optional
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+
+from config.settings import BULK_MAX_OPERATIONS
 
 
 class Article(BaseModel):
@@ -14,6 +16,8 @@ class Article(BaseModel):
         tags (Optional[list[str]]): List of tags associated with the article.
         author (Optional[str]): ID of the user who authored the article.
         created_at (Optional[str]): ISO-formatted creation timestamp.
+        score (Optional[float]): Full-text relevance score, set only on search results.
+        version (int): Incremented on every update; articles created before versioning are at 0.
     """
 
     id: str
@@ -22,6 +26,33 @@ class Article(BaseModel):
     tags: Optional[list[str]] = []
     author: Optional[str] = None  # foreign key (user id)
     created_at: Optional[str] = None
+    score: Optional[float] = None
+    version: int = 0
+
+
+class ArticleSummary(BaseModel):
+    """
+    Model representing the summary of an article returned by default in article lists.
+
+    Attributes:
+        id (str): Unique identifier of the article.
+        title (str): Title of the article.
+        excerpt (str): The first ARTICLE_EXCERPT_LENGTH characters of the content.
+        tags (Optional[list[str]]): List of tags associated with the article.
+        author (Optional[str]): ID of the user who authored the article.
+        created_at (Optional[str]): ISO-formatted creation timestamp.
+        score (Optional[float]): Full-text relevance score, set only on search results.
+        version (int): Incremented on every update; articles created before versioning are at 0.
+    """
+
+    id: str
+    title: str
+    excerpt: str
+    tags: Optional[list[str]] = []
+    author: Optional[str] = None
+    created_at: Optional[str] = None
+    score: Optional[float] = None
+    version: int = 0
 
 
 class ArticleCreate(BaseModel):
@@ -58,3 +89,165 @@ class ArticleCreate(BaseModel):
     @field_validator("title")
     def capitalize_title(cls, title):
         return title.capitalize()
+
+
+class ArticlePage(BaseModel):
+    """
+    Model representing a single page of articles returned by keyset pagination.
+
+    Items are article summaries unless other fields are requested with the 'fields' parameter.
+
+    Attributes:
+        items (list[ArticleSummary]): Articles on this page, newest first.
+        next_cursor (Optional[str]): Opaque token to request the next page, or None on the last page.
+    """
+
+    items: list[ArticleSummary]
+    next_cursor: Optional[str] = None
+
+
+class TagCount(BaseModel):
+    """
+    Model representing a tag and the number of articles carrying it.
+
+    Attributes:
+        tag (str): The tag.
+        count (int): Number of articles with the tag.
+    """
+
+    tag: str
+    count: int
+
+
+class TagList(BaseModel):
+    """
+    Model representing tag counts or suggestions, most used tags first.
+
+    Attributes:
+        items (list[TagCount]): The tags with their article counts.
+    """
+
+    items: list[TagCount]
+
+
+class StatsTotal(BaseModel):
+    """
+    Model representing the collection-wide article counters.
+
+    Attributes:
+        articles (int): Number of articles.
+        words (int): Total word count of their content.
+        analyzed (int): Number of articles that have been analyzed.
+    """
+
+    articles: int = 0
+    words: int = 0
+    analyzed: int = 0
+
+
+class StatsEntry(BaseModel):
+    """
+    Model representing the article counters of one tag, author or creation day.
+
+    Attributes:
+        key (str): The tag, the author ID or the day (YYYY-MM-DD).
+        articles (int): Number of articles.
+        words (int): Total word count of their content.
+    """
+
+    key: str
+    articles: int = 0
+    words: int = 0
+
+
+class ArticleStats(BaseModel):
+    """
+    Model representing the precomputed article statistics.
+
+    Attributes:
+        total (StatsTotal): Counters over all articles.
+        tags (list[StatsEntry]): Most used tags, by number of articles.
+        authors (list[StatsEntry]): Most prolific authors, by number of articles.
+        days (list[StatsEntry]): Latest creation days, newest first.
+    """
+
+    total: StatsTotal
+    tags: list[StatsEntry]
+    authors: list[StatsEntry]
+    days: list[StatsEntry]
+
+
+class BulkOperation(BaseModel):
+    """
+    Model representing one operation of a bulk request.
+
+    Attributes:
+        op (str): "create", "update" or "delete".
+        id (Optional[str]): ID of the article to update or delete; must be omitted for "create".
+        article (Optional[ArticleCreate]): Article data for "create" and "update".
+    """
+
+    op: Literal["create", "update", "delete"]
+    id: Optional[str] = None
+    article: Optional[ArticleCreate] = None
+
+    @model_validator(mode="after")
+    def check_fields(self):
+        if self.op == "create" and self.id is not None:
+            raise ValueError("'id' must be omitted for create operations")
+        if self.op != "create" and self.id is None:
+            raise ValueError(f"'id' is required for {self.op} operations")
+        if self.op != "delete" and self.article is None:
+            raise ValueError(f"'article' is required for {self.op} operations")
+        return self
+
+
+class BulkRequest(BaseModel):
+    """
+    Model for validating bulk article requests.
+
+    Attributes:
+        operations (list[BulkOperation]): Operations to run, applied in no particular order; at most
+            BULK_MAX_OPERATIONS, checked while the list is validated so an oversized request fails
+            before its operations are.
+
+    Example:
+        {
+            "operations": [
+                {"op": "create", "article": {"title": "New", "content": "Body", "tags": ["fastapi"]}},
+                {"op": "update", "id": "64b7f0c2a1b2c3d4e5f60718", "article": {"title": "Edited", "content": "Body"}},
+                {"op": "delete", "id": "64b7f0c2a1b2c3d4e5f60719"}
+            ]
+        }
+    """
+
+    operations: list[BulkOperation] = Field(..., min_length=1, max_length=BULK_MAX_OPERATIONS)
+
+
+class BulkItemResult(BaseModel):
+    """
+    Model representing the outcome of one bulk operation.
+
+    Attributes:
+        index (int): Position of the operation in the request.
+        op (str): The operation.
+        id (Optional[str]): ID of the affected article; the new ID for "create".
+        status (int): HTTP status code the equivalent single-article request would have returned.
+        error (Optional[str]): Error message for failed operations.
+        job_id (Optional[str]): ID of the analysis job started for a created article.
+    """
+
+    index: int
+    op: str
+    id: Optional[str] = None
+    status: int
+    error: Optional[str] = None
+    job_id: Optional[str] = None
+
+
+class BulkResponse(BaseModel):
+    """
+    Model representing the result of a bulk request, one item per operation in request order.
+    """
+
+    results: list[BulkItemResult]
@@ -0,0 +1,20 @@
+from typing import Any, Optional
+
+from pydantic import BaseModel
+
+
+class Job(BaseModel):
+    """
+    Model representing a background job and its outcome.
+
+    Attributes:
+        job_id (str): Identifier of the job (the Celery task id).
+        status (str): Celery state: PENDING, STARTED, RETRY, SUCCESS, FAILURE or REVOKED.
+        result (Optional[Any]): Result of the job once it succeeded.
+        error (Optional[str]): Error message if the job failed.
+    """
+
+    job_id: str
+    status: str
+    result: Optional[Any] = None
+    error: Optional[str] = None
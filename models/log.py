@@ -6,4 +6,6 @@ from pydantic import BaseModel, Field
 class Log(BaseModel):
     type: str = Field(..., description="Log type ('user', 'article')")
     message: str = Field(..., description="Log message text")
-    created_at: datetime = Field(default=datetime.now(timezone.utc).isoformat(), description="Log creation time")
+    created_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc), description="Log creation time (drives the TTL index)"
+    )
@@ -1,19 +1,100 @@
+import asyncio
 from datetime import datetime, timezone
-from typing import Annotated
+from typing import Annotated, Literal
 
 from bson import ObjectId
-from fastapi import APIRouter, Body, Depends, HTTPException, Query, status
-
-from models.article import Article, ArticleCreate
+from celery import states
+from fastapi import APIRouter, Body, Depends, Header, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from pymongo import ReadPreference, ReturnDocument
+
+from config.settings import (
+    ANALYSIS_BATCH_SIZE,
+    ARTICLE_FEED_TIMEOUT_SECONDS,
+    ARTICLES_MAX_PAGE_SIZE,
+    ARTICLES_PAGE_SIZE,
+    EXPORT_BATCH_SIZE,
+    EXPORT_MAX_BATCH_SIZE,
+    JOB_POLL_INTERVAL_SECONDS,
+    JOB_STREAM_TIMEOUT_SECONDS,
+    JOB_WAIT_MAX_SECONDS,
+)
+from models.article import Article, ArticleCreate, ArticlePage, ArticleStats, BulkRequest, BulkResponse, TagList
 from models.auth import UserInDB
-from services.tasks import analyze_article
-from utils.auth import get_current_active_user
-from utils.get_collections import get_articles_collection
+from models.job import Job
+from services.bulk import enqueue_analysis, run_bulk
+from services.changes import article_feed, feed_events
+from services.jobs import get_job, job_events, wait_for_job
+from services.stats import StatsDelta, count_words, read_stats, record_stats
+from services.tags import tag_index
+from services.tasks import analyze_article, analyze_articles_bulk
+from utils.auth import get_current_active_user, get_current_admin_user
+from utils.etag import (
+    bump_change_counter,
+    etag_matches,
+    list_etag,
+    make_etag,
+    pack_body,
+    parse_if_match,
+    read_change_counter,
+    unpack_body,
+    version_filter,
+)
+from utils.export import EXPORT_FORMATS, export_chunks
+from utils.get_collections import get_articles_collection, get_articles_read_collection
 from utils.id import change_id_name, check_correct_id
+from utils.pagination import decode_cursor, encode_cursor, keyset_filter
+from utils.response_cache import article_cache, invalidate_articles
+from utils.search import text_search_pipeline
+from utils.serialization import (
+    FULL_FIELDS,
+    SUMMARY_FIELDS,
+    article_projection,
+    dump_json,
+    json_response,
+    not_modified,
+    parse_fields,
+)
 
 router = APIRouter(prefix="/api/v1/articles", tags=["Articles"])
 
 
+def normalize_filters(search: str | None, tags: str | None) -> tuple[str | None, list[str] | None]:
+    """
+    Normalize the 'search' and 'tags' query parameters, so equivalent queries share cache keys.
+
+    Returns:
+        tuple: The lowercased, whitespace-collapsed search string and the sorted, deduplicated tags.
+    """
+    search = " ".join(search.lower().split()) if search else None
+    tag_list = sorted(set(tags.split(","))) if tags else None
+    return search, tag_list
+
+
+def article_filters(tag_list: list[str] | None) -> list[dict]:
+    """
+    Build the MongoDB filters selected by the 'tags' query parameter.
+    """
+    return [{"tags": {"$in": tag_list}}] if tag_list else []
+
+
+async def articles_changed(articles_collection, *article_ids: str, stats: StatsDelta | None = None):
+    """
+    Record a write to the articles collection: bump its change counter, apply its effect on the
+    article statistics and drop cached responses.
+
+    Args:
+        articles_collection: MongoDB collection for articles.
+        *article_ids (str): The IDs of the updated or deleted articles.
+        stats (StatsDelta, optional): The statistics changes caused by the write.
+    """
+    if stats is None:
+        await bump_change_counter(articles_collection)
+    else:
+        await asyncio.gather(bump_change_counter(articles_collection), record_stats(articles_collection, stats))
+    await invalidate_articles(*article_ids)
+
+
 @router.post(
     "/",
     status_code=status.HTTP_201_CREATED,
@@ -42,81 +123,378 @@ async def create_article(
     article_dict = article.model_dump()
     article_dict["created_at"] = datetime.now(timezone.utc).isoformat()
     article_dict["author"] = str(current_user.id)
+    article_dict["version"] = 1
     result = await articles_collection.insert_one(article_dict)
-    article_dict["_id"] = str(result.inserted_id)
-    change_id_name(article_dict)
-    return Article(**article_dict)
+    stats = StatsDelta()
+    stats.add_article(article_dict)
+    await articles_changed(articles_collection, stats=stats)
+    article_dict.pop("_id", None)
+    article_dict["id"] = str(result.inserted_id)
+    article_dict["score"] = None
+    return json_response(dump_json(article_dict), status.HTTP_201_CREATED, etag=make_etag(article_dict["version"]))
+
+
+@router.post("/bulk", status_code=status.HTTP_200_OK, response_model=BulkResponse)
+async def bulk_articles(
+    current_user: Annotated[UserInDB, Depends(get_current_active_user)],
+    bulk: BulkRequest = Body(...),
+    articles_collection=Depends(get_articles_collection),
+):
+    """
+    Create, update and delete many articles in one request.
 
+    Ownership of all updated and deleted articles is checked with one query and the writes are
+    sent as one unordered bulk write. Each operation gets its own result with the status code the
+    equivalent single-article request would have returned, so a failing item does not fail the
+    batch. Analysis of all created articles is started as one Celery group. Requests with more than
+    BULK_MAX_OPERATIONS operations are rejected with 422 by the request model.
 
-@router.get("/", status_code=status.HTTP_200_OK, response_model=list[Article])
+    Args:
+        current_user (UserInDB): The currently authenticated user.
+        bulk (BulkRequest): The operations to apply.
+        articles_collection: MongoDB collection for articles.
+
+    Returns:
+        BulkResponse: Per-operation results, in request order.
+    """
+    results, stats = await run_bulk(articles_collection, bulk.operations, str(current_user.id))
+    succeeded = [result for result in results if result.error is None]
+    if succeeded:
+        updated_ids = (result.id for result in succeeded if result.op != "create")
+        await articles_changed(articles_collection, *updated_ids, stats=stats)
+    await enqueue_analysis(results)
+    return BulkResponse(results=results)
+
+
+@router.get("/", status_code=status.HTTP_200_OK, response_model=ArticlePage)
 async def list_articles(
     current_user: Annotated[UserInDB, Depends(get_current_active_user)],
-    search: str = Query(None),
+    search: str = Query(None, max_length=256),
     tags: str = Query(None),
-    articles_collection=Depends(get_articles_collection),
+    limit: int = Query(ARTICLES_PAGE_SIZE, ge=1, le=ARTICLES_MAX_PAGE_SIZE),
+    cursor: str = Query(None, description="Opaque token from 'next_cursor' of the previous page"),
+    fields: str = Query(None, description="Comma-separated fields to return, e.g. 'title,tags'"),
+    if_none_match: str | None = Header(None),
+    articles_collection=Depends(get_articles_read_collection),
 ):
     """
     List articles with optional search and tag filtering.
 
-    This endpoint returns a list of articles. You can filter articles by search term
-    (in title or content) and by tags.
+    This endpoint returns a page of articles ordered from newest to oldest. You can filter articles
+    by search term (in title or content) and by tags. Pages are fetched with keyset pagination on
+    (created_at, _id): pass the 'next_cursor' of a page as 'cursor' to get the following one.
+
+    When a search term is given, it is matched against the articles text index and results are
+    ordered by relevance instead; each article then carries its 'score'.
+
+    Articles are returned as summaries, with an 'excerpt' of the content instead of the full body.
+    Pass 'fields' to choose the returned fields instead ('content' for the full body); only those
+    fields are read from the database.
+
+    Pages are served from the response cache, keyed by the normalized query parameters.
+    Each page has an ETag built from the collection's change counter; when If-None-Match still
+    matches it, a 304 is returned after reading only the counter.
+
+    Lists are read with MONGO_HEAVY_READ_PREFERENCE (secondaries when available), so a page can
+    lag behind the latest writes by the replication delay. Such a page is only cached when the
+    change counter on the primary shows no write it missed.
 
     Args:
         current_user (UserInDB): The currently authenticated user.
-        search (str, optional): Search term for article title or content.
+        search (str, optional): Search terms for article title or content.
         tags (str, optional): Comma-separated list of tags to filter articles.
+        limit (int, optional): Maximum number of articles on the page.
+        cursor (str, optional): Cursor token returned with the previous page.
+        fields (str, optional): Comma-separated fields to return; defaults to the summary fields.
+        if_none_match (str, optional): ETag(s) of a page the client already has.
         articles_collection: MongoDB collection for articles.
 
+    Raises:
+        HTTPException: If the cursor is malformed or an unknown field is requested.
+
     Returns:
-        list[Article]: List of articles matching the filters.
+        ArticlePage: Articles matching the filters and the cursor of the next page.
+    """
+    search, tag_list = normalize_filters(search, tags)
+    # Cursors carry a relevance score with a search term, the creation time (or null) without.
+    cursor_types = (int, float) if search else (str, type(None))
+    after = decode_cursor(cursor, cursor_types) if cursor else None
+    selected = parse_fields(fields, SUMMARY_FIELDS)
+
+    params = {"search": search, "tags": tag_list, "limit": limit, "cursor": cursor, "fields": selected}
+    cache_key = article_cache.make_key("article_list", params)
+    if if_none_match is not None:
+        etag = list_etag(await read_change_counter(articles_collection), cache_key)
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+
+    built_under = None
+
+    async def load_page():
+        nonlocal built_under
+        # Read the counter first: a write racing with the query can only make the ETag older.
+        built_under = await read_change_counter(articles_collection)
+        etag = list_etag(built_under, cache_key)
+        filters = article_filters(tag_list)
+        if search:
+            sort_key = "score"
+            pipeline = text_search_pipeline(search, filters, after, limit + 1)
+        else:
+            sort_key = "created_at"
+            if after:
+                filters.append(keyset_filter(sort_key, *after))
+            pipeline = [
+                {"$match": {"$and": filters} if filters else {}},
+                {"$sort": {sort_key: -1, "_id": -1}},
+                {"$limit": limit + 1},
+            ]
+        # The sort key is needed for the next cursor even when the client did not ask for it.
+        projected = selected if sort_key in selected else (*selected, sort_key)
+        pipeline.append(article_projection(with_score=bool(search), fields=projected))
+        articles_list = await articles_collection.aggregate(pipeline).to_list(length=limit + 1)
+        next_cursor = None
+        if len(articles_list) > limit:
+            articles_list = articles_list[:limit]
+            last = articles_list[-1]
+            next_cursor = encode_cursor(last[sort_key], last["id"])
+        if sort_key not in selected:
+            for article in articles_list:
+                del article[sort_key]
+        return pack_body(etag, dump_json({"items": articles_list, "next_cursor": next_cursor}))
+
+    async def page_is_current(_):
+        # A page read on a lagging secondary would be cached until the next write or its TTL:
+        # only cache pages built under the counter the primary has now.
+        if articles_collection.read_preference == ReadPreference.PRIMARY:
+            return True
+        primary = articles_collection.with_options(read_preference=ReadPreference.PRIMARY)
+        return built_under == await read_change_counter(primary)
+
+    etag, body = unpack_body(
+        await article_cache.get_or_set("article_list", cache_key, load_page, cacheable=page_is_current)
+    )
+    return json_response(body, etag=etag)
+
+
+@router.get("/export", status_code=status.HTTP_200_OK, response_class=StreamingResponse)
+async def export_articles(
+    current_user: Annotated[UserInDB, Depends(get_current_active_user)],
+    search: str = Query(None, max_length=256),
+    tags: str = Query(None),
+    export_format: Literal["ndjson", "csv"] = Query("ndjson", alias="format"),
+    batch_size: int = Query(EXPORT_BATCH_SIZE, ge=1, le=EXPORT_MAX_BATCH_SIZE),
+    articles_collection=Depends(get_articles_read_collection),
+):
     """
+    Export all articles matching the filters as newline-delimited JSON or CSV.
+
+    The response is streamed straight from the database cursor, 'batch_size' documents at a time,
+    so memory use does not grow with the number of exported articles. Without a search term the
+    articles are ordered from newest to oldest; with one they come in text index order. Like lists,
+    exports are read with MONGO_HEAVY_READ_PREFERENCE.
+
+    Args:
+        current_user (UserInDB): The currently authenticated user.
+        search (str, optional): Search terms for article title or content.
+        tags (str, optional): Comma-separated list of tags to filter articles.
+        export_format (str, optional): "ndjson" (default) or "csv".
+        batch_size (int, optional): Number of articles fetched and sent per chunk.
+        articles_collection: MongoDB collection for articles.
+
+    Returns:
+        StreamingResponse: The exported articles.
+    """
+    search, tag_list = normalize_filters(search, tags)
     query = {}
+    for article_filter in article_filters(tag_list):
+        query.update(article_filter)
+    pipeline = []
     if search:
-        query["$or"] = [
-            {"title": {"$regex": search, "$options": "i"}},
-            {"content": {"$regex": search, "$options": "i"}},
-        ]
-    if tags:
-        query["tags"] = {"$in": tags.split(",")}
-    articles_cursor = articles_collection.find(query)
-    articles_list = await articles_cursor.to_list(length=None)
-    change_id_name(articles_list)
-    return articles_list
+        query["$text"] = {"$search": search}
+        pipeline.append({"$match": query})
+    else:
+        pipeline.extend([{"$match": query}, {"$sort": {"created_at": -1, "_id": -1}}])
+    pipeline.append(article_projection())
+    cursor = articles_collection.aggregate(pipeline, batchSize=batch_size)
+    media_type, filename = EXPORT_FORMATS[export_format]
+    return StreamingResponse(
+        export_chunks(cursor, export_format, batch_size),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@router.get("/stream", status_code=status.HTTP_200_OK, response_class=StreamingResponse)
+async def stream_article_changes(
+    current_user: Annotated[UserInDB, Depends(get_current_active_user)],
+    request: Request,
+):
+    """
+    Stream article changes as server-sent events.
+
+    A 'change' event is sent for every created, updated, replaced or deleted article, with its
+    'op' and 'id' and, when known, its title, tags, author, creation time and version. The events
+    come from a MongoDB change stream, so writes made through any API process or worker are
+    included. The stream ends after ARTICLE_FEED_TIMEOUT_SECONDS; clients reconnect then. A client
+    that falls more than ARTICLE_FEED_BUFFER_SIZE events behind gets an 'overflow' event and is
+    disconnected, and should reload the articles list before reconnecting.
+
+    Args:
+        current_user (UserInDB): The currently authenticated user.
+        request (Request): The incoming request, used to detect disconnected clients.
+
+    Raises:
+        HTTPException: 503 if change streams are unavailable (MongoDB is not a replica set).
+
+    Returns:
+        StreamingResponse: A text/event-stream response.
+    """
+    if not article_feed.available:
+        raise HTTPException(status_code=503, detail="Live article feed is unavailable")
+    events = feed_events(article_feed, timeout=ARTICLE_FEED_TIMEOUT_SECONDS, is_disconnected=request.is_disconnected)
+    return StreamingResponse(
+        events, media_type="text/event-stream", headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@router.get("/stats", status_code=status.HTTP_200_OK, response_model=ArticleStats)
+async def get_article_stats(
+    current_user: Annotated[UserInDB, Depends(get_current_active_user)],
+    limit: int = Query(10, ge=1, le=100, description="Number of top tags and authors"),
+    days: int = Query(30, ge=1, le=366, description="Number of latest creation days"),
+    articles_collection=Depends(get_articles_collection),
+):
+    """
+    Get article counts and word counts overall, per tag, per author and per creation day.
+
+    The statistics are maintained incrementally on every write and read from a small counters
+    collection, so the response time does not depend on the number of articles. A periodic task
+    repairs counters that drifted.
+
+    Args:
+        current_user (UserInDB): The currently authenticated user.
+        limit (int, optional): Number of tags and of authors to return, most articles first.
+        days (int, optional): Number of latest creation days to return, newest first.
+        articles_collection: MongoDB collection for articles.
+
+    Returns:
+        ArticleStats: The article statistics.
+    """
+    return await read_stats(articles_collection, limit, days)
+
+
+@router.get("/tags", status_code=status.HTTP_200_OK, response_model=TagList)
+async def list_tags(
+    current_user: Annotated[UserInDB, Depends(get_current_active_user)],
+    prefix: str = Query(None, max_length=64, description="Only return tags starting with this (case-insensitive)"),
+    limit: int = Query(20, ge=1, le=ARTICLES_MAX_PAGE_SIZE),
+    articles_collection=Depends(get_articles_collection),
+):
+    """
+    List the most used tags with their article counts, for tag clouds and tag autocomplete.
+
+    Tags are looked up in an in-process index of the tag counters, reloaded at most every
+    TAG_INDEX_TTL_SECONDS, so counts may lag behind recent writes by that long.
+
+    Args:
+        current_user (UserInDB): The currently authenticated user.
+        prefix (str, optional): Tag prefix to complete.
+        limit (int, optional): Maximum number of tags.
+        articles_collection: MongoDB collection for articles.
+
+    Returns:
+        TagList: The tags, most used first.
+    """
+    index = await tag_index.get(articles_collection)
+    items = [{"tag": tag, "count": count} for tag, count in index.suggest(prefix, limit)]
+    return json_response(dump_json({"items": items}))
 
 
 @router.get("/{article_id}/", status_code=status.HTTP_200_OK, response_model=Article)
 async def get_article(
     current_user: Annotated[UserInDB, Depends(get_current_active_user)],
     article_id: str,
+    fields: str = Query(None, description="Comma-separated fields to return, e.g. 'title,tags'"),
+    if_none_match: str | None = Header(None),
     articles_collection=Depends(get_articles_collection),
 ):
     """
     Retrieve a single article by its ID.
 
+    The serialized article is served from the response cache when present. Its ETag is the article
+    version; when If-None-Match still matches it, a 304 is returned after reading only the version.
+    Pass 'fields' to only return some fields; such partial responses bypass the cache and get an
+    ETag of their own.
+
     Args:
         current_user (UserInDB): The currently authenticated user.
         article_id (str): The ID of the article to retrieve.
+        fields (str, optional): Comma-separated fields to return; defaults to all Article fields.
+        if_none_match (str, optional): ETag(s) of a version the client already has.
         articles_collection: MongoDB collection for articles.
 
     Raises:
-        HTTPException: If the article is not found.
+        HTTPException: If the article is not found or an unknown field is requested.
 
     Returns:
         Article: The requested article.
     """
     check_correct_id(article_id)
-    article_dict = await articles_collection.find_one({"_id": ObjectId(article_id)})
-    if not article_dict:
+    selected = parse_fields(fields, FULL_FIELDS)
+    variant = None if selected == FULL_FIELDS else ",".join(selected)
+    if if_none_match is not None:
+        current = await articles_collection.find_one({"_id": ObjectId(article_id)}, {"version": 1})
+        if current is not None:
+            etag = make_etag(current.get("version", 0), variant)
+            if etag_matches(if_none_match, etag):
+                return not_modified(etag)
+
+    async def load_article():
+        projected = selected if "version" in selected else (*selected, "version")
+        pipeline = [{"$match": {"_id": ObjectId(article_id)}}, article_projection(fields=projected)]
+        articles = await articles_collection.aggregate(pipeline).to_list(length=1)
+        if not articles:
+            return None
+        article = articles[0]
+        version = article["version"] if "version" in selected else article.pop("version")
+        return pack_body(make_etag(version, variant), dump_json(article))
+
+    if variant is None:
+        cache_key = article_cache.make_key("article", article_id)
+        value = await article_cache.get_or_set("article", cache_key, load_article)
+    else:
+        value = await load_article()
+    if value is None:
         raise HTTPException(status_code=404, detail="Article not found")
-    change_id_name(article_dict)
-    return article_dict
+    etag, body = unpack_body(value)
+    return json_response(body, etag=etag)
+
+
+async def raise_write_failure(articles_collection, article_id: str, current_user: UserInDB, action: str):
+    """
+    Explain why a conditional write on an article matched nothing.
+
+    Only called after a failed write, so successful writes stay single round-trip.
+
+    Raises:
+        HTTPException: 404 if the article does not exist, 403 if the user is not its author,
+            412 if it was changed since the version given in If-Match.
+    """
+    existing_article = await articles_collection.find_one({"_id": ObjectId(article_id)}, {"author": 1})
+    if not existing_article:
+        raise HTTPException(status_code=404, detail="Article not found")
+    if existing_article["author"] != str(current_user.id):
+        raise HTTPException(status_code=403, detail=f"Not authorized to {action} this article")
+    raise HTTPException(status_code=412, detail="Article was modified by another request")
 
 
 @router.put("/{article_id}/", status_code=status.HTTP_200_OK, response_model=Article)
 async def update_article(
     current_user: Annotated[UserInDB, Depends(get_current_active_user)],
     article_id: str,
+    response: Response,
     article: ArticleCreate = Body(...),
+    if_match: str | None = Header(None),
     articles_collection=Depends(get_articles_collection),
 ):
     """
@@ -124,24 +502,30 @@ async def update_article(
 
     Only the author of the article can update it. You can update the title and/or content.
 
+    The ownership check and the write are a single atomic find_one_and_update. Every update bumps the
+    article's 'version'; pass the ETag of the version you edited in If-Match to only apply the update
+    if nobody changed the article in the meantime.
+
     Args:
         current_user (UserInDB): The currently authenticated user.
         article_id (str): The ID of the article to update.
+        response (Response): The outgoing response, used to set the ETag header.
         article (Article): The updated article data.
+        if_match (str, optional): ETag(s) of the expected current version.
         articles_collection: MongoDB collection for articles.
 
     Raises:
-        HTTPException: If the article is not found or the user is not authorized.
+        HTTPException: If the article is not found, the user is not authorized,
+            or the article does not match If-Match.
 
     Returns:
         Article: The updated article.
     """
     check_correct_id(article_id)
-    existing_article = await articles_collection.find_one({"_id": ObjectId(article_id)})
-    if not existing_article:
-        raise HTTPException(status_code=404, detail="Article not found")
-    if existing_article["author"] != str(current_user.id):
-        raise HTTPException(status_code=403, detail="Not authorized to update this article")
+    versions = parse_if_match(if_match)
+    query = {"_id": ObjectId(article_id), "author": str(current_user.id)}
+    if versions is not None:
+        query.update(version_filter(versions))
 
     update_data = {}
     if article.title is not None:
@@ -149,8 +533,19 @@ async def update_article(
     if article.content is not None:
         update_data["content"] = article.content
 
-    await articles_collection.update_one({"_id": ObjectId(article_id)}, {"$set": update_data})
-    updated_article = await articles_collection.find_one({"_id": ObjectId(article_id)})
+    # The previous version is returned to compute the word count change for the statistics.
+    previous_article = await articles_collection.find_one_and_update(
+        query, {"$set": update_data, "$inc": {"version": 1}}, return_document=ReturnDocument.BEFORE
+    )
+    if previous_article is None:
+        await raise_write_failure(articles_collection, article_id, current_user, "update")
+    updated_article = {**previous_article, **update_data, "version": previous_article.get("version", 0) + 1}
+    stats = StatsDelta()
+    if "content" in update_data:
+        words = count_words(update_data["content"]) - count_words(previous_article.get("content"))
+        stats.add_words(previous_article, words)
+    await articles_changed(articles_collection, article_id, stats=stats)
+    response.headers["ETag"] = make_etag(updated_article["version"])
     change_id_name(updated_article)
     return updated_article
 
@@ -159,50 +554,58 @@ async def update_article(
 async def delete_article(
     current_user: Annotated[UserInDB, Depends(get_current_active_user)],
     article_id: str,
+    if_match: str | None = Header(None),
     articles_collection=Depends(get_articles_collection),
 ):
     """
     Delete an article by its ID.
 
-    Only the author of the article can delete it.
+    Only the author of the article can delete it. The ownership check and the delete are a single
+    atomic find_one_and_delete; If-Match restricts the delete to the given version(s).
 
     Args:
         current_user (UserInDB): The currently authenticated user.
         article_id (str): The ID of the article to delete.
+        if_match (str, optional): ETag(s) of the expected current version.
         articles_collection: MongoDB collection for articles.
 
     Raises:
-        HTTPException: If the article is not found or the user is not authorized.
+        HTTPException: If the article is not found, the user is not authorized,
+            or the article does not match If-Match.
 
     Returns:
         None
     """
     check_correct_id(article_id)
-    existing_article = await articles_collection.find_one({"_id": ObjectId(article_id)})
-    if not existing_article:
-        raise HTTPException(status_code=404, detail="Article not found")
-    if existing_article["author"] != str(current_user.id):
-        raise HTTPException(status_code=403, detail="Not authorized to delete this article")
-
-    await articles_collection.delete_one({"_id": ObjectId(article_id)})
+    versions = parse_if_match(if_match)
+    query = {"_id": ObjectId(article_id), "author": str(current_user.id)}
+    if versions is not None:
+        query.update(version_filter(versions))
+
+    projection = {"content": 1, "tags": 1, "author": 1, "created_at": 1, "analysis": 1}
+    deleted_article = await articles_collection.find_one_and_delete(query, projection=projection)
+    if deleted_article is None:
+        await raise_write_failure(articles_collection, article_id, current_user, "delete")
+    stats = StatsDelta()
+    stats.add_article(deleted_article, -1)
+    await articles_changed(articles_collection, article_id, stats=stats)
     return None
 
 
 @router.post(
     "/{article_id}/analyze/",
+    status_code=status.HTTP_202_ACCEPTED,
+    response_model=Job,
     responses={
-        200: {
-            "description": "Analyzed article with analysis results",
+        202: {
+            "description": "Analysis job accepted",
             "content": {
                 "application/json": {
                     "example": {
-                        "title": "My Article Title",
-                        "content": "Article content goes here and its new.",
-                        "tags": ["fastapi", "mongodb"],
-                        "created_at": "2025-09-13T06:36:16.521942+00:00",
-                        "author": "68c3cadf9cfa7ae93702205f",
-                        "analysis": {"word_count": 7, "unique_tags": 2},
-                        "id": "68c510e07b0d53eff45954ff",
+                        "job_id": "0b6b4f0e-3f4c-4f43-9a57-4f0d8e6f3b6a",
+                        "status": "PENDING",
+                        "result": None,
+                        "error": None,
                     }
                 }
             },
@@ -212,30 +615,116 @@ async def delete_article(
 async def analyze_article_endpoint(
     current_user: Annotated[UserInDB, Depends(get_current_active_user)],
     article_id: str,
+    response: Response,
     articles_collection=Depends(get_articles_collection),
 ):
     """
-    Analyze an article and return the updated article with analysis results.
+    Start the analysis of an article.
 
-    This endpoint triggers an asynchronous Celery task to analyze the article (e.g., word count, unique tags).
-    The response waits for the task to complete (with a timeout) and then returns the updated article,
-    including the analysis results.
+    This endpoint enqueues a Celery task that analyzes the article (e.g., word count, unique tags)
+    and returns immediately with the job id. Follow the job with GET /jobs/{job_id}/ (optionally
+    long-polling with 'wait') or GET /jobs/{job_id}/events; once it succeeds the article carries
+    the 'analysis' field.
 
     Args:
+        current_user (UserInDB): The currently authenticated user.
         article_id (str): The ID of the article to analyze.
+        response (Response): The outgoing response, used to set the Location header.
         articles_collection: MongoDB collection for articles.
 
     Raises:
         HTTPException: If the article is not found.
 
     Returns:
-        dict: The updated article document, including the 'analysis' field.
+        Job: The accepted job.
     """
     check_correct_id(article_id)
-    task = analyze_article.delay(article_id)
-    task.get(timeout=10)
-    article_dict = await articles_collection.find_one({"_id": ObjectId(article_id)})
-    if not article_dict:
+    if not await articles_collection.find_one({"_id": ObjectId(article_id)}, {"_id": 1}):
         raise HTTPException(status_code=404, detail="Article not found")
-    change_id_name(article_dict)
-    return article_dict
+    task = analyze_article.delay(article_id)
+    response.headers["Location"] = f"{router.prefix}/jobs/{task.id}/"
+    return Job(job_id=task.id, status=states.PENDING)
+
+
+@router.post("/analyze/bulk/", status_code=status.HTTP_202_ACCEPTED, response_model=Job)
+async def analyze_articles_bulk_endpoint(
+    current_user: Annotated[UserInDB, Depends(get_current_admin_user)],
+    response: Response,
+    batch_size: int = Query(ANALYSIS_BATCH_SIZE, ge=1, le=10000),
+    restart: bool = Query(False, description="Ignore the checkpoint of an interrupted run and start over"),
+):
+    """
+    Start a bulk re-analysis of all articles (administrators only).
+
+    The Celery task streams articles in batches and writes each batch back with a single
+    bulk_write. An interrupted run resumes from its checkpoint unless 'restart' is set.
+    Follow the returned job like any other analysis job.
+
+    Args:
+        current_user (UserInDB): The currently authenticated administrator.
+        response (Response): The outgoing response, used to set the Location header.
+        batch_size (int, optional): Number of articles per batch.
+        restart (bool, optional): Whether to ignore an existing checkpoint.
+
+    Returns:
+        Job: The accepted job.
+    """
+    task = analyze_articles_bulk.delay(batch_size=batch_size, restart=restart)
+    response.headers["Location"] = f"{router.prefix}/jobs/{task.id}/"
+    return Job(job_id=task.id, status=states.PENDING)
+
+
+@router.get("/jobs/{job_id}/", status_code=status.HTTP_200_OK, response_model=Job)
+async def get_job_status(
+    current_user: Annotated[UserInDB, Depends(get_current_active_user)],
+    job_id: str,
+    wait: float = Query(0, ge=0, le=JOB_WAIT_MAX_SECONDS, description="Seconds to wait for the job to finish"),
+):
+    """
+    Get the status and result of a background job.
+
+    With 'wait' the request is held (without blocking the server) until the job finishes
+    or the given number of seconds passes, whichever comes first.
+
+    Args:
+        current_user (UserInDB): The currently authenticated user.
+        job_id (str): The job id returned when the job was started.
+        wait (float, optional): Maximum number of seconds to long-poll.
+
+    Returns:
+        Job: The job status, with its result or error once finished.
+    """
+    if wait:
+        return await wait_for_job(job_id, timeout=wait, interval=JOB_POLL_INTERVAL_SECONDS)
+    return await get_job(job_id)
+
+
+@router.get("/jobs/{job_id}/events", status_code=status.HTTP_200_OK, response_class=StreamingResponse)
+async def stream_job_events(
+    current_user: Annotated[UserInDB, Depends(get_current_active_user)],
+    job_id: str,
+    request: Request,
+):
+    """
+    Stream status changes of a background job as server-sent events.
+
+    A 'status' event is sent with the job snapshot on every change; the stream ends once
+    the job has finished.
+
+    Args:
+        current_user (UserInDB): The currently authenticated user.
+        job_id (str): The job id returned when the job was started.
+        request (Request): The incoming request, used to detect disconnected clients.
+
+    Returns:
+        StreamingResponse: A text/event-stream response.
+    """
+    events = job_events(
+        job_id,
+        timeout=JOB_STREAM_TIMEOUT_SECONDS,
+        interval=JOB_POLL_INTERVAL_SECONDS,
+        is_disconnected=request.is_disconnected,
+    )
+    return StreamingResponse(
+        events, media_type="text/event-stream", headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
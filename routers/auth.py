@@ -3,11 +3,18 @@ from typing import Annotated
 
 from fastapi import APIRouter, Body, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
+from pymongo.errors import DuplicateKeyError
 
 from config.settings import ACCESS_TOKEN_EXPIRE_MINUTES
 from models.auth import Token, User, UserInDB, UserPublic
-from services.tasks import send_welcome_email
-from utils.auth import authenticate_user, create_access_token, get_current_active_user, get_password_hash
+from services.outbox import WELCOME_EMAIL, outbox, outbox_message
+from utils.auth import (
+    authenticate_user,
+    create_access_token,
+    get_current_active_user,
+    get_password_hash_async,
+    invalidate_user,
+)
 from utils.get_collections import get_users_collection
 
 router = APIRouter(prefix="/api/v1/auth", tags=["Auth"])
@@ -24,7 +31,10 @@ async def register_user(user: User = Body(...), users_collection=Depends(get_use
 
     This endpoint allows a new user to register by providing their email, name, and password.
     The password is hashed before storing in the database. If the user already exists,
-    an error is returned. After successful registration, a welcome email is sent asynchronously.
+    an error is returned, also when a concurrent registration of the same email wins the race
+    (the unique email index rejects the insert). The welcome email is written to the outbox
+    together with the user and sent asynchronously by the next outbox drain (see
+    services/outbox.py).
 
     Args:
         user (User): The user data provided in the request body.
@@ -40,10 +50,18 @@ async def register_user(user: User = Body(...), users_collection=Depends(get_use
     if existing:
         raise HTTPException(status_code=400, detail="User already exists")
     user_dict = user.model_dump()
-    user_dict["hashed_password"] = get_password_hash(user.password)
+    user_dict["hashed_password"] = await get_password_hash_async(user.password)
     del user_dict["password"]
-    result = await users_collection.insert_one(user_dict)
-    send_welcome_email.delay(user.email, user.name)
+
+    async def insert_user(session):
+        return await users_collection.insert_one(user_dict, session=session)
+
+    welcome = outbox_message(WELCOME_EMAIL, {"email": user.email, "name": user.name})
+    try:
+        result = await outbox.write(users_collection.database, insert_user, welcome)
+    except DuplicateKeyError:
+        raise HTTPException(status_code=400, detail="User already exists")
+    invalidate_user(user.email)
     return {"id": str(result.inserted_id), "email": user.email, "name": user.name}
 
 
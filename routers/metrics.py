@@ -0,0 +1,18 @@
+from fastapi import APIRouter, Response
+
+from config.metrics import StatsCollector, build_registry, render_metrics
+from utils.auth import auth_cache_stats, hashing_pool
+from utils.response_cache import article_cache
+
+router = APIRouter(tags=["Metrics"])
+
+registry = build_registry(StatsCollector(article_cache.stats, auth_cache_stats, hashing_pool.stats))
+
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics():
+    """
+    Expose the application metrics in the Prometheus text format.
+    """
+    payload, content_type = render_metrics(registry)
+    return Response(content=payload, media_type=content_type)
@@ -0,0 +1,160 @@
+from datetime import datetime, timezone
+
+from bson import ObjectId
+from celery import group
+from pymongo import DeleteOne, InsertOne, UpdateOne
+from pymongo.errors import BulkWriteError
+from starlette.concurrency import run_in_threadpool
+
+from models.article import BulkItemResult, BulkOperation
+from services.stats import StatsDelta, count_words
+from services.tasks import BULK_PRIORITY, analyze_article
+
+SUCCESS_STATUS = {"create": 201, "update": 200, "delete": 204}
+
+
+async def run_bulk(
+    articles_collection, operations: list[BulkOperation], author: str
+) -> tuple[list[BulkItemResult], StatsDelta]:
+    """
+    Apply a batch of article operations with one ownership query and one bulk write.
+
+    Update and delete targets are looked up with a single '$in' query; operations on missing
+    articles or on articles of another author fail with 404/403, and repeated IDs with 400, and are
+    left out of the write. The remaining operations run in one unordered bulk_write, so one failing
+    write does not stop the others. Writes are also filtered by author, in case ownership changed in
+    between, and updates or deletes whose article was gone by then end with 404 (see
+    _mark_unapplied).
+
+    The effect of the successful writes on the article statistics is computed from the documents
+    read by the ownership query and returned for the caller to record.
+
+    Args:
+        articles_collection: MongoDB collection for articles.
+        operations (list[BulkOperation]): The requested operations.
+        author (str): ID of the current user.
+
+    Returns:
+        tuple[list[BulkItemResult], StatsDelta]: One result per operation, in request order, and the
+            statistics changes of the successful ones.
+    """
+    results = [
+        BulkItemResult(index=index, op=operation.op, id=operation.id, status=SUCCESS_STATUS[operation.op])
+        for index, operation in enumerate(operations)
+    ]
+    object_ids, seen = {}, set()
+    for result, operation in zip(results, operations):
+        if operation.op == "create":
+            continue
+        if not ObjectId.is_valid(operation.id):
+            result.status, result.error = 400, "Invalid article ID format"
+        elif ObjectId(operation.id) in seen:
+            result.status, result.error = 400, "Article ID repeated in the request"
+        else:
+            object_ids[result.index] = ObjectId(operation.id)
+            seen.add(object_ids[result.index])
+
+    targets = {}
+    if object_ids:
+        projection = {"author": 1, "content": 1, "tags": 1, "created_at": 1, "analysis": 1}
+        cursor = articles_collection.find({"_id": {"$in": list(seen)}}, projection)
+        targets = {document["_id"]: document async for document in cursor}
+
+    requests, written, changes = [], [], []
+    created_at = datetime.now(timezone.utc).isoformat()
+    for result, operation in zip(results, operations):
+        if result.error:
+            continue
+        if operation.op == "create":
+            document = operation.article.model_dump()
+            document.update(_id=ObjectId(), author=author, created_at=created_at, version=1)
+            result.id = str(document["_id"])
+            requests.append(InsertOne(document))
+            changes.append((document, 1, None))
+        else:
+            object_id = object_ids[result.index]
+            if object_id not in targets:
+                result.status, result.error = 404, "Article not found"
+                continue
+            target = targets[object_id]
+            if target.get("author") != author:
+                result.status, result.error = 403, f"Not authorized to {operation.op} this article"
+                continue
+            query = {"_id": object_id, "author": author}
+            if operation.op == "update":
+                update_data = {"title": operation.article.title, "content": operation.article.content}
+                requests.append(UpdateOne(query, {"$set": update_data, "$inc": {"version": 1}}))
+                words = count_words(operation.article.content) - count_words(target.get("content"))
+                changes.append((target, 0, words))
+            else:
+                requests.append(DeleteOne(query))
+                changes.append((target, -1, None))
+        written.append(result)
+
+    if requests:
+        try:
+            outcome = (await articles_collection.bulk_write(requests, ordered=False)).bulk_api_result
+        except BulkWriteError as error:
+            outcome = error.details
+            for write_error in outcome["writeErrors"]:
+                result = written[write_error["index"]]
+                result.status, result.error = 500, write_error["errmsg"]
+        applied = {"update": outcome["nMatched"], "delete": outcome["nRemoved"]}
+        await _mark_unapplied(articles_collection, written, object_ids, applied)
+
+    delta = StatsDelta()
+    for result, (document, sign, words) in zip(written, changes):
+        if result.error:
+            continue
+        if sign:
+            delta.add_article(document, sign)
+        else:
+            delta.add_words(document, words)
+    return results, delta
+
+
+async def _mark_unapplied(articles_collection, written: list[BulkItemResult], object_ids: dict, applied: dict):
+    """
+    Mark the updates and deletes that matched no article in the bulk write as 404.
+
+    The write result only counts the matched updates and the deleted articles. When a count falls
+    short, an article was deleted concurrently between the ownership query and the write: updates
+    are settled by looking their articles up again. Deletes can't be told apart that way, since all
+    their articles are gone; the shortfall is taken from the last ones, which may attribute it to
+    the wrong article in the per-dimension statistics until reconcile_operations repairs them.
+
+    Args:
+        articles_collection: MongoDB collection for articles.
+        written (list[BulkItemResult]): Results of the operations sent in the bulk write.
+        object_ids (dict): Article ObjectId by operation index.
+        applied (dict): Number of matched 'update' and 'delete' operations.
+    """
+    for op in ("update", "delete"):
+        pending = [result for result in written if result.op == op and result.error is None]
+        missing = len(pending) - applied[op]
+        if missing <= 0:
+            continue
+        if op == "update":
+            query = {"_id": {"$in": [object_ids[result.index] for result in pending]}}
+            present = {document["_id"] async for document in articles_collection.find(query, {"_id": 1})}
+            pending = [result for result in pending if object_ids[result.index] not in present]
+        for result in pending[-missing:]:
+            result.status, result.error = 404, "Article not found"
+
+
+async def enqueue_analysis(results: list[BulkItemResult]):
+    """
+    Start the analysis of every created article as one Celery group and record the job ids.
+
+    The analyses are sent with BULK_PRIORITY, behind analyses requested for a single article.
+
+    Args:
+        results (list[BulkItemResult]): Results of a bulk request; successful creates get their 'job_id' set.
+    """
+    created = [result for result in results if result.op == "create" and result.error is None]
+    if not created:
+        return
+    jobs = group(analyze_article.s(result.id).set(priority=BULK_PRIORITY) for result in created)
+    group_result = await run_in_threadpool(jobs.apply_async)
+    for result, job in zip(created, group_result.results):
+        result.job_id = job.id
@@ -0,0 +1,281 @@
+"""
+Article changes read from a MongoDB change stream: cache invalidation and the live article feed.
+
+Every API process runs one ChangeStreamWatcher on the 'articles' collection. Each change drops the
+affected entries from the in-process (L1) response cache, which would otherwise keep serving
+articles written through another process or by the Celery workers until they expire, and is fanned
+out to the subscribers of the live feed (GET /api/v1/articles/stream).
+
+The resume token is stored in the 'change_streams' collection at most every
+CHANGE_STREAM_TOKEN_SAVE_SECONDS, so after an error or a restart the stream resumes where it left
+off. Change streams need a replica set or a sharded cluster; on a standalone server the watcher
+logs a warning and stops, and the feed is reported as unavailable.
+
+Each subscriber buffers at most ARTICLE_FEED_BUFFER_SIZE events. A subscriber that falls that far
+behind is sent an 'overflow' event and dropped, rather than letting its buffer grow without limit.
+"""
+
+import asyncio
+import json
+import logging
+import time
+from datetime import datetime, timezone
+
+from pymongo.errors import OperationFailure, PyMongoError
+
+from config.metrics import ARTICLE_CHANGES, ARTICLE_FEED_OVERFLOWS, ARTICLE_FEED_SUBSCRIBERS
+from config.settings import ARTICLE_FEED_BUFFER_SIZE
+from services.jobs import KEEP_ALIVE_SECONDS
+from utils.response_cache import ResponseCache
+
+logger = logging.getLogger(__name__)
+
+TOKENS_COLLECTION = "change_streams"
+FEED_OPERATIONS = ("insert", "update", "replace", "delete")
+FEED_FIELDS = ("title", "tags", "author", "created_at", "version")
+
+# Keep the events small: the content of the articles is never needed. '_id' (the resume token) stays.
+CHANGE_PIPELINE = [
+    {
+        "$project": {
+            "operationType": 1,
+            "documentKey": 1,
+            "updateDescription.updatedFields.version": 1,
+            **{f"fullDocument.{field}": 1 for field in FEED_FIELDS},
+        }
+    }
+]
+
+# Server error codes: change streams not supported (standalone server), and resume tokens that can
+# no longer be used (InvalidResumeToken, ChangeStreamFatalError, ChangeStreamHistoryLost).
+CHANGE_STREAMS_UNSUPPORTED = 40573
+RESUME_FAILED_CODES = {260, 280, 286}
+
+# Marks the end of a subscription in its queue: None when the feed closed, OVERFLOW when the
+# subscriber was dropped for falling behind.
+OVERFLOW = "overflow"
+
+
+def feed_event(change: dict) -> dict:
+    """
+    Build the feed event of an article change.
+
+    Returns:
+        dict: 'op' and the article 'id', plus the article's title, tags, author, creation time and
+            version when the change carries them.
+    """
+    document = change.get("fullDocument") or {}
+    event = {"op": change["operationType"], "id": str(change["documentKey"]["_id"])}
+    event.update({field: document[field] for field in FEED_FIELDS if field in document})
+    updated = change.get("updateDescription", {}).get("updatedFields", {})
+    if "version" in updated:
+        event["version"] = updated["version"]
+    return event
+
+
+class ChangeFeed:
+    """
+    Fans article change events out to the subscribers of this process, each with a bounded queue.
+
+    Attributes:
+        buffer_size (int): Maximum number of events waiting for one subscriber.
+        available (bool): Whether the change stream feeding the events is running.
+    """
+
+    def __init__(self, buffer_size: int):
+        self.buffer_size = buffer_size
+        self.available = False
+        self._subscribers: set[asyncio.Queue] = set()
+
+    def __len__(self) -> int:
+        return len(self._subscribers)
+
+    def subscribe(self) -> asyncio.Queue:
+        queue = asyncio.Queue(maxsize=self.buffer_size)
+        self._subscribers.add(queue)
+        ARTICLE_FEED_SUBSCRIBERS.inc()
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue):
+        if queue in self._subscribers:
+            self._subscribers.discard(queue)
+            ARTICLE_FEED_SUBSCRIBERS.dec()
+
+    def _end(self, queue: asyncio.Queue, marker: str | None):
+        # Pending events are discarded, so the marker always fits and is read next.
+        while not queue.empty():
+            queue.get_nowait()
+        queue.put_nowait(marker)
+        self.unsubscribe(queue)
+
+    def publish(self, event: dict):
+        for queue in list(self._subscribers):
+            try:
+                queue.put_nowait(event)
+            except asyncio.QueueFull:
+                ARTICLE_FEED_OVERFLOWS.inc()
+                self._end(queue, OVERFLOW)
+
+    def close(self):
+        """
+        End every subscription, e.g. on shutdown or when the change stream stopped for good.
+        """
+        self.available = False
+        for queue in list(self._subscribers):
+            self._end(queue, None)
+
+
+async def feed_events(feed: ChangeFeed, timeout: float, is_disconnected):
+    """
+    Yield server-sent events for article changes until the client leaves or the timeout expires.
+
+    Args:
+        feed (ChangeFeed): The feed to subscribe to.
+        timeout (float): Maximum lifetime of the stream in seconds; clients reconnect after it.
+        is_disconnected: Coroutine function telling whether the client went away.
+
+    Yields:
+        str: 'change' events carrying a feed_event as JSON, keep-alive comments in between, and a
+            final 'overflow' event if the client could not keep up.
+    """
+    queue = feed.subscribe()
+    deadline = time.monotonic() + timeout
+    try:
+        while (remaining := deadline - time.monotonic()) > 0 and not await is_disconnected():
+            try:
+                event = await asyncio.wait_for(queue.get(), min(KEEP_ALIVE_SECONDS, remaining))
+            except TimeoutError:
+                yield ": keep-alive\n\n"
+                continue
+            if event is None:
+                return
+            if event == OVERFLOW:
+                yield "event: overflow\ndata: {}\n\n"
+                return
+            yield f"event: change\ndata: {json.dumps(event, default=str)}\n\n"
+    finally:
+        feed.unsubscribe(queue)
+
+
+class ChangeStreamWatcher:
+    """
+    Background task watching the articles collection, started and stopped with the application.
+
+    Attributes:
+        app: The FastAPI application; its 'mongodb' database is read on start.
+        feed (ChangeFeed): Receives the events of article changes.
+        cache (ResponseCache): Response cache whose L1 entries are dropped on changes.
+        retry_seconds (float): Delay before reopening the stream after an error.
+        token_save_seconds (float): Minimum delay between two writes of the resume token.
+        enabled (bool): Whether start() does anything at all.
+    """
+
+    def __init__(
+        self,
+        app,
+        feed: ChangeFeed,
+        cache: ResponseCache,
+        retry_seconds: float,
+        token_save_seconds: float,
+        enabled: bool = True,
+        collection_name: str = "articles",
+    ):
+        self.app = app
+        self.feed = feed
+        self.cache = cache
+        self.retry_seconds = retry_seconds
+        self.token_save_seconds = token_save_seconds
+        self.enabled = enabled
+        self.collection_name = collection_name
+        self._task: asyncio.Task | None = None
+        self._token = None
+        self._saved_token = None
+
+    async def start(self):
+        if self.enabled:
+            self._task = asyncio.create_task(self._run(self.app.mongodb))
+
+    async def stop(self):
+        self.feed.close()
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        try:
+            await self._save_token(self.app.mongodb)
+        except PyMongoError as error:
+            logger.warning("Could not save the %s change stream resume token: %s", self.collection_name, error)
+
+    async def _save_token(self, database):
+        if self._token is None or self._token == self._saved_token:
+            return
+        await database[TOKENS_COLLECTION].update_one(
+            {"_id": self.collection_name},
+            {"$set": {"token": self._token, "saved_at": datetime.now(timezone.utc)}},
+            upsert=True,
+        )
+        self._saved_token = self._token
+
+    def _dispatch(self, change: dict):
+        operation = change["operationType"]
+        ARTICLE_CHANGES.labels(operation).inc()
+        if operation in FEED_OPERATIONS:
+            article_id = str(change["documentKey"]["_id"])
+            self.cache.invalidate_local("article", ResponseCache.make_key("article", article_id))
+            self.cache.invalidate_local("article_list")
+            self.feed.publish(feed_event(change))
+        else:
+            # drop, rename, dropDatabase, invalidate: any cached article may be gone.
+            self._invalidate_all()
+
+    def _invalidate_all(self):
+        self.cache.invalidate_local("article")
+        self.cache.invalidate_local("article_list")
+
+    async def _watch(self, database):
+        collection = database[self.collection_name]
+        last_saved = time.monotonic()
+        async with collection.watch(CHANGE_PIPELINE, start_after=self._token) as stream:
+            self.feed.available = True
+            logger.info("Watching %s changes", self.collection_name)
+            async for change in stream:
+                self._token = stream.resume_token
+                self._dispatch(change)
+                if time.monotonic() - last_saved >= self.token_save_seconds:
+                    await self._save_token(database)
+                    last_saved = time.monotonic()
+
+    async def _run(self, database):
+        token_loaded = False
+        while True:
+            try:
+                if not token_loaded:
+                    saved = await database[TOKENS_COLLECTION].find_one({"_id": self.collection_name})
+                    self._token = self._saved_token = saved["token"] if saved else None
+                    token_loaded = True
+                await self._watch(database)
+            except OperationFailure as error:
+                if error.code == CHANGE_STREAMS_UNSUPPORTED:
+                    logger.warning("Change streams unavailable, live article feed disabled: %s", error)
+                    self.feed.close()
+                    return
+                if error.code in RESUME_FAILED_CODES:
+                    # Changes since the token are lost: start from now and forget everything cached.
+                    logger.warning(
+                        "Cannot resume the %s change stream, restarting it: %s", self.collection_name, error
+                    )
+                    self._token = None
+                    self._invalidate_all()
+                    continue
+                logger.warning("%s change stream failed: %s", self.collection_name, error)
+            except PyMongoError as error:
+                logger.warning("%s change stream failed: %s", self.collection_name, error)
+            self.feed.available = False
+            await asyncio.sleep(self.retry_seconds)
+
+
+article_feed = ChangeFeed(buffer_size=ARTICLE_FEED_BUFFER_SIZE)
@@ -0,0 +1,66 @@
+import threading
+
+from celery.signals import worker_process_init, worker_process_shutdown, worker_shutdown
+from pymongo import MongoClient
+
+from config.db import mongo_client_options
+from config.settings import CELERY_MONGO_MAX_POOL_SIZE, CELERY_MONGO_MIN_POOL_SIZE, DB_NAME, DB_URL
+
+_client: MongoClient | None = None
+# Guards the creation of the client: the email worker runs tasks in threads (-P threads).
+_lock = threading.Lock()
+
+
+def get_client() -> MongoClient:
+    """
+    Return the MongoDB client shared by all tasks of the current worker process.
+
+    The client is created on first use, so tasks also work outside a prefork worker
+    (eager mode, solo pool, tests), and only once when threads of a thread pool ask for it together.
+
+    Returns:
+        MongoClient: The shared client.
+    """
+    global _client
+    if _client is None:
+        with _lock:
+            if _client is None:
+                _client = MongoClient(
+                    DB_URL, **mongo_client_options(CELERY_MONGO_MAX_POOL_SIZE, CELERY_MONGO_MIN_POOL_SIZE)
+                )
+    return _client
+
+
+def get_db():
+    """
+    Return the application database on the shared client.
+    """
+    return get_client()[DB_NAME]
+
+
+def close_client():
+    global _client
+    with _lock:
+        if _client is not None:
+            _client.close()
+            _client = None
+
+
+@worker_process_init.connect
+def init_worker_client(**kwargs):
+    # A client inherited from the parent through fork is not safe to use: drop it without closing
+    # the parent's sockets and connect again in the child. The lock is replaced too, in case another
+    # thread of the parent held it at fork time.
+    global _client, _lock
+    _client, _lock = None, threading.Lock()
+    get_client()
+
+
+@worker_process_shutdown.connect
+def close_worker_client(**kwargs):
+    close_client()
+
+
+@worker_shutdown.connect
+def close_main_client(**kwargs):
+    close_client()
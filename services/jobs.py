@@ -0,0 +1,88 @@
+import asyncio
+import json
+import time
+
+from celery import states
+from celery.result import AsyncResult
+from starlette.concurrency import run_in_threadpool
+
+from services.tasks import analyze_article
+
+KEEP_ALIVE_SECONDS = 15
+
+
+def job_snapshot(job_id: str) -> dict:
+    """
+    Read the current state of a Celery job from the result backend.
+
+    This is a blocking call; use get_job from async code.
+
+    Args:
+        job_id (str): The Celery task id.
+
+    Returns:
+        dict: Job id, status, and the result or error once the job has finished.
+    """
+    result = AsyncResult(job_id, app=analyze_article.app)
+    state = result.state
+    snapshot = {"job_id": job_id, "status": state, "result": None, "error": None}
+    if state == states.SUCCESS:
+        snapshot["result"] = result.result
+    elif state in states.READY_STATES:
+        snapshot["error"] = str(result.result)
+    return snapshot
+
+
+async def get_job(job_id: str) -> dict:
+    """
+    Read the current state of a job without blocking the event loop.
+    """
+    return await run_in_threadpool(job_snapshot, job_id)
+
+
+async def wait_for_job(job_id: str, timeout: float, interval: float) -> dict:
+    """
+    Long-poll a job until it finishes or the timeout expires.
+
+    Args:
+        job_id (str): The Celery task id.
+        timeout (float): Maximum number of seconds to wait.
+        interval (float): Delay between two polls of the result backend.
+
+    Returns:
+        dict: The last job snapshot.
+    """
+    deadline = time.monotonic() + timeout
+    snapshot = await get_job(job_id)
+    while snapshot["status"] not in states.READY_STATES and time.monotonic() < deadline:
+        await asyncio.sleep(interval)
+        snapshot = await get_job(job_id)
+    return snapshot
+
+
+async def job_events(job_id: str, timeout: float, interval: float, is_disconnected):
+    """
+    Yield server-sent events for every status change of a job until it finishes.
+
+    Args:
+        job_id (str): The Celery task id.
+        timeout (float): Maximum lifetime of the stream in seconds.
+        interval (float): Delay between two polls of the result backend.
+        is_disconnected: Coroutine function telling whether the client went away.
+
+    Yields:
+        str: 'status' events carrying the job snapshot as JSON, and keep-alive comments in between.
+    """
+    deadline = time.monotonic() + timeout
+    last_status, last_sent = None, time.monotonic()
+    while time.monotonic() < deadline and not await is_disconnected():
+        snapshot = await get_job(job_id)
+        if snapshot["status"] != last_status:
+            last_status, last_sent = snapshot["status"], time.monotonic()
+            yield f"event: status\ndata: {json.dumps(snapshot, default=str)}\n\n"
+        elif time.monotonic() - last_sent >= KEEP_ALIVE_SECONDS:
+            last_sent = time.monotonic()
+            yield ": keep-alive\n\n"
+        if last_status in states.READY_STATES:
+            return
+        await asyncio.sleep(interval)
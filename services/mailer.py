@@ -0,0 +1,117 @@
+"""
+Email senders used to deliver outbox messages, selected with EMAIL_SENDER.
+
+"log" only logs the messages (the default, for development and tests); "smtp" sends them through
+EMAIL_SMTP_HOST, over a single connection per batch.
+"""
+
+import logging
+import smtplib
+from email.message import EmailMessage
+
+from config.settings import (
+    EMAIL_FROM,
+    EMAIL_SENDER,
+    EMAIL_SMTP_HOST,
+    EMAIL_SMTP_PASSWORD,
+    EMAIL_SMTP_PORT,
+    EMAIL_SMTP_STARTTLS,
+    EMAIL_SMTP_TIMEOUT_SECONDS,
+    EMAIL_SMTP_USERNAME,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def welcome_email(email: str, name: str) -> EmailMessage:
+    """
+    Build the welcome email of a new user.
+    """
+    message = EmailMessage()
+    message["From"] = EMAIL_FROM
+    message["To"] = email
+    message["Subject"] = "Welcome to ArticleHub"
+    message.set_content(f"Hi {name},\n\nyour ArticleHub account is ready. Happy writing!\n")
+    return message
+
+
+class LogSender:
+    """
+    Sender that logs the messages instead of sending them.
+    """
+
+    def send_batch(self, messages: list[EmailMessage]) -> list[Exception | None]:
+        for message in messages:
+            logger.info("Email to %s: %s", message["To"], message["Subject"])
+        return [None] * len(messages)
+
+
+class SMTPSender:
+    """
+    Sender delivering the messages of a batch over one SMTP connection.
+
+    Attributes:
+        host (str): SMTP server host.
+        port (int): SMTP server port.
+        username (str): Login user; no login when empty.
+        password (str): Login password.
+        starttls (bool): Whether to upgrade the connection with STARTTLS before logging in.
+        timeout (float): Socket timeout in seconds.
+    """
+
+    def __init__(
+        self, host: str, port: int, username: str = "", password: str = "", starttls: bool = False, timeout: float = 10
+    ):
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.starttls = starttls
+        self.timeout = timeout
+
+    def send_batch(self, messages: list[EmailMessage]) -> list[Exception | None]:
+        """
+        Send the messages, in order.
+
+        Returns:
+            list[Exception | None]: For each message, None if it was sent or the error that
+                prevented it. Messages after a lost connection all carry the connection error.
+        """
+        errors: list[Exception | None] = []
+        try:
+            with smtplib.SMTP(self.host, self.port, timeout=self.timeout) as smtp:
+                if self.starttls:
+                    smtp.starttls()
+                if self.username:
+                    smtp.login(self.username, self.password)
+                for message in messages:
+                    try:
+                        smtp.send_message(message)
+                        errors.append(None)
+                    except (smtplib.SMTPRecipientsRefused, smtplib.SMTPSenderRefused, smtplib.SMTPDataError) as error:
+                        errors.append(error)
+        except (smtplib.SMTPException, OSError) as error:
+            logger.warning("SMTP delivery to %s:%s failed: %s", self.host, self.port, error)
+            errors.extend([error] * (len(messages) - len(errors)))
+        return errors
+
+
+def get_sender():
+    """
+    Build the sender configured with EMAIL_SENDER.
+
+    Raises:
+        ValueError: If EMAIL_SENDER names no known sender.
+    """
+    if EMAIL_SENDER == "log":
+        return LogSender()
+    if EMAIL_SENDER == "smtp":
+        return SMTPSender(
+            EMAIL_SMTP_HOST,
+            EMAIL_SMTP_PORT,
+            EMAIL_SMTP_USERNAME,
+            EMAIL_SMTP_PASSWORD,
+            EMAIL_SMTP_STARTTLS,
+            EMAIL_SMTP_TIMEOUT_SECONDS,
+        )
+    raise ValueError(f"Unknown EMAIL_SENDER: {EMAIL_SENDER!r}")
@@ -0,0 +1,184 @@
+"""
+Transactional outbox for messages sent on behalf of API requests (welcome emails).
+
+Instead of publishing a Celery message, a request inserts an 'outbox' document along with its own
+write, in the same transaction when the deployment supports transactions. The drain_outbox task,
+run by Celery beat every OUTBOX_DRAIN_INTERVAL_SECONDS, claims pending messages in batches of
+OUTBOX_BATCH_SIZE (at most OUTBOX_MAX_BATCHES per run, which caps the delivery rate), delivers each
+batch through the configured sender, inserts the log records of the batch with one insert_many and
+removes the delivered messages.
+
+Failed deliveries are retried with exponential backoff from OUTBOX_RETRY_SECONDS and are left with
+status "failed" after OUTBOX_MAX_ATTEMPTS. Claims of a drainer that died are taken over after
+OUTBOX_CLAIM_TIMEOUT_SECONDS. Delivery is at least once: a drainer dying between sending a batch
+and removing it sends the batch again.
+"""
+
+import logging
+from datetime import datetime, timedelta, timezone
+
+from bson import ObjectId
+from pymongo import UpdateOne
+from pymongo.errors import OperationFailure
+
+from config.settings import OUTBOX_TRANSACTIONS_ENABLED
+from models.log import Log
+from services.mailer import welcome_email
+
+logger = logging.getLogger(__name__)
+
+OUTBOX_COLLECTION = "outbox"
+WELCOME_EMAIL = "welcome_email"
+
+# Server error code of transactions on a standalone server (IllegalOperation).
+TRANSACTIONS_UNSUPPORTED = 20
+
+
+def outbox_message(kind: str, payload: dict) -> dict:
+    """
+    Build a pending outbox document.
+
+    Args:
+        kind (str): Message kind, e.g. WELCOME_EMAIL; selects how the payload is delivered.
+        payload (dict): Arguments of the message.
+    """
+    now = datetime.now(timezone.utc)
+    return {
+        "kind": kind,
+        "payload": payload,
+        "status": "pending",
+        "attempts": 0,
+        "created_at": now,
+        "available_at": now,
+    }
+
+
+def render_message(document: dict) -> tuple:
+    """
+    Turn an outbox document into the email to send and the log record of its delivery.
+
+    Returns:
+        tuple: (EmailMessage, Log)
+    """
+    if document["kind"] == WELCOME_EMAIL:
+        email, name = document["payload"]["email"], document["payload"]["name"]
+        return welcome_email(email, name), Log(type="user", message=f"Welcome email sent to {email} ({name})")
+    raise ValueError(f"Unknown outbox message kind: {document['kind']!r}")
+
+
+class Outbox:
+    """
+    Writes outbox messages together with the write that caused them.
+
+    Attributes:
+        use_transactions (bool): Whether to wrap both writes in a transaction. Turned off after the
+            first attempt on a deployment without transactions (a standalone server), after which
+            the writes are made one after the other: a message can then only be lost, never sent
+            for a write that failed.
+    """
+
+    def __init__(self, use_transactions: bool = True):
+        self.use_transactions = use_transactions
+
+    async def write(self, database, write, *messages: dict):
+        """
+        Run 'write' and insert the outbox messages, atomically when transactions are available.
+
+        Args:
+            database: The database holding the outbox.
+            write: Coroutine function taking the session (or None) and making the request's write.
+            *messages (dict): Documents built with outbox_message.
+
+        Returns:
+            The result of 'write'.
+        """
+
+        async def write_all(session):
+            result = await write(session)
+            await database[OUTBOX_COLLECTION].insert_many(list(messages), session=session)
+            return result
+
+        if self.use_transactions:
+            try:
+                async with await database.client.start_session() as session:
+                    return await session.with_transaction(write_all)
+            except OperationFailure as error:
+                if error.code != TRANSACTIONS_UNSUPPORTED:
+                    raise
+                logger.warning("Transactions unavailable, writing outbox messages separately: %s", error)
+                self.use_transactions = False
+        return await write_all(None)
+
+
+def claim_batch(db, size: int, claim_timeout: float) -> list[dict]:
+    """
+    Claim up to 'size' messages that are due, oldest first, including expired claims.
+
+    Concurrent drainers never claim the same message: each marks its candidates with its own claim
+    id in one update and only gets back the messages that update actually changed.
+    """
+    now = datetime.now(timezone.utc)
+    claimable = {
+        "$or": [
+            {"status": "pending", "available_at": {"$lte": now}},
+            {"status": "claimed", "claimed_at": {"$lt": now - timedelta(seconds=claim_timeout)}},
+        ]
+    }
+    candidates = db[OUTBOX_COLLECTION].find(claimable, {"_id": 1}).sort("available_at", 1).limit(size)
+    ids = [document["_id"] for document in candidates]
+    if not ids:
+        return []
+    claim = ObjectId()
+    db[OUTBOX_COLLECTION].update_many(
+        {"_id": {"$in": ids}, **claimable}, {"$set": {"status": "claimed", "claim": claim, "claimed_at": now}}
+    )
+    return list(db[OUTBOX_COLLECTION].find({"claim": claim}))
+
+
+def deliver_batch(db, sender, batch: list[dict], max_attempts: int, retry_seconds: float) -> dict:
+    """
+    Send a claimed batch, record the deliveries and settle every message.
+
+    Delivered messages are logged with one insert_many and removed. The others go back to pending
+    with exponential backoff, or to "failed" once they used up their attempts.
+
+    Returns:
+        dict: Number of 'sent', 'retried' and 'failed' messages.
+    """
+    rendered, errors = [], {}
+    for document in batch:
+        try:
+            rendered.append((document, *render_message(document)))
+        except (KeyError, ValueError) as error:
+            errors[document["_id"]] = error
+    results = sender.send_batch([message for _, message, _ in rendered]) if rendered else []
+    sent = []
+    for (document, _, log), error in zip(rendered, results):
+        if error is None:
+            sent.append((document, log))
+        else:
+            errors[document["_id"]] = error
+
+    if sent:
+        db.logs.insert_many([log.model_dump() for _, log in sent])
+        db[OUTBOX_COLLECTION].delete_many({"_id": {"$in": [document["_id"] for document, _ in sent]}})
+
+    now, operations, failed = datetime.now(timezone.utc), [], 0
+    for document in batch:
+        if document["_id"] not in errors:
+            continue
+        attempts = document.get("attempts", 0) + 1
+        update = {"attempts": attempts, "last_error": str(errors[document["_id"]])}
+        if attempts >= max_attempts:
+            update["status"] = "failed"
+            failed += 1
+        else:
+            update["status"] = "pending"
+            update["available_at"] = now + timedelta(seconds=retry_seconds * 2 ** (attempts - 1))
+        operations.append(UpdateOne({"_id": document["_id"]}, {"$set": update, "$unset": {"claim": ""}}))
+    if operations:
+        db[OUTBOX_COLLECTION].bulk_write(operations, ordered=False)
+    return {"sent": len(sent), "retried": len(operations) - failed, "failed": failed}
+
+
+outbox = Outbox(use_transactions=OUTBOX_TRANSACTIONS_ENABLED)
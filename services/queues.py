@@ -0,0 +1,105 @@
+"""
+Report the depth of the Celery queues and the workers consuming them, to size the worker pools.
+
+For every queue: the messages waiting in the broker, the workers consuming it and their total
+concurrency. With --watch, the queues are sampled again after the given number of seconds and the
+net change per second is shown: a queue that keeps growing needs more concurrency.
+
+Usage:
+    python -m services.queues [--watch SECONDS] [--json]
+"""
+
+import argparse
+import json
+import time
+
+from config.celery import celery_app
+
+
+def queue_depths(app=celery_app) -> dict[str, int]:
+    """
+    Count the messages waiting in each queue of the app, all priorities included.
+
+    Returns:
+        dict[str, int]: Waiting messages by queue name; 0 for queues the broker does not have yet.
+    """
+    depths = {}
+    with app.connection_for_read() as connection:
+        for queue in app.conf.task_queues:
+            # A failed passive declare closes the channel on some brokers: use one per queue.
+            with connection.channel() as channel:
+                try:
+                    depths[queue.name] = channel.queue_declare(queue.name, passive=True).message_count
+                except connection.channel_errors:
+                    depths[queue.name] = 0
+    return depths
+
+
+def queue_consumers(app=celery_app, timeout: float = 1.0) -> dict[str, dict]:
+    """
+    Ask the running workers which queues they consume and with how many processes or threads.
+
+    Returns:
+        dict[str, dict]: For each consumed queue, its 'workers' (names) and total 'concurrency'.
+    """
+    inspect = app.control.inspect(timeout=timeout)
+    active_queues = inspect.active_queues() or {}
+    stats = inspect.stats() or {}
+    consumers: dict[str, dict] = {}
+    for worker, queues in active_queues.items():
+        concurrency = stats.get(worker, {}).get("pool", {}).get("max-concurrency", 0)
+        for queue in queues:
+            entry = consumers.setdefault(queue["name"], {"workers": [], "concurrency": 0})
+            entry["workers"].append(worker)
+            entry["concurrency"] += concurrency
+    return consumers
+
+
+def queue_report(app=celery_app, watch: float = 0) -> list[dict]:
+    """
+    Build the report rows, one per queue of the app.
+
+    Args:
+        watch (float): Seconds between two depth samples; 0 takes a single sample.
+
+    Returns:
+        list[dict]: 'queue', 'waiting', 'workers', 'concurrency' and, when watching, 'per_second'.
+    """
+    depths = queue_depths(app)
+    consumers = queue_consumers(app)
+    if watch:
+        time.sleep(watch)
+        later = queue_depths(app)
+    rows = []
+    for name, waiting in depths.items():
+        entry = consumers.get(name, {"workers": [], "concurrency": 0})
+        row = {
+            "queue": name,
+            "waiting": waiting,
+            "workers": len(entry["workers"]),
+            "concurrency": entry["concurrency"],
+        }
+        if watch:
+            row["waiting"] = later[name]
+            row["per_second"] = round((later[name] - waiting) / watch, 2)
+        rows.append(row)
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report Celery queue depths and their workers.")
+    parser.add_argument("--watch", type=float, default=0, help="sample again after SECONDS and show the trend")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args()
+    rows = queue_report(watch=args.watch)
+    if args.json:
+        print(json.dumps(rows, indent=2))
+        return
+    print(f"{'queue':<14}{'waiting':>9}{'workers':>9}{'concurrency':>13}" + (f"{'per sec':>10}" if args.watch else ""))
+    for row in rows:
+        line = f"{row['queue']:<14}{row['waiting']:>9}{row['workers']:>9}{row['concurrency']:>13}"
+        print(line + (f"{row['per_second']:>10}" if args.watch else ""))
+
+
+if __name__ == "__main__":
+    main()
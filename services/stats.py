@@ -0,0 +1,181 @@
+"""
+Incrementally maintained article statistics.
+
+The 'article_stats' collection holds one counter document per dimension value: '_id' "total" for
+the whole collection, and "tag:<tag>", "author:<id>" and "day:<YYYY-MM-DD>" (creation day) with
+their 'kind' and 'key'. Every document counts 'articles' and their 'words'; the total also counts
+'analyzed' articles. Writes to articles describe their effect in a StatsDelta, which is applied
+as '$inc' upserts in one unordered bulk write, so reading the statistics never touches the
+articles themselves. reconcile_operations repairs counters that drifted (e.g. after a failed or
+racing write) from a full recount.
+
+The counters only count the articles written since they were deployed until a first full recount
+seeded them. That recount leaves the STATS_RECONCILED_CHECKPOINT document in 'checkpoints', which
+the '$inc' upserts never write: readers that need exact figures fall back to the articles until it
+exists, and Celery beat starts the recount on startup while it is missing.
+"""
+
+import asyncio
+from collections import Counter, defaultdict
+
+from pymongo import DeleteOne, ReplaceOne, UpdateOne
+
+STATS_COLLECTION = "article_stats"
+STATS_TOTAL_ID = "total"
+STATS_RECONCILED_CHECKPOINT = "article_stats_reconciled"
+
+
+def count_words(text: str | None) -> int:
+    """
+    Count the words of an article's content, the same way the analysis does.
+    """
+    return len(text.split()) if text else 0
+
+
+def stat_keys(article: dict) -> list[tuple[str, str]]:
+    """
+    List the (kind, key) pairs an article is counted under, besides the total.
+    """
+    keys = [("tag", tag) for tag in set(article.get("tags") or [])]
+    if article.get("author"):
+        keys.append(("author", str(article["author"])))
+    if article.get("created_at"):
+        keys.append(("day", str(article["created_at"])[:10]))
+    return keys
+
+
+class StatsDelta:
+    """
+    Accumulates counter changes caused by article writes, keyed by statistics document.
+    """
+
+    def __init__(self):
+        self.counts = defaultdict(Counter)
+        self.labels = {}
+
+    def _add(self, article: dict, **changes):
+        self.counts[STATS_TOTAL_ID].update(changes)
+        for kind, key in stat_keys(article):
+            stat_id = f"{kind}:{key}"
+            self.labels[stat_id] = (kind, key)
+            self.counts[stat_id].update(changes)
+
+    def add_article(self, article: dict, sign: int = 1):
+        """
+        Count a created (sign=1) or deleted (sign=-1) article.
+
+        Args:
+            article (dict): The article document; needs 'content', 'tags', 'author', 'created_at'
+                and, for deletes, 'analysis'.
+            sign (int): 1 for a created article, -1 for a deleted one.
+        """
+        self._add(article, articles=sign, words=sign * count_words(article.get("content")))
+        if article.get("analysis"):
+            self.add_analyzed(sign)
+
+    def add_words(self, article: dict, words: int):
+        """
+        Count a change of an article's word count, e.g. after its content was updated.
+        """
+        if words:
+            self._add(article, words=words)
+
+    def add_analyzed(self, count: int = 1):
+        """
+        Count articles that got their first analysis.
+        """
+        self.counts[STATS_TOTAL_ID].update(analyzed=count)
+
+    def operations(self) -> list[UpdateOne]:
+        """
+        Build the '$inc' upserts applying the accumulated changes.
+        """
+        operations = []
+        for stat_id, counts in self.counts.items():
+            increments = {field: value for field, value in counts.items() if value}
+            if not increments:
+                continue
+            update = {"$inc": increments}
+            if stat_id in self.labels:
+                kind, key = self.labels[stat_id]
+                update["$setOnInsert"] = {"kind": kind, "key": key}
+            operations.append(UpdateOne({"_id": stat_id}, update, upsert=True))
+        return operations
+
+
+async def record_stats(articles_collection, delta: StatsDelta):
+    """
+    Apply a StatsDelta to the statistics of an articles collection.
+    """
+    operations = delta.operations()
+    if operations:
+        await articles_collection.database[STATS_COLLECTION].bulk_write(operations, ordered=False)
+
+
+def reconcile_operations(recount: StatsDelta, existing: list[dict]) -> list:
+    """
+    Compare a full recount with the stored statistics and build the writes repairing them.
+
+    Args:
+        recount (StatsDelta): Every article counted once with add_article.
+        existing (list[dict]): The stored statistics documents.
+
+    Returns:
+        list: ReplaceOne upserts for wrong or missing counters and DeleteOne for counters of
+            values no article has anymore.
+    """
+    stored = {document["_id"]: document for document in existing}
+    operations = []
+    for stat_id, counts in recount.counts.items():
+        document = {"articles": counts["articles"], "words": counts["words"]}
+        if stat_id == STATS_TOTAL_ID:
+            document["analyzed"] = counts["analyzed"]
+        else:
+            document["kind"], document["key"] = recount.labels[stat_id]
+        if stored.pop(stat_id, None) != {"_id": stat_id, **document}:
+            operations.append(ReplaceOne({"_id": stat_id}, document, upsert=True))
+    operations.extend(DeleteOne({"_id": stat_id}) for stat_id in stored)
+    return operations
+
+
+async def stats_reconciled(database) -> bool:
+    """
+    Tell whether the statistics of a database were seeded by a full recount.
+    """
+    return await database.checkpoints.find_one({"_id": STATS_RECONCILED_CHECKPOINT}, {"_id": 1}) is not None
+
+
+async def read_stats(articles_collection, limit: int, days: int) -> dict:
+    """
+    Read the totals, the top tags and authors by article count and the latest creation days.
+
+    The four reads run concurrently and each one is served by the (kind, ...) indexes of the
+    statistics collection, so the cost does not depend on the number of articles.
+
+    Args:
+        articles_collection: MongoDB collection for articles.
+        limit (int): Number of tags and of authors to return.
+        days (int): Number of latest days to return.
+
+    Returns:
+        dict: 'total' with the collection-wide counters, and 'tags', 'authors' and 'days' lists.
+    """
+    stats = articles_collection.database[STATS_COLLECTION]
+    projection = {"_id": 0, "key": 1, "articles": 1, "words": 1}
+
+    def top(kind: str, sort: list, length: int):
+        cursor = stats.find({"kind": kind, "articles": {"$gt": 0}}, projection).sort(sort).limit(length)
+        return cursor.to_list(length=length)
+
+    total, tags, authors, latest_days = await asyncio.gather(
+        stats.find_one({"_id": STATS_TOTAL_ID}, {"_id": 0}),
+        top("tag", [("articles", -1), ("key", 1)], limit),
+        top("author", [("articles", -1), ("key", 1)], limit),
+        top("day", [("key", -1)], days),
+    )
+    return {
+        "total": {"articles": 0, "words": 0, "analyzed": 0, **(total or {})},
+        "tags": tags,
+        "authors": authors,
+        "days": latest_days,
+    }
@@ -0,0 +1,120 @@
+"""
+Tag counts and prefix suggestions served from an in-process index.
+
+The counts come from the tag counters of the article statistics (see services.stats), which are
+maintained on every write; until a recount seeded them they are aggregated from the articles. Each process
+keeps a sorted snapshot of them, reloaded when older than TAG_INDEX_TTL_SECONDS, and answers
+prefix queries with a binary search over it without touching the database.
+"""
+
+import asyncio
+import bisect
+import heapq
+import time
+
+from config.settings import TAG_INDEX_TTL_SECONDS
+from services.stats import STATS_COLLECTION, stats_reconciled
+
+TAG_COUNTS_PIPELINE = [
+    {"$project": {"tags": {"$setUnion": [{"$ifNull": ["$tags", []]}, []]}}},
+    {"$unwind": "$tags"},
+    {"$group": {"_id": "$tags", "count": {"$sum": 1}}},
+]
+
+
+class TagIndex:
+    """
+    Immutable snapshot of tag counts, sorted for case-insensitive prefix search.
+
+    Attributes:
+        loaded_at (float): time.monotonic() of the load.
+    """
+
+    def __init__(self, counts: dict[str, int], loaded_at: float = 0.0):
+        self.loaded_at = loaded_at
+        entries = sorted((tag.lower(), tag, count) for tag, count in counts.items() if count > 0)
+        self._keys = [key for key, _, _ in entries]
+        self._entries = [(tag, count) for _, tag, count in entries]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def suggest(self, prefix: str | None, limit: int) -> list[tuple[str, int]]:
+        """
+        Return the most used tags starting with 'prefix' (all tags without one).
+
+        Args:
+            prefix (str | None): Case-insensitive tag prefix.
+            limit (int): Maximum number of tags.
+
+        Returns:
+            list[tuple[str, int]]: (tag, count) pairs, most used first, then alphabetically.
+        """
+        prefix = (prefix or "").lower()
+        start = bisect.bisect_left(self._keys, prefix)
+        end = bisect.bisect_left(self._keys, prefix + "\U0010ffff", lo=start) if prefix else len(self._keys)
+        return heapq.nsmallest(limit, self._entries[start:end], key=lambda entry: (-entry[1], entry[0]))
+
+
+async def load_tag_counts(articles_collection) -> dict[str, int]:
+    """
+    Read the number of articles per tag from the statistics counters.
+
+    Falls back to aggregating the articles until the statistics were seeded by a full recount:
+    before that, the counters only hold the tags of articles written since they were deployed.
+    """
+    stats = articles_collection.database[STATS_COLLECTION]
+    if not await stats_reconciled(articles_collection.database):
+        return {
+            document["_id"]: document["count"]
+            async for document in articles_collection.aggregate(TAG_COUNTS_PIPELINE)
+            if isinstance(document["_id"], str)
+        }
+    cursor = stats.find({"kind": "tag", "articles": {"$gt": 0}}, {"_id": 0, "key": 1, "articles": 1})
+    return {document["key"]: document["articles"] async for document in cursor}
+
+
+class TagIndexHolder:
+    """
+    Holds the current TagIndex of the process and reloads it once it is older than the TTL.
+
+    Concurrent requests arriving while the index is stale share a single reload.
+
+    Attributes:
+        ttl (float): Maximum age of the index in seconds.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._index: TagIndex | None = None
+        self._loading: asyncio.Future | None = None
+
+    def _fresh(self) -> bool:
+        return self._index is not None and time.monotonic() - self._index.loaded_at < self.ttl
+
+    async def get(self, articles_collection) -> TagIndex:
+        if self._fresh():
+            return self._index
+        if self._loading is not None:
+            return await asyncio.shield(self._loading)
+
+        future = self._loading = asyncio.get_running_loop().create_future()
+        try:
+            self._index = TagIndex(await load_tag_counts(articles_collection), time.monotonic())
+            future.set_result(self._index)
+            return self._index
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as error:
+            future.set_exception(error)
+            future.exception()  # mark as retrieved when nobody else was waiting
+            raise
+        finally:
+            self._loading = None
+
+    def clear(self):
+        self._index = None
+
+
+tag_index = TagIndexHolder(ttl=TAG_INDEX_TTL_SECONDS)
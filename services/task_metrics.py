@@ -0,0 +1,45 @@
+import os
+import time
+
+from celery.signals import before_task_publish, task_postrun, task_prerun, worker_init, worker_process_shutdown
+from prometheus_client import multiprocess, start_http_server
+
+from config.metrics import CELERY_QUEUE_WAIT, CELERY_TASK_DURATION, build_registry
+from config.settings import CELERY_METRICS_PORT
+
+_started: dict[str, float] = {}
+
+
+@before_task_publish.connect
+def stamp_published_at(headers=None, **kwargs):
+    # Wall-clock time, since publisher and worker are different processes (possibly hosts).
+    if headers is not None:
+        headers.setdefault("published_at", time.time())
+
+
+@task_prerun.connect
+def record_task_start(task_id=None, task=None, **kwargs):
+    _started[task_id] = time.perf_counter()
+    published_at = getattr(task.request, "published_at", None)
+    if published_at is not None:
+        CELERY_QUEUE_WAIT.labels(task.name).observe(max(0.0, time.time() - published_at))
+
+
+@task_postrun.connect
+def record_task_end(task_id=None, task=None, state=None, **kwargs):
+    started = _started.pop(task_id, None)
+    if started is not None:
+        CELERY_TASK_DURATION.labels(task.name, state or "UNKNOWN").observe(time.perf_counter() - started)
+
+
+@worker_init.connect
+def start_metrics_server(**kwargs):
+    # Prefork children only share their metrics through PROMETHEUS_MULTIPROC_DIR.
+    if CELERY_METRICS_PORT:
+        start_http_server(CELERY_METRICS_PORT, registry=build_registry())
+
+
+@worker_process_shutdown.connect
+def mark_worker_process_dead(pid=None, **kwargs):
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        multiprocess.mark_process_dead(pid or os.getpid())
@@ -1,51 +1,235 @@
+from collections import Counter
+from datetime import datetime, timezone
+
 from bson import ObjectId
 from celery import shared_task
-from pymongo import MongoClient
+from pymongo import DeleteOne, UpdateOne
 
-from config.settings import DB_NAME, DB_URL
+from config.settings import (
+    ANALYSIS_BATCH_SIZE,
+    OUTBOX_BATCH_SIZE,
+    OUTBOX_CLAIM_TIMEOUT_SECONDS,
+    OUTBOX_MAX_ATTEMPTS,
+    OUTBOX_MAX_BATCHES,
+    OUTBOX_RETRY_SECONDS,
+)
 from models.log import Log
+from services import task_metrics  # noqa: F401  (connects the Celery metrics signal handlers)
+from services.db import get_db
+from services.mailer import get_sender, welcome_email
+from services.outbox import claim_batch, deliver_batch
+from services.stats import (
+    STATS_COLLECTION,
+    STATS_RECONCILED_CHECKPOINT,
+    STATS_TOTAL_ID,
+    StatsDelta,
+    count_words,
+    reconcile_operations,
+)
+
+BULK_ANALYSIS_CHECKPOINT = "analyze_articles_bulk"
+# Matches articles without an analysis (missing, null or empty), i.e. not counted as analyzed.
+UNANALYZED = {"$in": [None, {}]}
+
+# Message priorities within a queue; the Redis broker serves lower numbers first. Analyses started
+# for a single article are waited on by a user, those fanned out by bulk requests are not.
+DEFAULT_PRIORITY = 0
+BULK_PRIORITY = 6
+
 
+def compute_analysis(article: dict) -> dict:
+    """
+    Compute the analysis of an article: its word count and number of unique tags.
+    """
+    return {"word_count": count_words(article["content"]), "unique_tags": len(set(article.get("tags") or []))}
 
-@shared_task
+
+# Execution profiles: tasks that are safe to run twice are acknowledged once they finished
+# (acks_late), so a crashed worker's task is redelivered instead of lost. Welcome emails are
+# acknowledged on receipt, since sending one twice is worse than not at all. Results that nobody
+# reads are not stored in the result backend.
+@shared_task(ignore_result=True)
 def send_welcome_email(email: str, name: str):
     """
     Celery task to send a welcome email to a new user.
-    Writes a log entry to the 'logs' collection in MongoDB.
+    Registrations now go through the outbox (see drain_outbox); this task still delivers
+    messages published before. Writes a log entry to the 'logs' collection in MongoDB.
     """
+    (error,) = get_sender().send_batch([welcome_email(email, name)])
+    if error is not None:
+        raise error
     log_line = f"Welcome email sent to {email} ({name})"
-    client = MongoClient(DB_URL)
-    db = client[DB_NAME]
-    db.logs.insert_one({"type": "user", "message": log_line})
+    db = get_db()
+    log = Log(type="user", message=log_line)
+    db.logs.insert_one(log.model_dump())
 
 
-@shared_task
+@shared_task(acks_late=True, ignore_result=True)
+def drain_outbox():
+    """
+    Celery task to deliver pending outbox messages (welcome emails) in batches.
+    Claims up to OUTBOX_MAX_BATCHES batches of OUTBOX_BATCH_SIZE messages, sends each batch
+    through the configured sender and bulk-inserts the log records of the delivered ones.
+    Stops early once no message is due. Returns the number of sent, retried and failed messages.
+    """
+    db = get_db()
+    sender = get_sender()
+    totals = Counter(sent=0, retried=0, failed=0)
+    for _ in range(OUTBOX_MAX_BATCHES):
+        batch = claim_batch(db, OUTBOX_BATCH_SIZE, OUTBOX_CLAIM_TIMEOUT_SECONDS)
+        if not batch:
+            break
+        totals.update(deliver_batch(db, sender, batch, OUTBOX_MAX_ATTEMPTS, OUTBOX_RETRY_SECONDS))
+    return dict(totals)
+
+
+@shared_task(acks_late=True)
 def analyze_article(article_id: str):
     """
     Celery task to analyze an article.
     Calculates word count and number of unique tags, then updates the article document
-    in the database with the analysis results.
+    in the database with the analysis results. The first analysis of an article is counted
+    in the article statistics. Returns the analysis, or None if the article does not exist.
     """
-    client = MongoClient(DB_URL)
-    db = client[DB_NAME]
+    db = get_db()
     article = db.articles.find_one({"_id": ObjectId(article_id)})
     if not article:
-        return
-    word_count = len(article["content"].split())
-    unique_tags = len(set(article.get("tags", [])))
-    db.articles.update_one(
-        {"_id": ObjectId(article_id)}, {"$set": {"analysis": {"word_count": word_count, "unique_tags": unique_tags}}}
+        return None
+    analysis = compute_analysis(article)
+    update = {"$set": {"analysis": analysis}}
+    # Only the run that actually turns an unanalyzed article into an analyzed one counts it, even
+    # when the task runs twice at once (concurrent requests, redelivery under acks_late).
+    if db.articles.update_one({"_id": article["_id"], "analysis": UNANALYZED}, update).modified_count:
+        _record_analyzed(db, 1)
+    else:
+        db.articles.update_one({"_id": article["_id"]}, update)
+    return analysis
+
+
+def _record_analyzed(db, count: int):
+    delta = StatsDelta()
+    delta.add_analyzed(count)
+    db[STATS_COLLECTION].bulk_write(delta.operations(), ordered=False)
+
+
+def _analyze_batch(db, batch: list[dict], tag_counts: Counter) -> int:
+    """
+    Write the analysis of a batch of articles with a single unordered bulk_write,
+    then move the checkpoint past the batch. Returns the word count of the batch.
+    """
+    first, operations, word_count = [], [], 0
+    for article in batch:
+        analysis = compute_analysis(article)
+        word_count += analysis["word_count"]
+        tag_counts.update(set(article.get("tags") or []))
+        update = {"$set": {"analysis": analysis}}
+        if article.get("analysis"):
+            operations.append(UpdateOne({"_id": article["_id"]}, update))
+        else:
+            first.append((article["_id"], update))
+    # As in analyze_article, first analyses are counted from the conditional writes that applied.
+    first_analyses = 0
+    if first:
+        conditional = [UpdateOne({"_id": _id, "analysis": UNANALYZED}, update) for _id, update in first]
+        first_analyses = db.articles.bulk_write(conditional, ordered=False).modified_count
+        if first_analyses < len(first):
+            operations.extend(UpdateOne({"_id": _id}, update) for _id, update in first)
+    if operations:
+        db.articles.bulk_write(operations, ordered=False)
+    if first_analyses:
+        _record_analyzed(db, first_analyses)
+    db.checkpoints.update_one(
+        {"_id": BULK_ANALYSIS_CHECKPOINT},
+        {"$set": {"last_id": batch[-1]["_id"], "updated_at": datetime.now(timezone.utc)}},
+        upsert=True,
     )
+    return word_count
+
+
+@shared_task(acks_late=True)
+def analyze_articles_bulk(batch_size: int = ANALYSIS_BATCH_SIZE, restart: bool = False):
+    """
+    Celery task to (re)analyze every article in batches.
+    Streams articles in '_id' order with a cursor and writes each batch back with one bulk_write.
+    After every batch the last processed '_id' is checkpointed, so an interrupted run resumes where
+    it stopped; pass restart=True to ignore the checkpoint. The checkpoint is removed once the whole
+    collection has been processed. Returns the number of processed articles and, over all of them,
+    the total word count and how many articles carry each tag.
+    """
+    db = get_db()
+    query = {}
+    checkpoint = None if restart else db.checkpoints.find_one({"_id": BULK_ANALYSIS_CHECKPOINT})
+    if checkpoint:
+        query["_id"] = {"$gt": checkpoint["last_id"]}
+    cursor = db.articles.find(query, {"content": 1, "tags": 1, "analysis": 1}).sort("_id", 1).batch_size(batch_size)
+    processed, total_words, tag_counts, batch = 0, 0, Counter(), []
+    for article in cursor:
+        batch.append(article)
+        if len(batch) >= batch_size:
+            total_words += _analyze_batch(db, batch, tag_counts)
+            processed += len(batch)
+            batch = []
+    if batch:
+        total_words += _analyze_batch(db, batch, tag_counts)
+        processed += len(batch)
+    db.checkpoints.delete_one({"_id": BULK_ANALYSIS_CHECKPOINT})
+    return {
+        "processed": processed,
+        "resumed_after": str(checkpoint["last_id"]) if checkpoint else None,
+        "total_words": total_words,
+        "tag_counts": dict(tag_counts),
+    }
 
 
-@shared_task
+@shared_task(acks_late=True, ignore_result=True)
 def log_articles_count_task():
     """
     Celery task to periodically log the total number of articles.
-    Writes a log entry to the 'logs' collection in MongoDB.
+    The count is read from the article statistics, falling back to counting the collection
+    until they were seeded by reconcile_article_stats. Writes a log entry to the 'logs' collection
+    in MongoDB.
     """
-    client = MongoClient(DB_URL)
-    db = client[DB_NAME]
-    count = db.articles.count_documents({})
+    db = get_db()
+    total = None
+    if stats_reconciled(db):
+        total = db[STATS_COLLECTION].find_one({"_id": STATS_TOTAL_ID}, {"articles": 1})
+    count = total["articles"] if total else db.articles.count_documents({})
     log_line = f"[Celery Beat] Total articles in DB: {count}"
     log = Log(type="article", message=log_line)
     db.logs.insert_one(log.model_dump())
+
+
+def stats_reconciled(db) -> bool:
+    """
+    Tell whether reconcile_article_stats has seeded the article statistics at least once.
+    """
+    return db.checkpoints.find_one({"_id": STATS_RECONCILED_CHECKPOINT}, {"_id": 1}) is not None
+
+
+@shared_task(acks_late=True, ignore_result=True)
+def reconcile_article_stats():
+    """
+    Celery task to repair drift of the incrementally maintained article statistics.
+    Recounts every article in one streamed pass and rewrites only the counters that differ,
+    removing counters of tags, authors or days no article has anymore. Counter increments
+    made while the recount runs may be overwritten; the next run corrects them. Marks the
+    statistics as seeded once done (see stats_reconciled).
+    Returns the number of counted articles and of repaired and removed counters.
+    """
+    db = get_db()
+    recount = StatsDelta()
+    projection = {"_id": 0, "content": 1, "tags": 1, "author": 1, "created_at": 1, "analysis": 1}
+    for article in db.articles.find({}, projection).batch_size(ANALYSIS_BATCH_SIZE):
+        recount.add_article(article)
+    operations = reconcile_operations(recount, list(db[STATS_COLLECTION].find()))
+    if operations:
+        db[STATS_COLLECTION].bulk_write(operations, ordered=False)
+    db.checkpoints.update_one(
+        {"_id": STATS_RECONCILED_CHECKPOINT}, {"$set": {"updated_at": datetime.now(timezone.utc)}}, upsert=True
+    )
+    removed = sum(isinstance(operation, DeleteOne) for operation in operations)
+    return {
+        "articles": recount.counts[STATS_TOTAL_ID]["articles"],
+        "repaired": len(operations) - removed,
+        "removed": removed,
+    }
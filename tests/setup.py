@@ -3,9 +3,13 @@ import os
 from fastapi import FastAPI
 from motor.motor_asyncio import AsyncIOMotorClient
 
+from config.db import mongo_client_options
+from config.indexes import ensure_indexes
+from config.metrics import MetricsMiddleware
 from config.settings import DB_URL, LOGS_DIR
 from routers.articles import router as articles_router
 from routers.auth import router as auth_router
+from routers.metrics import router as metrics_router
 
 
 class TestMongoDBConnector:
@@ -13,8 +17,9 @@ class TestMongoDBConnector:
         self.app = app
 
     async def startup_db_client(self):
-        self.app.mongodb_client = AsyncIOMotorClient(DB_URL)
+        self.app.mongodb_client = AsyncIOMotorClient(DB_URL, **mongo_client_options())
         self.app.mongodb = self.app.mongodb_client["Test"]
+        await ensure_indexes(self.app.mongodb)
 
     async def shutdown_db_client(self):
         self.app.mongodb_client.close()
@@ -25,6 +30,8 @@ os.makedirs(LOGS_DIR, exist_ok=True)
 app = FastAPI()
 app.include_router(auth_router)
 app.include_router(articles_router)
+app.add_middleware(MetricsMiddleware)
+app.include_router(metrics_router)
 
 db_connector = TestMongoDBConnector(app)
 app.add_event_handler("startup", db_connector.startup_db_client)
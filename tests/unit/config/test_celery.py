@@ -0,0 +1,14 @@
+from unittest.mock import patch
+
+from config.celery import seed_article_stats
+
+
+def test_beat_seeds_stats_until_reconciled():
+    with (
+        patch("config.celery.get_db"),
+        patch("services.tasks.stats_reconciled", side_effect=[False, True]),
+        patch("services.tasks.reconcile_article_stats.delay") as delay,
+    ):
+        seed_article_stats()
+        seed_article_stats()
+    assert delay.call_count == 1
@@ -0,0 +1,32 @@
+from unittest.mock import patch
+
+from pymongo.read_preferences import SecondaryPreferred
+
+from config import db
+from config.metrics import mongo_command_metrics, mongo_pool_metrics
+
+
+def test_mongo_client_options_defaults():
+    options = db.mongo_client_options(max_pool_size=50, min_pool_size=5)
+    assert options["maxPoolSize"] == 50
+    assert options["minPoolSize"] == 5
+    assert options["event_listeners"] == [mongo_command_metrics, mongo_pool_metrics]
+    # Unset timeouts and compressors are left to DB_URL and the driver.
+    assert "compressors" not in options
+    assert "waitQueueTimeoutMS" not in options
+
+
+def test_mongo_client_options_configured():
+    with (
+        patch.object(db, "MONGO_COMPRESSORS", "zstd,snappy,zlib"),
+        patch.object(db, "MONGO_WAIT_QUEUE_TIMEOUT_MS", 250),
+        patch.object(db, "MONGO_RETRY_READS", False),
+    ):
+        options = db.mongo_client_options()
+    assert options["compressors"] == "zstd,snappy,zlib"
+    assert options["waitQueueTimeoutMS"] == 250
+    assert options["retryReads"] is False
+
+
+def test_heavy_read_preference():
+    assert isinstance(db.HEAVY_READ_PREFERENCE, SecondaryPreferred)
@@ -0,0 +1,52 @@
+from pymongo import ASCENDING, IndexModel
+
+from config.indexes import INDEXES, diff_indexes, index_drift
+
+
+def test_diff_indexes_in_sync():
+    declared = [IndexModel([("email", ASCENDING)], name="users_email_unique", unique=True)]
+    existing = [
+        {"v": 2, "key": {"_id": 1}, "name": "_id_"},
+        {"v": 2, "key": {"email": 1.0}, "name": "users_email_unique", "unique": True},
+    ]
+    assert diff_indexes(declared, existing) == {"missing": [], "changed": [], "unexpected": []}
+
+
+def test_diff_indexes_reports_drift():
+    declared = [
+        IndexModel([("email", ASCENDING)], name="users_email_unique", unique=True),
+        IndexModel([("created_at", ASCENDING)], name="logs_created_at_ttl", expireAfterSeconds=60),
+    ]
+    existing = [
+        {"v": 2, "key": {"email": 1}, "name": "users_email_unique"},
+        {"v": 2, "key": {"name": 1}, "name": "name_1"},
+    ]
+    assert diff_indexes(declared, existing) == {
+        "missing": ["logs_created_at_ttl"],
+        "changed": ["users_email_unique"],
+        "unexpected": ["name_1"],
+    }
+
+
+def test_diff_indexes_text_index_compared_by_weights():
+    declared = [model for model in INDEXES["articles"] if model.document["name"] == "articles_text"]
+    existing = [
+        {
+            "v": 2,
+            "key": {"_fts": "text", "_ftsx": 1},
+            "name": "articles_text",
+            "weights": {"content": 1, "title": 3},
+            "default_language": "english",
+            "language_override": "language",
+            "textIndexVersion": 3,
+        }
+    ]
+    assert diff_indexes(declared, existing)["changed"] == []
+
+
+def test_registry_applied_at_startup(client):
+    """
+    The test app applies the registry on startup, so no declared index may be missing.
+    """
+    drift = client.portal.call(index_drift, client.app.mongodb)
+    assert all(report["missing"] == [] for report in drift.values())
@@ -0,0 +1,45 @@
+import json
+import logging
+
+from config.logger import BatchingRotatingFileHandler, JsonFormatter, get_logger, shutdown_logging, write_log
+
+
+def test_write_log_configures_handlers_once(tmp_path):
+    log_file = str(tmp_path / "general.log")
+    for i in range(5):
+        write_log(f"line {i}", log_file=log_file)
+    assert len(logging.getLogger(log_file).handlers) == 1
+    shutdown_logging()
+    lines = (tmp_path / "general.log").read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 5
+    assert lines[-1].endswith("INFO line 4")
+
+
+def test_json_log_lines(tmp_path):
+    log_file = str(tmp_path / "json.log")
+    get_logger(log_file, json_format=True).info("structured")
+    shutdown_logging()
+    record = json.loads((tmp_path / "json.log").read_text(encoding="utf-8"))
+    assert record["message"] == "structured"
+    assert record["level"] == "INFO"
+
+
+def test_batching_handler_flushes_in_batches_and_rotates(tmp_path):
+    log_file = tmp_path / "rotating.log"
+    handler = BatchingRotatingFileHandler(str(log_file), max_bytes=1000, backup_count=2, flush_every=3)
+    handler.setFormatter(JsonFormatter())
+    logger = logging.getLogger("test_batching_handler")
+    logger.addHandler(handler)
+    logger.propagate = False
+    try:
+        logger.warning("first")
+        assert log_file.read_text(encoding="utf-8") == ""
+        logger.warning("second")
+        logger.warning("third")
+        assert log_file.read_text(encoding="utf-8").count("\n") == 3
+        for i in range(20):
+            logger.warning(f"filler {i}")
+    finally:
+        logger.removeHandler(handler)
+        handler.close()
+    assert (tmp_path / "rotating.log.1").exists()
@@ -0,0 +1,72 @@
+from types import SimpleNamespace
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY, CollectorRegistry
+
+from config.metrics import MetricsMiddleware, MongoCommandMetrics, MongoPoolMetrics, StatsCollector
+
+
+def sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+def test_metrics_middleware_labels_route_template():
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware)
+
+    @app.get("/items/{item_id}")
+    async def read_item(item_id: str):
+        return {"id": item_id}
+
+    labels = {"method": "GET", "route": "/items/{item_id}", "status": "200"}
+    before = sample("http_request_duration_seconds_count", **labels)
+    with TestClient(app) as client:
+        client.get("/items/1")
+        client.get("/items/2")
+        client.get("/missing")
+    assert sample("http_request_duration_seconds_count", **labels) == before + 2
+    assert sample("http_request_duration_seconds_count", method="GET", route="<unmatched>", status="404") >= 1
+    assert sample("http_requests_in_flight", method="GET") == 0
+
+
+def test_mongo_command_metrics():
+    listener = MongoCommandMetrics()
+    labels = {"collection": "articles", "command": "find", "outcome": "success"}
+    before = sample("mongodb_command_duration_seconds_count", **labels)
+    event = SimpleNamespace(connection_id=("localhost", 27017), request_id=7, command_name="find")
+    listener.started(SimpleNamespace(**vars(event), command={"find": "articles", "filter": {}}))
+    listener.succeeded(SimpleNamespace(**vars(event), duration_micros=1500))
+    assert sample("mongodb_command_duration_seconds_count", **labels) == before + 1
+    assert listener._collections == {}
+
+
+def test_mongo_pool_metrics():
+    listener = MongoPoolMetrics()
+    before = sample("mongodb_pool_wait_seconds_count", outcome="success")
+    before_sum = sample("mongodb_pool_wait_seconds_sum", outcome="success")
+    checked_out = sample("mongodb_pool_checked_out_connections")
+    listener.connection_checked_out(SimpleNamespace(duration=0.25))
+    assert sample("mongodb_pool_checked_out_connections") == checked_out + 1
+    listener.connection_checked_in(SimpleNamespace())
+    listener.connection_check_out_failed(SimpleNamespace(reason="timeout", duration=1.0))
+    assert sample("mongodb_pool_wait_seconds_count", outcome="success") == before + 1
+    assert sample("mongodb_pool_wait_seconds_sum", outcome="success") == before_sum + 0.25
+    assert sample("mongodb_pool_wait_seconds_count", outcome="timeout") >= 1
+    assert sample("mongodb_pool_checked_out_connections") == checked_out
+
+
+def test_stats_collector():
+    cache_stats = {"hits": 3, "misses": 1, "size": 2, "maxsize": 10}
+    collector = StatsCollector(
+        lambda: {"l1": {"article": cache_stats}, "l2": {"hits": 5, "misses": 6}},
+        lambda: {"users": cache_stats},
+        lambda: {"in_flight": 1, "queue_depth": 2, "rejected": 4},
+    )
+    registry = CollectorRegistry()
+    registry.register(collector)
+    assert registry.get_sample_value("cache_hits_total", {"cache": "response_l1_article"}) == 3
+    assert registry.get_sample_value("cache_misses_total", {"cache": "response_l2"}) == 6
+    assert registry.get_sample_value("cache_entries", {"cache": "auth_users"}) == 2
+    assert registry.get_sample_value("hashing_pool_queue_depth") == 2
+    assert registry.get_sample_value("hashing_pool_rejected_total") == 4
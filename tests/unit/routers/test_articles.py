@@ -1,10 +1,16 @@
-from unittest.mock import patch
+import csv
+import io
+import json
+from unittest.mock import MagicMock, patch
 
 import pytest
 from bson import ObjectId
 from fastapi import HTTPException, status
 
+from config.settings import BULK_MAX_OPERATIONS
+from services.tags import TagIndexHolder
 from utils.id import check_correct_id
+from utils.pagination import decode_cursor, encode_cursor
 
 
 def test_create_article(client, auth_token):
@@ -28,7 +34,143 @@ def test_list_articles(client, auth_token):
     headers = {"Authorization": f"Bearer {auth_token}"}
     response = client.get("/api/v1/articles/", headers=headers)
     assert response.status_code == status.HTTP_200_OK
-    assert isinstance(response.json(), list)
+    data = response.json()
+    assert isinstance(data["items"], list)
+    assert "next_cursor" in data
+
+
+def test_list_articles_cursor_pagination(client, authorized_user):
+    """
+    Test walking through articles page by page with the next_cursor token.
+    """
+    created_ids = []
+    for i in range(3):
+        payload = {"title": f"Paged {i}", "content": "Paged content.", "tags": ["pagination"]}
+        response = client.post("/api/v1/articles/", json=payload, headers=authorized_user)
+        created_ids.append(response.json()["id"])
+
+    first = client.get("/api/v1/articles/?tags=pagination&limit=2", headers=authorized_user).json()
+    assert len(first["items"]) == 2
+    assert first["next_cursor"] is not None
+
+    second = client.get(
+        f"/api/v1/articles/?tags=pagination&limit=2&cursor={first['next_cursor']}", headers=authorized_user
+    ).json()
+    seen = [article["id"] for article in first["items"] + second["items"]]
+    assert len(seen) == len(set(seen))
+    assert set(created_ids) <= set(seen)
+
+
+def test_list_articles_invalid_cursor(client, authorized_user):
+    response = client.get("/api/v1/articles/?cursor=not-a-cursor", headers=authorized_user)
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json()["detail"] == "Invalid cursor"
+
+
+def test_list_articles_limit_above_maximum(client, authorized_user):
+    response = client.get("/api/v1/articles/?limit=100000", headers=authorized_user)
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+def test_list_articles_search_ranked(client, authorized_user):
+    """
+    Test that search goes through the text index and returns scored results, title matches first.
+    """
+    client.post(
+        "/api/v1/articles/",
+        json={"title": "Zebrafish notes", "content": "Zebrafish care.", "tags": []},
+        headers=authorized_user,
+    )
+    client.post(
+        "/api/v1/articles/",
+        json={"title": "Aquarium notes", "content": "Mentions zebrafish once.", "tags": []},
+        headers=authorized_user,
+    )
+    response = client.get("/api/v1/articles/?search=zebrafish", headers=authorized_user)
+    assert response.status_code == status.HTTP_200_OK
+    items = response.json()["items"]
+    assert len(items) >= 2
+    assert all(item["score"] is not None for item in items)
+    assert items[0]["title"] == "Zebrafish notes"
+    assert items[0]["score"] >= items[-1]["score"]
+
+
+def test_list_articles_search_regex_metacharacters(client, authorized_user):
+    response = client.get("/api/v1/articles/?search=(a%2B)%2B$", headers=authorized_user)
+    assert response.status_code == status.HTTP_200_OK
+
+
+def test_list_articles_summary_and_fields(client, authorized_user):
+    """
+    Test that lists return summaries by default and only the requested fields with 'fields'.
+    """
+    payload = {"title": "Sparse", "content": "word " * 100, "tags": ["sparse"]}
+    client.post("/api/v1/articles/", json=payload, headers=authorized_user)
+
+    summary = client.get("/api/v1/articles/?tags=sparse", headers=authorized_user).json()["items"][0]
+    assert "content" not in summary
+    assert summary["excerpt"] == payload["content"][: len(summary["excerpt"])]
+    assert summary["title"] == "Sparse"
+
+    sparse = client.get("/api/v1/articles/?tags=sparse&fields=title,tags", headers=authorized_user).json()["items"]
+    assert sparse[0].keys() == {"id", "title", "tags"}
+
+
+def test_list_articles_unknown_field(client, authorized_user):
+    response = client.get("/api/v1/articles/?fields=title,password", headers=authorized_user)
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json()["detail"] == "Unknown fields: password"
+
+
+def test_export_articles_ndjson(client, authorized_user):
+    """
+    Test streaming the filtered articles as newline-delimited JSON, in several batches.
+    """
+    created_ids = set()
+    for i in range(3):
+        payload = {"title": f"Exported {i}", "content": "Exported content.", "tags": ["export"]}
+        created_ids.add(client.post("/api/v1/articles/", json=payload, headers=authorized_user).json()["id"])
+
+    response = client.get("/api/v1/articles/export?tags=export&batch_size=2", headers=authorized_user)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"] == "application/x-ndjson"
+    exported = [json.loads(line) for line in response.text.splitlines()]
+    assert {article["id"] for article in exported} == created_ids
+    assert all(article["tags"] == ["export"] for article in exported)
+
+
+def test_export_articles_csv(client, authorized_user):
+    payload = {"title": "Exported csv", "content": "Line one, with a comma.", "tags": ["export-csv", "x"]}
+    article_id = client.post("/api/v1/articles/", json=payload, headers=authorized_user).json()["id"]
+
+    response = client.get("/api/v1/articles/export?tags=export-csv&format=csv", headers=authorized_user)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("text/csv")
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert len(rows) == 1
+    assert rows[0]["id"] == article_id
+    assert rows[0]["content"] == "Line one, with a comma."
+    assert rows[0]["tags"] == "export-csv,x"
+
+
+def test_cursor_round_trip():
+    object_id = ObjectId()
+    cursor = encode_cursor("2025-09-11T08:25:33.170069+00:00", object_id)
+    assert decode_cursor(cursor) == ("2025-09-11T08:25:33.170069+00:00", object_id)
+
+
+@pytest.mark.parametrize("value", [{"$ne": None}, ["2025-09-11"], True])
+def test_decode_cursor_rejects_non_scalar_values(value):
+    with pytest.raises(HTTPException) as error:
+        decode_cursor(encode_cursor(value, ObjectId()))
+    assert error.value.status_code == 400
+    assert error.value.detail == "Invalid cursor"
+
+
+def test_decode_cursor_checks_sort_field_type():
+    cursor = encode_cursor("2025-09-11T08:25:33.170069+00:00", ObjectId())
+    with pytest.raises(HTTPException):
+        decode_cursor(cursor, (int, float))
 
 
 def test_get_article(client, auth_token, created_article_id):
@@ -62,6 +204,97 @@ def test_update_article(client, auth_token, created_article_id):
     assert data["content"] == "Updated content."
 
 
+def test_update_article_if_match(client, authorized_user, created_article_id):
+    """
+    Test optimistic concurrency: an update based on a stale version is rejected.
+    """
+    payload = {"title": "Versioned", "content": "First edit."}
+    first = client.put(
+        f"/api/v1/articles/{created_article_id}/", json=payload, headers={**authorized_user, "If-Match": '"1"'}
+    )
+    assert first.status_code == status.HTTP_200_OK
+    assert first.json()["version"] == 2
+    assert first.headers["ETag"] == '"2"'
+
+    stale = client.put(
+        f"/api/v1/articles/{created_article_id}/", json=payload, headers={**authorized_user, "If-Match": '"1"'}
+    )
+    assert stale.status_code == status.HTTP_412_PRECONDITION_FAILED
+
+    stale_delete = client.delete(
+        f"/api/v1/articles/{created_article_id}/", headers={**authorized_user, "If-Match": '"1"'}
+    )
+    assert stale_delete.status_code == status.HTTP_412_PRECONDITION_FAILED
+    weak_delete = client.delete(
+        f"/api/v1/articles/{created_article_id}/", headers={**authorized_user, "If-Match": 'W/"2"'}
+    )
+    assert weak_delete.status_code == status.HTTP_412_PRECONDITION_FAILED
+    deleted = client.delete(f"/api/v1/articles/{created_article_id}/", headers={**authorized_user, "If-Match": '"2"'})
+    assert deleted.status_code == status.HTTP_204_NO_CONTENT
+
+
+def test_get_article_fields(client, authorized_user, created_article_id):
+    url = f"/api/v1/articles/{created_article_id}/"
+    full = client.get(url, headers=authorized_user)
+    partial = client.get(f"{url}?fields=title", headers=authorized_user)
+    assert partial.status_code == status.HTTP_200_OK
+    assert partial.json() == {"id": created_article_id, "title": full.json()["title"]}
+    assert partial.headers["ETag"] != full.headers["ETag"]
+
+
+def test_get_article_not_modified(client, authorized_user, created_article_id):
+    """
+    Test conditional GET of an article with If-None-Match.
+    """
+    url = f"/api/v1/articles/{created_article_id}/"
+    response = client.get(url, headers=authorized_user)
+    etag = response.headers["ETag"]
+    assert etag == '"1"'
+
+    not_modified = client.get(url, headers={**authorized_user, "If-None-Match": etag})
+    assert not_modified.status_code == status.HTTP_304_NOT_MODIFIED
+    assert not_modified.content == b""
+    assert not_modified.headers["ETag"] == etag
+
+    client.put(url, json={"title": "Changed", "content": "Changed."}, headers=authorized_user)
+    modified = client.get(url, headers={**authorized_user, "If-None-Match": etag})
+    assert modified.status_code == status.HTTP_200_OK
+    assert modified.headers["ETag"] == '"2"'
+
+
+def test_list_articles_not_modified(client, authorized_user):
+    url = "/api/v1/articles/?tags=conditional"
+    etag = client.get(url, headers=authorized_user).headers["ETag"]
+    not_modified = client.get(url, headers={**authorized_user, "If-None-Match": etag})
+    assert not_modified.status_code == status.HTTP_304_NOT_MODIFIED
+
+    payload = {"title": "Conditional", "content": "New article.", "tags": ["conditional"]}
+    client.post("/api/v1/articles/", json=payload, headers=authorized_user)
+    modified = client.get(url, headers={**authorized_user, "If-None-Match": etag})
+    assert modified.status_code == status.HTTP_200_OK
+    assert modified.headers["ETag"] != etag
+    assert len(modified.json()["items"]) == 1
+
+
+def test_get_article_cache_invalidated_on_update(client, authorized_user, created_article_id):
+    """
+    Test that a cached article is refreshed after it is updated.
+    """
+    url = f"/api/v1/articles/{created_article_id}/"
+    assert client.get(url, headers=authorized_user).json()["title"] == "Test article"
+    client.put(url, json={"title": "changed title", "content": "Changed."}, headers=authorized_user)
+    assert client.get(url, headers=authorized_user).json()["title"] == "Changed title"
+
+
+def test_list_articles_cache_invalidated_on_create(client, authorized_user):
+    url = "/api/v1/articles/?tags=cache-invalidation"
+    before = client.get(url, headers=authorized_user).json()["items"]
+    payload = {"title": "Cached list", "content": "Content.", "tags": ["cache-invalidation"]}
+    client.post("/api/v1/articles/", json=payload, headers=authorized_user)
+    after = client.get(url, headers=authorized_user).json()["items"]
+    assert len(after) == len(before) + 1
+
+
 def test_delete_article(client, auth_token, created_article_id):
     """
     Test deleting an article.
@@ -71,21 +304,147 @@ def test_delete_article(client, auth_token, created_article_id):
     assert response.status_code == status.HTTP_204_NO_CONTENT
 
 
+def test_bulk_articles(client, authorized_user, created_article_id, another_user_article_id):
+    """
+    Test a bulk request mixing successful and failing operations.
+    """
+    operations = [
+        {"op": "create", "article": {"title": "bulk one", "content": "Bulk content.", "tags": ["bulk"]}},
+        {"op": "update", "id": created_article_id, "article": {"title": "bulk edited", "content": "Edited."}},
+        {"op": "delete", "id": another_user_article_id},
+        {"op": "delete", "id": "68c510e07b0d53eff45954ff"},
+        {"op": "update", "id": "not_a_valid_id", "article": {"title": "x", "content": "y"}},
+    ]
+    with patch("services.bulk.group") as mock_group:
+        mock_group.return_value.apply_async.return_value.results = [MagicMock(id="job-1")]
+        response = client.post("/api/v1/articles/bulk", json={"operations": operations}, headers=authorized_user)
+        assert mock_group.call_count == 1
+    assert response.status_code == status.HTTP_200_OK
+    results = response.json()["results"]
+    assert [result["status"] for result in results] == [201, 200, 403, 404, 400]
+    assert results[0]["job_id"] == "job-1"
+
+    created = client.get(f"/api/v1/articles/{results[0]['id']}/", headers=authorized_user).json()
+    assert created["title"] == "Bulk one"
+    updated = client.get(f"/api/v1/articles/{created_article_id}/", headers=authorized_user).json()
+    assert updated["title"] == "Bulk edited"
+    assert client.get(f"/api/v1/articles/{another_user_article_id}/", headers=authorized_user).status_code == 200
+
+
+def test_article_stats_follow_writes(client, authorized_user):
+    """
+    Test that creating, updating and deleting an article moves the precomputed statistics.
+    """
+    before = client.get("/api/v1/articles/stats?limit=100", headers=authorized_user).json()
+    payload = {"title": "Stats", "content": "one two three", "tags": ["stats-tag"]}
+    article_id = client.post("/api/v1/articles/", json=payload, headers=authorized_user).json()["id"]
+
+    stats = client.get("/api/v1/articles/stats?limit=100", headers=authorized_user).json()
+    assert stats["total"]["articles"] == before["total"]["articles"] + 1
+    assert stats["total"]["words"] == before["total"]["words"] + 3
+    tag = next(entry for entry in stats["tags"] if entry["key"] == "stats-tag")
+    assert tag["words"] >= 3
+
+    update = {"title": "Stats", "content": "one"}
+    client.put(f"/api/v1/articles/{article_id}/", json=update, headers=authorized_user)
+    assert client.get("/api/v1/articles/stats", headers=authorized_user).json()["total"]["words"] == (
+        before["total"]["words"] + 1
+    )
+
+    client.delete(f"/api/v1/articles/{article_id}/", headers=authorized_user)
+    after = client.get("/api/v1/articles/stats", headers=authorized_user).json()
+    assert after["total"]["articles"] == before["total"]["articles"]
+    assert after["total"]["words"] == before["total"]["words"]
+
+
+def test_list_tags(client, authorized_user):
+    """
+    Test tag counts and prefix suggestions.
+    """
+    for tags in (["tagfacet-alpha", "tagfacet-beta"], ["tagfacet-alpha"]):
+        payload = {"title": "Tagged", "content": "Tagged content.", "tags": tags}
+        client.post("/api/v1/articles/", json=payload, headers=authorized_user)
+
+    with patch("routers.articles.tag_index", TagIndexHolder(ttl=0)):
+        response = client.get("/api/v1/articles/tags?prefix=TagFacet-&limit=5", headers=authorized_user)
+    assert response.status_code == status.HTTP_200_OK
+    items = response.json()["items"]
+    assert [item["tag"] for item in items[:2]] == ["tagfacet-alpha", "tagfacet-beta"]
+    assert items[0]["count"] >= items[1]["count"] + 1
+
+
+def test_bulk_articles_invalid_operation(client, authorized_user):
+    operations = [{"op": "create", "id": "68c510e07b0d53eff45954ff", "article": {"title": "x", "content": "y"}}]
+    response = client.post("/api/v1/articles/bulk", json={"operations": operations}, headers=authorized_user)
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+def test_bulk_articles_too_many_operations(client, authorized_user):
+    operations = [{"op": "delete", "id": "68c510e07b0d53eff45954ff"}] * (BULK_MAX_OPERATIONS + 1)
+    response = client.post("/api/v1/articles/bulk", json={"operations": operations}, headers=authorized_user)
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    assert response.json()["detail"][0]["type"] == "too_long"
+
+
 def test_analyze_article_mocked(client, auth_token, created_article_id):
     """
-    Test analyzing an article (Celery task is mocked, analysis field is set manually).
+    Test that analyzing an article enqueues a job and returns 202 without waiting for it.
     """
     headers = {"Authorization": f"Bearer {auth_token}"}
     with patch("services.tasks.analyze_article.delay") as mock_delay:
-        mock_delay.return_value.get.return_value = None
-        client.app.mongodb.articles.update_one(
-            {"_id": ObjectId(created_article_id)}, {"$set": {"analysis": {"word_count": 5, "unique_tags": 2}}}
-        )
+        mock_delay.return_value.id = "job-1"
         response = client.post(f"/api/v1/articles/{created_article_id}/analyze/", headers=headers)
-        assert response.status_code == status.HTTP_200_OK
-        data = response.json()
-        assert "analysis" in data
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        assert response.json() == {"job_id": "job-1", "status": "PENDING", "result": None, "error": None}
+        assert response.headers["Location"] == "/api/v1/articles/jobs/job-1/"
         mock_delay.assert_called_once_with(created_article_id)
+        mock_delay.return_value.get.assert_not_called()
+
+
+def test_analyze_article_not_found(client, authorized_user):
+    with patch("services.tasks.analyze_article.delay") as mock_delay:
+        response = client.post("/api/v1/articles/68c510e07b0d53eff45954ff/analyze/", headers=authorized_user)
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        mock_delay.assert_not_called()
+
+
+def test_analyze_articles_bulk_requires_admin(client, authorized_user):
+    with patch("services.tasks.analyze_articles_bulk.delay") as mock_delay:
+        response = client.post("/api/v1/articles/analyze/bulk/", headers=authorized_user)
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+        mock_delay.assert_not_called()
+
+
+def test_analyze_articles_bulk_admin(client, authorized_user):
+    with (
+        patch("utils.auth.ADMIN_EMAILS", {"testuser@example.com"}),
+        patch("services.tasks.analyze_articles_bulk.delay") as mock_delay,
+    ):
+        mock_delay.return_value.id = "bulk-job"
+        response = client.post("/api/v1/articles/analyze/bulk/?batch_size=100", headers=authorized_user)
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        assert response.json()["job_id"] == "bulk-job"
+        mock_delay.assert_called_once_with(batch_size=100, restart=False)
+
+
+def test_get_job_status_finished(client, authorized_user):
+    with patch("services.jobs.AsyncResult") as mock_result:
+        mock_result.return_value.state = "SUCCESS"
+        mock_result.return_value.result = {"word_count": 5, "unique_tags": 2}
+        response = client.get("/api/v1/articles/jobs/job-1/?wait=1", headers=authorized_user)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["result"] == {"word_count": 5, "unique_tags": 2}
+
+
+def test_stream_job_events(client, authorized_user):
+    with patch("services.jobs.AsyncResult") as mock_result:
+        mock_result.return_value.state = "FAILURE"
+        mock_result.return_value.result = ValueError("boom")
+        response = client.get("/api/v1/articles/jobs/job-1/events", headers=authorized_user)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"].startswith("text/event-stream")
+        assert "event: status" in response.text
+        assert '"error": "boom"' in response.text
 
 
 def test_check_correct_id_invalid():
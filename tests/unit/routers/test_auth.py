@@ -5,7 +5,7 @@ from fastapi import HTTPException, status
 from pydantic import ValidationError
 
 from models.auth import User
-from utils.auth import authenticate_user, get_current_user
+from utils.auth import authenticate_user, get_current_user, invalidate_user, token_cache, user_cache
 
 
 def test_register_user(client, user_data):
@@ -13,14 +13,16 @@ def test_register_user(client, user_data):
     Test user registration.
     """
     client.app.mongodb["users"].delete_many({})
-    with patch("services.tasks.send_welcome_email.delay") as mock_delay:
-        response = client.post("/api/v1/auth/register/", json=user_data)
-        assert response.status_code == status.HTTP_201_CREATED
-        data = response.json()
-        assert data["email"] == user_data["email"]
-        assert data["name"] == user_data["name"]
-        assert "id" in data
-        mock_delay.assert_called_once_with(user_data["email"], user_data["name"])
+    response = client.post("/api/v1/auth/register/", json=user_data)
+    assert response.status_code == status.HTTP_201_CREATED
+    data = response.json()
+    assert data["email"] == user_data["email"]
+    assert data["name"] == user_data["name"]
+    assert "id" in data
+    message = client.portal.call(client.app.mongodb["outbox"].find_one, {"payload.email": user_data["email"]})
+    assert message["kind"] == "welcome_email"
+    assert message["status"] == "pending"
+    assert message["payload"]["name"] == user_data["name"]
 
 
 def test_register_user_duplicate(client):
@@ -28,11 +30,25 @@ def test_register_user_duplicate(client):
     Test duplicate user registration returns error.
     """
     user_data = {"email": "dupeuser@example.com", "name": "Dupe_user", "password": "dupepassword1"}
-    with patch("services.tasks.send_welcome_email.delay"):
-        client.post("/api/v1/auth/register/", json=user_data)
+    client.post("/api/v1/auth/register/", json=user_data)
+    response = client.post("/api/v1/auth/register/", json=user_data)
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json()["detail"] == "User already exists"
+
+
+def test_register_user_concurrent_duplicate(client):
+    """
+    Test that a registration losing the race against another one for the same email returns 400.
+    """
+    user_data = {"email": "raceuser@example.com", "name": "Race_user", "password": "racepassword1"}
+    client.post("/api/v1/auth/register/", json=user_data)
+    # The existence check misses the user, as it would if both requests checked before either inserted.
+    with patch("motor.motor_asyncio.AsyncIOMotorCollection.find_one", AsyncMock(return_value=None)):
         response = client.post("/api/v1/auth/register/", json=user_data)
-        assert response.status_code == status.HTTP_400_BAD_REQUEST
-        assert response.json()["detail"] == "User already exists"
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json()["detail"] == "User already exists"
+    count = client.portal.call(client.app.mongodb["outbox"].count_documents, {"payload.email": user_data["email"]})
+    assert count == 1
 
 
 def test_login_for_access_token(client):
@@ -40,8 +56,7 @@ def test_login_for_access_token(client):
     Test user login and token retrieval.
     """
     user_data = {"email": "loginuser@example.com", "name": "Login_user", "password": "loginpassword1"}
-    with patch("services.tasks.send_welcome_email.delay"):
-        client.post("/api/v1/auth/register/", json=user_data)
+    client.post("/api/v1/auth/register/", json=user_data)
     login_data = {"username": user_data["email"], "password": user_data["password"]}
     response = client.post("/api/v1/auth/login/", data=login_data)
     assert response.status_code == status.HTTP_200_OK
@@ -55,8 +70,7 @@ def test_login_invalid_password(client):
     Test login with invalid password returns error.
     """
     user_data = {"email": "badpass@example.com", "name": "Bad_pass", "password": "goodpassword1"}
-    with patch("services.tasks.send_welcome_email.delay"):
-        client.post("/api/v1/auth/register/", json=user_data)
+    client.post("/api/v1/auth/register/", json=user_data)
     login_data = {"username": user_data["email"], "password": "wrongpassword"}
     response = client.post("/api/v1/auth/login/", data=login_data)
     assert response.status_code == status.HTTP_401_UNAUTHORIZED
@@ -68,8 +82,7 @@ def test_get_profile(client):
     Test retrieving user profile.
     """
     user_data = {"email": "profileuser@example.com", "name": "Profile_user", "password": "profilepassword1"}
-    with patch("services.tasks.send_welcome_email.delay"):
-        client.post("/api/v1/auth/register/", json=user_data)
+    client.post("/api/v1/auth/register/", json=user_data)
     login_data = {"username": user_data["email"], "password": user_data["password"]}
     response = client.post("/api/v1/auth/login/", data=login_data)
     token = response.json()["access_token"]
@@ -140,3 +153,34 @@ async def test_get_current_user_user_not_found(monkeypatch):
         await get_current_user(request, token)
     assert exc_info.value.status_code == status.HTTP_401_UNAUTHORIZED
     assert exc_info.value.detail == "Could not validate credentials"
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_cached():
+    """
+    Test that a repeated token skips the database lookup until the user is invalidated.
+    """
+    from utils.auth import create_access_token
+
+    user_cache.clear()
+    token_cache.clear()
+    request = AsyncMock()
+    users_collection = AsyncMock()
+    users_collection.find_one.side_effect = lambda query: {
+        "_id": "68c3cadf9cfa7ae93702205f",
+        "email": "cached@example.com",
+        "name": "Cached_user",
+        "hashed_password": "hash",
+    }
+    request.app.mongodb = {"users": users_collection}
+    token = create_access_token({"sub": "cached@example.com"})
+
+    first = await get_current_user(request, token)
+    second = await get_current_user(request, token)
+    assert first == second
+    assert users_collection.find_one.await_count == 1
+    assert token_cache.stats()["hits"] == 1
+
+    invalidate_user("cached@example.com")
+    await get_current_user(request, token)
+    assert users_collection.find_one.await_count == 2
@@ -0,0 +1,11 @@
+from fastapi import status
+
+
+def test_metrics_endpoint(client, authorized_user):
+    client.get("/api/v1/articles/", headers=authorized_user)
+    response = client.get("/metrics")
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("text/plain")
+    assert 'http_request_duration_seconds_count{method="GET",route="/api/v1/articles/",status="200"}' in response.text
+    assert "mongodb_command_duration_seconds" in response.text
+    assert "cache_hits_total" in response.text
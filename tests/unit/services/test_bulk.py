@@ -0,0 +1,94 @@
+import asyncio
+
+from bson import ObjectId
+from pymongo import DeleteOne, InsertOne, UpdateOne
+from pymongo.results import BulkWriteResult
+
+from models.article import BulkOperation
+from services.bulk import run_bulk
+
+AUTHOR = "u1"
+
+
+class FakeCursor:
+    def __init__(self, documents):
+        self.documents = documents
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if not self.documents:
+            raise StopAsyncIteration
+        return self.documents.pop(0)
+
+
+class FakeArticles:
+    """
+    Articles collection running bulk writes in memory; 'before_write' runs between the ownership
+    query and the bulk write, standing in for a concurrent request.
+    """
+
+    def __init__(self, documents, before_write=None):
+        self.documents = {document["_id"]: document for document in documents}
+        self.before_write = before_write
+
+    def find(self, query, projection=None):
+        return FakeCursor([self.documents[_id] for _id in query["_id"]["$in"] if _id in self.documents])
+
+    async def bulk_write(self, requests, ordered=True):
+        if self.before_write:
+            self.before_write(self.documents)
+        result = {"nInserted": 0, "nMatched": 0, "nModified": 0, "nRemoved": 0, "nUpserted": 0, "upserted": []}
+        for request in requests:
+            if isinstance(request, InsertOne):
+                self.documents[request._doc["_id"]] = request._doc
+                result["nInserted"] += 1
+                continue
+            document = self.documents.get(request._filter["_id"])
+            if document is None or document["author"] != request._filter["author"]:
+                continue
+            if isinstance(request, UpdateOne):
+                document.update(request._doc["$set"])
+                result["nMatched"] += 1
+                result["nModified"] += 1
+            elif isinstance(request, DeleteOne):
+                del self.documents[request._filter["_id"]]
+                result["nRemoved"] += 1
+        return BulkWriteResult(result, True)
+
+
+def article(**fields):
+    return {"_id": ObjectId(), "author": AUTHOR, "content": "one two three", "tags": ["python"], **fields}
+
+
+def run(articles, operations):
+    return asyncio.run(run_bulk(articles, [BulkOperation(**operation) for operation in operations], AUTHOR))
+
+
+def test_bulk_rejects_repeated_ids():
+    target = article()
+    articles = FakeArticles([target])
+    operations = [{"op": "delete", "id": str(target["_id"])}] * 2
+    results, delta = run(articles, operations)
+    assert [result.status for result in results] == [204, 400]
+    assert delta.counts["total"]["articles"] == -1
+
+
+def test_bulk_reports_articles_deleted_concurrently():
+    updated, deleted, kept = article(), article(), article()
+    gone = [updated["_id"], deleted["_id"]]
+
+    def delete_concurrently(documents):
+        for _id in gone:
+            documents.pop(_id)
+
+    articles = FakeArticles([updated, deleted, kept], before_write=delete_concurrently)
+    operations = [
+        {"op": "update", "id": str(updated["_id"]), "article": {"title": "Edited", "content": "one"}},
+        {"op": "delete", "id": str(deleted["_id"])},
+        {"op": "update", "id": str(kept["_id"]), "article": {"title": "Edited", "content": "one"}},
+    ]
+    results, delta = run(articles, operations)
+    assert [result.status for result in results] == [404, 404, 200]
+    assert delta.counts["total"] == {"words": -2}
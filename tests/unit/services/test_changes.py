@@ -0,0 +1,155 @@
+import asyncio
+from types import SimpleNamespace
+
+from pymongo.errors import OperationFailure
+
+from services.changes import ChangeFeed, ChangeStreamWatcher, feed_event, feed_events
+from utils.response_cache import ResponseCache
+
+INSERT = {
+    "_id": {"_data": "1"},
+    "operationType": "insert",
+    "documentKey": {"_id": "a1"},
+    "fullDocument": {"title": "Hello", "tags": ["python"], "version": 1},
+}
+UPDATE = {
+    "_id": {"_data": "2"},
+    "operationType": "update",
+    "documentKey": {"_id": "a1"},
+    "updateDescription": {"updatedFields": {"version": 2}},
+}
+
+
+class FakeStream:
+    def __init__(self, changes):
+        self.changes = changes
+        self.resume_token = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if not self.changes:
+            raise StopAsyncIteration
+        change = self.changes.pop(0)
+        self.resume_token = change["_id"]
+        return change
+
+
+class FakeCollection:
+    def __init__(self, watch=None):
+        self.documents = {}
+        self.watch_calls = []
+        self._watch = watch
+
+    async def find_one(self, query):
+        return self.documents.get(query["_id"])
+
+    async def update_one(self, query, update, upsert=False):
+        self.documents[query["_id"]] = {"_id": query["_id"], **update["$set"]}
+
+    def watch(self, pipeline, start_after=None):
+        self.watch_calls.append(start_after)
+        return self._watch()
+
+
+def test_feed_event():
+    assert feed_event(INSERT) == {"op": "insert", "id": "a1", "title": "Hello", "tags": ["python"], "version": 1}
+    assert feed_event(UPDATE) == {"op": "update", "id": "a1", "version": 2}
+
+
+def test_feed_drops_slow_subscriber():
+    async def run():
+        feed = ChangeFeed(buffer_size=2)
+        slow, fast = feed.subscribe(), feed.subscribe()
+        for number in range(3):
+            feed.publish({"n": number})
+            if number < 2:
+                await fast.get()
+        assert len(feed) == 1
+        assert slow.get_nowait() == "overflow" and slow.empty()
+        assert fast.get_nowait() == {"n": 2}
+        feed.close()
+        assert fast.get_nowait() is None
+        assert len(feed) == 0
+
+    asyncio.run(run())
+
+
+def test_feed_events_stream():
+    async def run():
+        feed = ChangeFeed(buffer_size=10)
+
+        async def connected():
+            return False
+
+        events = feed_events(feed, timeout=5, is_disconnected=connected)
+        first = asyncio.ensure_future(anext(events))
+        await asyncio.sleep(0)
+        feed.publish({"op": "delete", "id": "a1"})
+        assert await first == 'event: change\ndata: {"op": "delete", "id": "a1"}\n\n'
+        feed.close()
+        assert [event async for event in events] == []
+        assert len(feed) == 0
+
+    asyncio.run(run())
+
+
+def test_watcher_invalidates_cache_and_saves_token():
+    async def run():
+        cache = ResponseCache(
+            route_ttls={"article": 60, "article_list": 60}, redis_url=None, l1_max_size=10, l1_ttl=60
+        )
+        article_key = ResponseCache.make_key("article", "a1")
+
+        async def load():
+            return b"cached"
+
+        await cache.get_or_set("article", article_key, load)
+        await cache.get_or_set("article_list", "page", load)
+
+        feed = ChangeFeed(buffer_size=10)
+        queue = feed.subscribe()
+        articles = FakeCollection(watch=lambda: FakeStream([INSERT, UPDATE]))
+        tokens = FakeCollection()
+        tokens.documents["articles"] = {"_id": "articles", "token": {"_data": "0"}}
+        database = {"articles": articles, "change_streams": tokens}
+        watcher = ChangeStreamWatcher(
+            SimpleNamespace(mongodb=database), feed, cache, retry_seconds=60, token_save_seconds=0
+        )
+        await watcher.start()
+        await asyncio.sleep(0.01)
+        assert articles.watch_calls == [{"_data": "0"}]
+        assert [queue.get_nowait()["op"] for _ in range(2)] == ["insert", "update"]
+        assert cache.stats()["l1"]["article"]["size"] == 0
+        assert cache.stats()["l1"]["article_list"]["size"] == 0
+        assert tokens.documents["articles"]["token"] == {"_data": "2"}
+        await watcher.stop()
+        assert queue.get_nowait() is None
+
+    asyncio.run(run())
+
+
+def test_watcher_stops_without_replica_set():
+    def unsupported():
+        raise OperationFailure("only supported on replica sets", code=40573)
+
+    async def run():
+        feed = ChangeFeed(buffer_size=10)
+        database = {"articles": FakeCollection(watch=unsupported), "change_streams": FakeCollection()}
+        watcher = ChangeStreamWatcher(
+            SimpleNamespace(mongodb=database), feed, None, retry_seconds=60, token_save_seconds=1
+        )
+        await watcher.start()
+        await asyncio.sleep(0.01)
+        assert watcher._task.done() and watcher._task.exception() is None
+        assert not feed.available
+        await watcher.stop()
+
+    asyncio.run(run())
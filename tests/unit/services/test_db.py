@@ -0,0 +1,49 @@
+import threading
+import time
+from unittest.mock import patch
+
+from services import db
+
+
+def test_client_shared_between_calls():
+    db.close_client()
+    try:
+        assert db.get_client() is db.get_client()
+        assert db.get_db().client is db.get_client()
+    finally:
+        db.close_client()
+
+
+def test_worker_process_init_replaces_inherited_client():
+    inherited = db.get_client()
+    try:
+        db.init_worker_client()
+        assert db.get_client() is not inherited
+    finally:
+        inherited.close()
+        db.close_client()
+
+
+def test_client_created_once_across_threads():
+    db.close_client()
+    start = threading.Barrier(8)
+    clients = []
+
+    def slow_client(*args, **kwargs):
+        time.sleep(0.01)
+        return object()
+
+    def first_call():
+        start.wait()
+        clients.append(db.get_client())
+
+    threads = [threading.Thread(target=first_call) for _ in range(8)]
+    try:
+        with patch("services.db.MongoClient", side_effect=slow_client):
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        assert len({id(client) for client in clients}) == 1
+    finally:
+        db._client = None
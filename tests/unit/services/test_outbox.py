@@ -0,0 +1,94 @@
+import socketserver
+import threading
+
+import pytest
+
+from services.mailer import LogSender, SMTPSender, welcome_email
+from services.outbox import WELCOME_EMAIL, outbox_message, render_message
+
+
+class SMTPHandler(socketserver.StreamRequestHandler):
+    """
+    Minimal SMTP server standing in for a mail relay: accepts every message except those to
+    recipients at 'refused.example.com', and records what it received.
+    """
+
+    def reply(self, line: str):
+        self.wfile.write(f"{line}\r\n".encode())
+
+    def handle(self):
+        self.reply("220 localhost ready")
+        recipients, data = [], None
+        for raw in self.rfile:
+            line = raw.decode().rstrip("\r\n")
+            if data is not None:
+                if line == ".":
+                    self.server.received.append((recipients, "\n".join(data)))
+                    recipients, data = [], None
+                    self.reply("250 queued")
+                else:
+                    data.append(line)
+                continue
+            command = line.split(" ", 1)[0].upper()
+            if command == "EHLO":
+                self.reply("250 localhost")
+            elif command == "RCPT" and "refused.example.com" in line:
+                self.reply("550 no such user")
+            elif command == "RCPT":
+                recipients.append(line.split(":", 1)[1].strip("<> "))
+                self.reply("250 ok")
+            elif command == "DATA":
+                data = []
+                self.reply("354 end with .")
+            elif command == "QUIT":
+                self.reply("221 bye")
+                return
+            else:
+                self.reply("250 ok")
+
+
+@pytest.fixture
+def smtp_server():
+    server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), SMTPHandler)
+    server.received = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_render_welcome_message():
+    document = outbox_message(WELCOME_EMAIL, {"email": "new@example.com", "name": "New"})
+    assert document["status"] == "pending" and document["attempts"] == 0
+    message, log = render_message(document)
+    assert message["To"] == "new@example.com"
+    assert log.type == "user"
+    assert log.message == "Welcome email sent to new@example.com (New)"
+    with pytest.raises(ValueError):
+        render_message(outbox_message("unknown", {}))
+
+
+def test_smtp_sender_sends_batch_over_one_connection(smtp_server):
+    sender = SMTPSender(*smtp_server.server_address, timeout=5)
+    messages = [
+        welcome_email("one@example.com", "One"),
+        welcome_email("nobody@refused.example.com", "Nobody"),
+        welcome_email("two@example.com", "Two"),
+    ]
+    errors = sender.send_batch(messages)
+    assert errors[0] is None and errors[2] is None
+    assert errors[1] is not None
+    assert [recipients for recipients, _ in smtp_server.received] == [["one@example.com"], ["two@example.com"]]
+    assert "Hi One," in smtp_server.received[0][1]
+
+
+def test_smtp_sender_unreachable_server():
+    with socketserver.TCPServer(("127.0.0.1", 0), SMTPHandler) as unused:
+        address = unused.server_address
+    errors = SMTPSender(*address, timeout=1).send_batch([welcome_email("one@example.com", "One")] * 2)
+    assert len(errors) == 2 and all(isinstance(error, OSError) for error in errors)
+
+
+def test_log_sender():
+    assert LogSender().send_batch([welcome_email("one@example.com", "One")]) == [None]
@@ -0,0 +1,32 @@
+from celery import Celery
+from kombu import Queue
+
+from config.celery import celery_app
+from services.queues import queue_depths
+
+
+def test_tasks_are_routed_to_their_queue():
+    routes = {
+        "services.tasks.analyze_article": "interactive",
+        "services.tasks.send_welcome_email": "email",
+        "services.tasks.analyze_articles_bulk": "batch",
+        "services.tasks.reconcile_article_stats": "batch",
+        "services.tasks.unrouted": "batch",
+    }
+    for task_name, queue in routes.items():
+        route = celery_app.amqp.router.route({}, task_name)
+        assert route["queue"].name == queue
+        assert route["queue"].routing_key == queue
+
+
+def test_queue_depths():
+    app = Celery("test", broker="memory://")
+    app.conf.task_queues = [Queue("fast", routing_key="fast"), Queue("slow", routing_key="slow")]
+
+    @app.task
+    def noop():
+        pass
+
+    for _ in range(3):
+        noop.apply_async(queue="fast")
+    assert queue_depths(app) == {"fast": 3, "slow": 0}
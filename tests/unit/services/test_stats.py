@@ -0,0 +1,66 @@
+from pymongo import DeleteOne, ReplaceOne, UpdateOne
+
+from services.stats import StatsDelta, count_words, reconcile_operations
+
+ARTICLE = {
+    "content": "one two  three",
+    "tags": ["python", "python", "mongo"],
+    "author": "u1",
+    "created_at": "2025-03-04T10:00:00+00:00",
+}
+
+
+def test_stats_delta_counts_created_article():
+    delta = StatsDelta()
+    delta.add_article(ARTICLE)
+    operations = {operation._filter["_id"]: operation._doc for operation in delta.operations()}
+    assert operations["total"] == {"$inc": {"articles": 1, "words": 3}}
+    assert operations["tag:python"] == {
+        "$inc": {"articles": 1, "words": 3},
+        "$setOnInsert": {"kind": "tag", "key": "python"},
+    }
+    assert set(operations) == {"total", "tag:python", "tag:mongo", "author:u1", "day:2025-03-04"}
+    assert all(isinstance(operation, UpdateOne) and operation._upsert for operation in delta.operations())
+
+
+def test_stats_delta_skips_cancelled_changes():
+    delta = StatsDelta()
+    delta.add_article(ARTICLE)
+    delta.add_article({**ARTICLE, "analysis": {"word_count": 3}}, -1)
+    delta.add_words(ARTICLE, 0)
+    assert [operation._doc for operation in delta.operations()] == [{"$inc": {"analyzed": -1}}]
+
+
+def test_stats_delta_word_change():
+    delta = StatsDelta()
+    delta.add_words({"tags": ["python"]}, -2)
+    operations = {operation._filter["_id"]: operation._doc["$inc"] for operation in delta.operations()}
+    assert operations == {"total": {"words": -2}, "tag:python": {"words": -2}}
+
+
+def test_count_words():
+    assert count_words(None) == 0
+    assert count_words(" a  b\nc ") == 3
+
+
+def test_reconcile_operations():
+    recount = StatsDelta()
+    recount.add_article(ARTICLE)
+    existing = [
+        {"_id": "total", "articles": 1, "words": 3, "analyzed": 0},
+        {"_id": "tag:python", "kind": "tag", "key": "python", "articles": 2, "words": 3},
+        {"_id": "tag:mongo", "kind": "tag", "key": "mongo", "articles": 1, "words": 3},
+        {"_id": "tag:stale", "kind": "tag", "key": "stale", "articles": 0, "words": 0},
+    ]
+    operations = reconcile_operations(recount, existing)
+    replaced = {
+        operation._filter["_id"]: operation._doc for operation in operations if isinstance(operation, ReplaceOne)
+    }
+    assert replaced == {
+        "tag:python": {"articles": 1, "words": 3, "kind": "tag", "key": "python"},
+        "author:u1": {"articles": 1, "words": 3, "kind": "author", "key": "u1"},
+        "day:2025-03-04": {"articles": 1, "words": 3, "kind": "day", "key": "2025-03-04"},
+    }
+    assert [operation._filter for operation in operations if isinstance(operation, DeleteOne)] == [
+        {"_id": "tag:stale"}
+    ]
@@ -0,0 +1,85 @@
+import asyncio
+from unittest.mock import patch
+
+from services.tags import TagIndex, TagIndexHolder, load_tag_counts
+
+
+def test_tag_index_suggest_by_prefix():
+    index = TagIndex({"Python": 5, "pytest": 7, "pydantic": 2, "mongo": 9, "empty": 0})
+    assert len(index) == 4
+    assert index.suggest("py", 10) == [("pytest", 7), ("Python", 5), ("pydantic", 2)]
+    assert index.suggest("PYT", 1) == [("pytest", 7)]
+    assert index.suggest("z", 10) == []
+    assert index.suggest(None, 2) == [("mongo", 9), ("pytest", 7)]
+
+
+def test_tag_index_holder_shares_reload():
+    calls = []
+
+    async def load(articles_collection):
+        calls.append(articles_collection)
+        await asyncio.sleep(0.01)
+        return {"fastapi": 1}
+
+    async def run():
+        holder = TagIndexHolder(ttl=60)
+        first, second = await asyncio.gather(holder.get("articles"), holder.get("articles"))
+        assert first is second
+        assert await holder.get("articles") is first
+        holder.clear()
+        assert await holder.get("articles") is not first
+
+    with patch("services.tags.load_tag_counts", load):
+        asyncio.run(run())
+    assert len(calls) == 2
+
+
+class FakeCursor:
+    def __init__(self, documents):
+        self.documents = list(documents)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if not self.documents:
+            raise StopAsyncIteration
+        return self.documents.pop(0)
+
+
+class FakeCollection:
+    def __init__(self, documents=(), aggregated=()):
+        self.documents = {document["_id"]: document for document in documents}
+        self.aggregated = aggregated
+
+    async def find_one(self, query, projection=None):
+        return self.documents.get(query["_id"])
+
+    def find(self, query, projection=None):
+        return FakeCursor(document for document in self.documents.values() if document.get("kind") == query["kind"])
+
+    def aggregate(self, pipeline):
+        return FakeCursor(self.aggregated)
+
+
+class FakeDatabase(dict):
+    def __getattr__(self, name):
+        return self[name]
+
+
+def tag_counts(checkpoints):
+    stats = FakeCollection(
+        [
+            {"_id": "total", "articles": 1, "words": 2},
+            {"_id": "tag:new", "kind": "tag", "key": "new", "articles": 1},
+        ]
+    )
+    articles = FakeCollection(aggregated=[{"_id": "old", "count": 5}, {"_id": "new", "count": 1}])
+    articles.database = FakeDatabase(article_stats=stats, checkpoints=FakeCollection(checkpoints))
+    return asyncio.run(load_tag_counts(articles))
+
+
+def test_tag_counts_aggregated_until_stats_reconciled():
+    # The total exists after the first write, but only counts writes made since the deploy.
+    assert tag_counts(checkpoints=[]) == {"old": 5, "new": 1}
+    assert tag_counts(checkpoints=[{"_id": "article_stats_reconciled"}]) == {"new": 1}
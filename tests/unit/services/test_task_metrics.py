@@ -0,0 +1,27 @@
+from types import SimpleNamespace
+
+from prometheus_client import REGISTRY
+
+from services.task_metrics import record_task_end, record_task_start, stamp_published_at
+
+
+def test_task_metrics_record_queue_wait_and_run_time():
+    headers = {}
+    stamp_published_at(headers=headers)
+    headers["published_at"] -= 2
+    task = SimpleNamespace(name="services.tasks.example", request=SimpleNamespace(**headers))
+
+    record_task_start(task_id="task-1", task=task)
+    record_task_end(task_id="task-1", task=task, state="SUCCESS")
+
+    wait_sum = REGISTRY.get_sample_value("celery_task_queue_wait_seconds_sum", {"task": task.name})
+    assert wait_sum >= 2
+    count = REGISTRY.get_sample_value("celery_task_duration_seconds_count", {"task": task.name, "state": "SUCCESS"})
+    assert count == 1
+
+
+def test_task_metrics_without_publish_header():
+    task = SimpleNamespace(name="services.tasks.unstamped", request=SimpleNamespace())
+    record_task_start(task_id="task-2", task=task)
+    record_task_end(task_id="task-2", task=task, state="FAILURE")
+    assert REGISTRY.get_sample_value("celery_task_queue_wait_seconds_count", {"task": task.name}) is None
@@ -0,0 +1,41 @@
+from unittest.mock import patch
+
+from utils.cache import TTLCache
+
+
+def test_ttl_cache_hit_and_miss_counters():
+    cache = TTLCache(maxsize=10, ttl=60)
+    assert cache.get("a") is None
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+    assert cache.stats() == {"hits": 1, "misses": 1, "size": 1, "maxsize": 10}
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_ttl_cache_expires_entries():
+    cache = TTLCache(maxsize=10, ttl=5)
+    with patch("utils.cache.time.monotonic", return_value=100.0):
+        cache.set("a", 1)
+        cache.set("short", 2, ttl=1)
+    with patch("utils.cache.time.monotonic", return_value=102.0):
+        assert cache.get("short") is None
+        assert cache.get("a") == 1
+    with patch("utils.cache.time.monotonic", return_value=106.0):
+        assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_ttl_cache_ignores_non_positive_ttl():
+    cache = TTLCache(maxsize=10, ttl=5)
+    cache.set("a", 1, ttl=0)
+    assert cache.get("a") is None
@@ -0,0 +1,44 @@
+import pytest
+from fastapi import HTTPException
+
+from utils.etag import etag_matches, make_etag, pack_body, parse_if_match, unpack_body, version_filter
+
+
+def test_parse_if_match_round_trip():
+    assert parse_if_match(make_etag(3)) == [3]
+    assert parse_if_match('"3", "4"') == [3, 4]
+
+
+def test_parse_if_match_ignores_weak_tags():
+    assert parse_if_match('"3", W/"4"') == [3]
+    assert parse_if_match('W/"4"') == []
+
+
+def test_parse_if_match_any_version():
+    assert parse_if_match(None) is None
+    assert parse_if_match("*") is None
+
+
+@pytest.mark.parametrize("header", ["3", '"abc"', '""', '"3", nope'])
+def test_parse_if_match_invalid(header):
+    with pytest.raises(HTTPException) as exc_info:
+        parse_if_match(header)
+    assert exc_info.value.status_code == 400
+
+
+def test_version_filter_matches_unversioned_articles_as_zero():
+    assert version_filter([2]) == {"version": {"$in": [2]}}
+    assert version_filter([0]) == {"version": {"$in": [0, None]}}
+
+
+def test_etag_matches():
+    assert etag_matches('"2"', '"2"')
+    assert etag_matches('"1", W/"2"', '"2"')
+    assert etag_matches("*", '"2"')
+    assert not etag_matches('"1"', '"2"')
+    assert not etag_matches(None, '"2"')
+
+
+def test_pack_body_round_trip():
+    assert unpack_body(pack_body('"3"', b'{"id":"x"}')) == ('"3"', b'{"id":"x"}')
+    assert unpack_body(b'{"id":"x"}') == (None, b'{"id":"x"}')
@@ -0,0 +1,37 @@
+import asyncio
+import threading
+
+import pytest
+from fastapi import HTTPException, status
+
+from utils.hashing import HashingPool
+
+
+@pytest.mark.asyncio
+async def test_hashing_pool_runs_off_loop():
+    pool = HashingPool(kind="thread", workers=1, max_queue=0)
+    try:
+        assert await pool.run(threading.current_thread) is not threading.current_thread()
+        assert pool.stats()["completed"] == 1
+    finally:
+        pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_hashing_pool_rejects_when_saturated():
+    pool = HashingPool(kind="thread", workers=1, max_queue=1)
+    release = threading.Event()
+    try:
+        running = asyncio.ensure_future(pool.run(release.wait, 5))
+        queued = asyncio.ensure_future(pool.run(release.wait, 5))
+        await asyncio.sleep(0)
+        assert pool.stats()["queue_depth"] == 1
+        with pytest.raises(HTTPException) as exc_info:
+            await pool.run(release.wait, 5)
+        assert exc_info.value.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+        release.set()
+        await asyncio.gather(running, queued)
+        assert pool.stats()["rejected"] == 1
+        assert pool.stats()["queue_depth"] == 0
+    finally:
+        pool.shutdown()
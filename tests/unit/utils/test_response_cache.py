@@ -0,0 +1,107 @@
+import asyncio
+
+import pytest
+
+from utils.response_cache import ResponseCache
+
+
+def make_cache():
+    return ResponseCache(route_ttls={"item": 60, "list": 60}, redis_url=None, l1_max_size=10, l1_ttl=60)
+
+
+@pytest.mark.asyncio
+async def test_get_or_set_single_flight():
+    cache = make_cache()
+    calls = 0
+
+    async def loader():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return b"value"
+
+    results = await asyncio.gather(*(cache.get_or_set("item", "k", loader) for _ in range(5)))
+    assert results == [b"value"] * 5
+    assert calls == 1
+    assert await cache.get_or_set("item", "k", loader) == b"value"
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_invalidate_key_and_route():
+    cache = make_cache()
+    values = iter([b"1", b"2", b"3", b"4"])
+
+    async def loader():
+        return next(values)
+
+    assert await cache.get_or_set("item", "a", loader) == b"1"
+    assert await cache.get_or_set("list", "b", loader) == b"2"
+    await cache.invalidate("item", "a")
+    assert await cache.get_or_set("item", "a", loader) == b"3"
+    assert await cache.get_or_set("list", "b", loader) == b"2"
+    await cache.invalidate("list")
+    assert await cache.get_or_set("list", "b", loader) == b"4"
+
+
+@pytest.mark.asyncio
+async def test_none_and_stale_loads_not_cached():
+    cache = make_cache()
+
+    async def missing():
+        return None
+
+    async def invalidated_while_loading():
+        await cache.invalidate("item")
+        return b"stale"
+
+    assert await cache.get_or_set("item", "a", missing) is None
+    assert await cache.get_or_set("item", "b", invalidated_while_loading) == b"stale"
+    assert cache.stats()["l1"]["item"]["size"] == 0
+
+
+@pytest.mark.asyncio
+async def test_l2_hit_across_invalidation_not_kept_in_l1():
+    cache = ResponseCache(route_ttls={"item": 60}, redis_url="redis://unused", l1_max_size=10, l1_ttl=60)
+
+    class InvalidatedWhileReading:
+        async def mget(self, *keys):
+            # Redis answered with the entry, then a write in this process invalidated the route.
+            cache.invalidate_local("item")
+            return [None, None, b"0.0\nstale"]
+
+    cache._redis = InvalidatedWhileReading()
+
+    async def loader():
+        return b"fresh"
+
+    assert await cache.get_or_set("item", "a", loader) == b"stale"
+    assert cache.stats()["l1"]["item"]["size"] == 0
+
+
+@pytest.mark.asyncio
+async def test_loader_error_propagates_to_waiters():
+    cache = make_cache()
+
+    async def failing():
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    results = await asyncio.gather(*(cache.get_or_set("item", "k", failing) for _ in range(3)), return_exceptions=True)
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_value_refused_by_cacheable_not_cached():
+    cache = make_cache()
+    values = iter([b"lagging", b"current"])
+
+    async def loader():
+        return next(values)
+
+    async def cacheable(value):
+        return value == b"current"
+
+    assert await cache.get_or_set("list", "a", loader, cacheable=cacheable) == b"lagging"
+    assert await cache.get_or_set("list", "a", loader, cacheable=cacheable) == b"current"
+    assert await cache.get_or_set("list", "a", loader, cacheable=cacheable) == b"current"
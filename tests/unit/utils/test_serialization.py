@@ -0,0 +1,45 @@
+import json
+
+import pytest
+from fastapi import HTTPException
+
+from config.settings import ARTICLE_EXCERPT_LENGTH
+from models.article import Article
+from utils.serialization import SUMMARY_FIELDS, article_projection, dump_json, parse_fields
+
+
+def test_article_projection_matches_article_fields():
+    projection = article_projection()["$project"]
+    assert projection["_id"] == 0
+    assert projection["id"] == {"$toString": "$_id"}
+    assert set(projection) - {"_id"} == set(Article.model_fields)
+    assert projection["score"] == {"$literal": None}
+    assert article_projection(with_score=True)["$project"]["score"] == "$score"
+
+
+def test_dump_json_matches_pydantic_output():
+    document = {
+        "id": "64b7f0c2a1b2c3d4e5f60718",
+        "title": "Title",
+        "content": "Content",
+        "tags": ["python"],
+        "author": None,
+        "created_at": "2025-01-01T00:00:00+00:00",
+        "score": None,
+        "version": 1,
+    }
+    assert json.loads(dump_json(document)) == json.loads(Article(**document).model_dump_json())
+
+
+def test_parse_fields():
+    assert parse_fields(None, SUMMARY_FIELDS) == SUMMARY_FIELDS
+    assert parse_fields("tags, id,title", SUMMARY_FIELDS) == ("title", "tags")
+    with pytest.raises(HTTPException) as exc_info:
+        parse_fields("title,secret", SUMMARY_FIELDS)
+    assert exc_info.value.status_code == 400
+
+
+def test_article_projection_selected_fields():
+    projection = article_projection(fields=("title", "excerpt"))["$project"]
+    assert set(projection) == {"_id", "id", "title", "excerpt"}
+    assert projection["excerpt"]["$substrCP"][1:] == [0, ARTICLE_EXCERPT_LENGTH]
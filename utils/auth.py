@@ -1,3 +1,4 @@
+import time
 from datetime import datetime, timedelta, timezone
 from typing import Annotated
 
@@ -7,13 +8,54 @@ from fastapi.security import OAuth2PasswordBearer
 from jwt.exceptions import InvalidTokenError
 from passlib.context import CryptContext
 
-from config.settings import ACCESS_TOKEN_EXPIRE_MINUTES, ALGORITHM, SECRET_KEY
+from config.settings import (
+    ACCESS_TOKEN_EXPIRE_MINUTES,
+    ADMIN_EMAILS,
+    ALGORITHM,
+    AUTH_CACHE_MAX_SIZE,
+    AUTH_CACHE_TTL_SECONDS,
+    HASH_POOL_KIND,
+    HASH_POOL_MAX_QUEUE,
+    HASH_POOL_WORKERS,
+    SECRET_KEY,
+)
 from models.auth import TokenData, User, UserInDB
+from utils.cache import TTLCache
+from utils.hashing import HashingPool
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+hashing_pool = HashingPool(kind=HASH_POOL_KIND, workers=HASH_POOL_WORKERS, max_queue=HASH_POOL_MAX_QUEUE)
+
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login/")
 
+# Resolved users keyed by token subject (email), and verified tokens mapped to their subject.
+user_cache = TTLCache(maxsize=AUTH_CACHE_MAX_SIZE, ttl=AUTH_CACHE_TTL_SECONDS)
+token_cache = TTLCache(maxsize=AUTH_CACHE_MAX_SIZE, ttl=AUTH_CACHE_TTL_SECONDS)
+
+
+def invalidate_user(email: str):
+    """
+    Drop a user from the authenticated-user cache.
+
+    Must be called whenever a user document changes, so the next request reloads it from the database.
+    Cached tokens stay valid: they only resolve to the email, and the user is then looked up again.
+
+    Args:
+        email (str): The email address (token subject) of the changed user.
+    """
+    user_cache.pop(email)
+
+
+def auth_cache_stats() -> dict:
+    """
+    Return hit/miss counters of the user and token caches.
+
+    Returns:
+        dict: Stats of the 'users' and 'tokens' caches.
+    """
+    return {"users": user_cache.stats(), "tokens": token_cache.stats()}
+
 
 def verify_password(plain_password, hashed_password):
     """
@@ -42,6 +84,39 @@ def get_password_hash(password):
     return pwd_context.hash(password)
 
 
+async def verify_password_async(plain_password, hashed_password):
+    """
+    Verify a password on the hashing pool, without blocking the event loop.
+
+    Args:
+        plain_password (str): The plain text password provided by the user.
+        hashed_password (str): The hashed password stored in the database.
+
+    Raises:
+        HTTPException: 503 if the hashing pool is saturated.
+
+    Returns:
+        bool: True if the password matches, False otherwise.
+    """
+    return await hashing_pool.run(verify_password, plain_password, hashed_password)
+
+
+async def get_password_hash_async(password):
+    """
+    Hash a password on the hashing pool, without blocking the event loop.
+
+    Args:
+        password (str): The plain text password to hash.
+
+    Raises:
+        HTTPException: 503 if the hashing pool is saturated.
+
+    Returns:
+        str: The hashed password.
+    """
+    return await hashing_pool.run(get_password_hash, password)
+
+
 async def get_user(users_collection, email: str):
     """
     Retrieve a user document from the database by email.
@@ -69,13 +144,16 @@ async def authenticate_user(users_collection, email: str, password: str):
         email (str): The user's email address.
         password (str): The user's plain text password.
 
+    Raises:
+        HTTPException: 503 if the hashing pool is saturated.
+
     Returns:
         UserInDB | bool: The authenticated user object, or False if authentication fails.
     """
     user = await get_user(users_collection, email)
     if not user:
         return False
-    if not verify_password(password, user.hashed_password):
+    if not await verify_password_async(password, user.hashed_password):
         return False
     return user
 
@@ -105,6 +183,10 @@ async def get_current_user(request: Request, token: Annotated[str, Depends(oauth
     """
     Retrieve the current authenticated user based on the JWT token.
 
+    Verified tokens and resolved users are cached for AUTH_CACHE_TTL_SECONDS (never beyond the
+    token expiry), so repeated requests with the same token skip both JWT verification and the
+    database lookup.
+
     Args:
         request (Request): The FastAPI request object.
         token (str): The JWT token provided by the client.
@@ -121,17 +203,25 @@ async def get_current_user(request: Request, token: Annotated[str, Depends(oauth
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
-    try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        email = payload.get("sub")
-        if email is None:
+    email = token_cache.get(token)
+    if email is None:
+        try:
+            payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+            email = payload.get("sub")
+            if email is None:
+                raise credentials_exception
+            token_data = TokenData(email=email)
+        except InvalidTokenError:
             raise credentials_exception
-        token_data = TokenData(email=email)
-    except InvalidTokenError:
-        raise credentials_exception
-    user = await get_user(users_collection, email=token_data.email)
+        email = token_data.email
+        expires_in = payload["exp"] - time.time() if "exp" in payload else AUTH_CACHE_TTL_SECONDS
+        token_cache.set(token, email, ttl=min(AUTH_CACHE_TTL_SECONDS, expires_in))
+    user = user_cache.get(email)
     if user is None:
-        raise credentials_exception
+        user = await get_user(users_collection, email=email)
+        if user is None:
+            raise credentials_exception
+        user_cache.set(email, user)
     return user
 
 
@@ -148,3 +238,25 @@ async def get_current_active_user(
         User: The current active user.
     """
     return current_user
+
+
+async def get_current_admin_user(
+    current_user: Annotated[UserInDB, Depends(get_current_active_user)],
+) -> UserInDB:
+    """
+    Dependency to retrieve the current user and require administrator rights.
+
+    Administrators are the users whose email is listed in ADMIN_EMAILS.
+
+    Args:
+        current_user (UserInDB): The current authenticated user.
+
+    Raises:
+        HTTPException: If the user is not an administrator.
+
+    Returns:
+        UserInDB: The current administrator.
+    """
+    if current_user.email not in ADMIN_EMAILS:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Administrator rights required")
+    return current_user
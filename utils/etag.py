@@ -0,0 +1,112 @@
+import hashlib
+
+from fastapi import HTTPException
+
+
+def make_etag(version: int, variant: str | None = None) -> str:
+    """
+    Build the ETag of an article version.
+
+    Args:
+        version (int): The article version.
+        variant (str, optional): Identifies a partial representation (e.g. the selected fields),
+            which must not share the ETag of the full article.
+    """
+    if variant is None:
+        return f'"{version}"'
+    return f'"{version}-{hashlib.sha1(variant.encode()).hexdigest()[:8]}"'
+
+
+def parse_if_match(header: str | None) -> list[int] | None:
+    """
+    Parse an If-Match header into the article versions it accepts.
+
+    If-Match uses strong comparison (RFC 9110), so weak tags ('W/"3"') never match: they are left
+    out, and a header holding only weak tags accepts no version, which fails the write with 412.
+
+    Args:
+        header (str | None): The raw header value, e.g. '"3"' or '"3", "4"'.
+
+    Raises:
+        HTTPException: If the header holds something other than ETags made by make_etag.
+
+    Returns:
+        list[int] | None: The accepted versions, or None when any version is accepted (no header or '*').
+    """
+    if header is None or header.strip() == "*":
+        return None
+    versions = []
+    for tag in header.split(","):
+        tag = tag.strip()
+        weak = tag.startswith("W/")
+        tag = tag.removeprefix("W/")
+        if len(tag) < 3 or tag[0] != '"' or tag[-1] != '"' or not tag[1:-1].isdigit():
+            raise HTTPException(status_code=400, detail="Invalid If-Match header")
+        if not weak:
+            versions.append(int(tag[1:-1]))
+    return versions
+
+
+def version_filter(versions: list[int]) -> dict:
+    """
+    Build the query filter matching articles at one of the given versions.
+
+    Articles written before versioning have no 'version' field and count as version 0.
+    """
+    if 0 in versions:
+        return {"version": {"$in": [*versions, None]}}
+    return {"version": {"$in": versions}}
+
+
+def etag_matches(if_none_match: str | None, etag: str | None) -> bool:
+    """
+    Check whether an If-None-Match header matches an ETag (weak comparison, as RFC 9110 requires).
+    """
+    if if_none_match is None or etag is None:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+
+def list_etag(change_counter: int, cache_key: str) -> str:
+    """
+    Build the ETag of a list response from the collection change counter and the query's cache key.
+    """
+    return f'"{change_counter}-{cache_key.rsplit(":", 1)[-1][:16]}"'
+
+
+def pack_body(etag: str, body: bytes) -> bytes:
+    """
+    Prefix a serialized response with its ETag, so cached responses carry their validator.
+    """
+    return etag.encode() + b"\n" + body
+
+
+def unpack_body(value: bytes) -> tuple[str | None, bytes]:
+    """
+    Split a value made by pack_body into the ETag and the body; values without an ETag yield None.
+    """
+    etag, separator, body = value.partition(b"\n")
+    if not separator:
+        return None, value
+    return etag.decode(), body
+
+
+async def read_change_counter(collection) -> int:
+    """
+    Return the change counter of a collection, bumped on every write that can change list responses.
+
+    The counter is read with the collection's read preference, so that on a secondary it is not
+    newer than the documents read next.
+    """
+    counters = collection.database.get_collection("counters", read_preference=collection.read_preference)
+    counter = await counters.find_one({"_id": collection.name})
+    return counter["seq"] if counter else 0
+
+
+async def bump_change_counter(collection):
+    """
+    Increment the change counter of a collection.
+    """
+    await collection.database.counters.update_one({"_id": collection.name}, {"$inc": {"seq": 1}}, upsert=True)
@@ -0,0 +1,57 @@
+import csv
+import io
+
+from utils.serialization import dump_json
+
+CSV_COLUMNS = ["id", "title", "content", "tags", "author", "created_at"]
+
+EXPORT_FORMATS = {
+    "ndjson": ("application/x-ndjson", "articles.ndjson"),
+    "csv": ("text/csv", "articles.csv"),
+}
+
+
+def _ndjson_rows(documents: list[dict]) -> bytes:
+    return b"".join(dump_json(document) + b"\n" for document in documents)
+
+
+def _csv_rows(documents: list[dict]) -> bytes:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for document in documents:
+        row = [document.get(column) for column in CSV_COLUMNS]
+        row[CSV_COLUMNS.index("tags")] = ",".join(document.get("tags") or [])
+        writer.writerow(row)
+    return buffer.getvalue().encode()
+
+
+async def export_chunks(cursor, export_format: str, batch_size: int):
+    """
+    Stream the documents of a cursor as NDJSON or CSV, one chunk per batch.
+
+    Only one batch of documents is held in memory at a time. The next batch is not fetched until
+    the previous chunk has been sent, so a slow client slows down the reads instead of letting them
+    pile up. The cursor is closed when the stream ends or the client disconnects.
+
+    Args:
+        cursor: A Motor cursor over documents shaped by the article $project stage.
+        export_format (str): "ndjson" or "csv".
+        batch_size (int): Number of documents per chunk.
+
+    Yields:
+        bytes: The encoded chunk; for CSV the first chunk is the header row.
+    """
+    encode = _csv_rows if export_format == "csv" else _ndjson_rows
+    if export_format == "csv":
+        yield (",".join(CSV_COLUMNS) + "\r\n").encode()
+    batch = []
+    try:
+        async for document in cursor:
+            batch.append(document)
+            if len(batch) >= batch_size:
+                yield encode(batch)
+                batch = []
+        if batch:
+            yield encode(batch)
+    finally:
+        await cursor.close()
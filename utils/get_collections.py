@@ -1,9 +1,19 @@
 from fastapi import Request
 
+from config.db import HEAVY_READ_PREFERENCE
+
 
 def get_articles_collection(request: Request):
     return request.app.mongodb["articles"]
 
 
+def get_articles_read_collection(request: Request):
+    """
+    Articles collection for heavy reads that tolerate replication lag (lists and exports),
+    routed by MONGO_HEAVY_READ_PREFERENCE, e.g. to secondaries.
+    """
+    return request.app.mongodb.get_collection("articles", read_preference=HEAVY_READ_PREFERENCE)
+
+
 def get_users_collection(request: Request):
     return request.app.mongodb["users"]
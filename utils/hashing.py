@@ -0,0 +1,94 @@
+import asyncio
+import time
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+
+from fastapi import HTTPException, status
+
+from config.metrics import PASSWORD_HASH_DURATION
+
+
+class HashingPool:
+    """
+    Bounded worker pool for CPU-heavy password hashing, kept off the event loop.
+
+    Admission control: at most 'workers' calls run at once and at most 'max_queue' more wait for a
+    worker. Anything beyond that is rejected with 503 instead of piling up behind a login storm.
+
+    The executor is created on first use, so the pool can be created at import time in a process
+    that forks afterwards.
+
+    Attributes:
+        kind (str): 'thread' or 'process'.
+        workers (int): Number of worker threads or processes.
+        max_queue (int): Number of calls allowed to wait for a free worker.
+    """
+
+    def __init__(self, kind: str, workers: int, max_queue: int, window: int = 1000):
+        if kind not in ("thread", "process"):
+            raise ValueError(f"Unknown hashing pool kind: {kind}")
+        self.kind = kind
+        self.workers = workers
+        self.max_queue = max_queue
+        self.pending = 0
+        self.completed = 0
+        self.rejected = 0
+        self._latencies: deque = deque(maxlen=window)
+        self._executor: Executor | None = None
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.kind == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="hashing")
+        return self._executor
+
+    async def run(self, func, *args):
+        """
+        Run 'func(*args)' on the pool and wait for its result without blocking the event loop.
+
+        Raises:
+            HTTPException: 503 if the pool and its queue are full.
+        """
+        if self.pending >= self.workers + self.max_queue:
+            self.rejected += 1
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Authentication service is busy, try again later",
+                headers={"Retry-After": "1"},
+            )
+        self.pending += 1
+        started = time.perf_counter()
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._get_executor(), func, *args)
+        finally:
+            elapsed = time.perf_counter() - started
+            self.pending -= 1
+            self.completed += 1
+            self._latencies.append(elapsed)
+            PASSWORD_HASH_DURATION.observe(elapsed)
+
+    def stats(self) -> dict:
+        """
+        Return queue depth, rejection count and recent hashing latency (queue wait included).
+        """
+        latencies = sorted(self._latencies)
+
+        def pick(fraction):
+            return latencies[min(len(latencies) - 1, int(fraction * len(latencies)))] if latencies else 0.0
+
+        return {
+            "workers": self.workers,
+            "in_flight": min(self.pending, self.workers),
+            "queue_depth": max(0, self.pending - self.workers),
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "latency_p50_seconds": pick(0.5),
+            "latency_p99_seconds": pick(0.99),
+        }
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
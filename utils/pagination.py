@@ -0,0 +1,76 @@
+import base64
+import binascii
+import json
+
+from bson import ObjectId
+from bson.errors import InvalidId
+from fastapi import HTTPException
+
+
+def encode_cursor(value, object_id) -> str:
+    """
+    Encode a keyset position into an opaque, URL-safe cursor token.
+
+    Args:
+        value: Value of the sort key of the last returned document.
+        object_id (ObjectId | str): The '_id' of the last returned document (tie-breaker).
+
+    Returns:
+        str: The cursor token.
+    """
+    raw = json.dumps([value, str(object_id)], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, value_types: tuple = (str, int, float, type(None))) -> tuple:
+    """
+    Decode a cursor token produced by encode_cursor.
+
+    The sort key value must be a plain scalar of one of 'value_types': the token comes from the
+    client, and anything else (e.g. a dict like {"$ne": null}) would end up in keyset_filter as a
+    query operator.
+
+    Args:
+        cursor (str): The cursor token received from the client.
+        value_types (tuple): Types the sort key value may have, matching the sort field.
+
+    Raises:
+        HTTPException: If the cursor is malformed.
+
+    Returns:
+        tuple: The sort key value and the '_id' as an ObjectId.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        value, object_id = json.loads(raw)
+        if isinstance(value, bool) or not isinstance(value, value_types):
+            raise TypeError(f"Invalid cursor value type: {type(value).__name__}")
+        return value, ObjectId(object_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError, InvalidId):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def keyset_filter(field: str, value, object_id: ObjectId) -> dict:
+    """
+    Build a filter selecting documents that come after a cursor position
+    in descending (field, _id) order.
+
+    Documents without the field sort last, so they are always included after a non-null position.
+
+    Args:
+        field (str): Name of the sort key.
+        value: Sort key value of the cursor position.
+        object_id (ObjectId): '_id' of the cursor position.
+
+    Returns:
+        dict: MongoDB filter.
+    """
+    if value is None:
+        return {field: None, "_id": {"$lt": object_id}}
+    return {
+        "$or": [
+            {field: {"$lt": value}},
+            {field: value, "_id": {"$lt": object_id}},
+            {field: None},
+        ]
+    }
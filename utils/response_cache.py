@@ -0,0 +1,255 @@
+import asyncio
+import hashlib
+import json
+import logging
+import time
+
+import redis.asyncio as redis
+from redis.exceptions import RedisError
+
+from config.settings import (
+    CACHE_ENABLED,
+    CACHE_L1_MAX_SIZE,
+    CACHE_L1_TTL_SECONDS,
+    CACHE_REDIS_RETRY_SECONDS,
+    CACHE_REDIS_URL,
+    CACHE_TTL_ARTICLE_LIST_SECONDS,
+    CACHE_TTL_ARTICLE_SECONDS,
+)
+from utils.cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+# Store an entry only if the route and key generations still match its stamp ("<route>.<key>").
+# The key generation lives at least as long as the entry, so it can't expire and restart from 0
+# while an entry stamped with its old value is still served.
+# KEYS: route generation, key generation, entry; ARGV: stamp, stamped value, TTL in seconds.
+STORE_IF_CURRENT = """
+local current = (redis.call("GET", KEYS[1]) or "0") .. "." .. (redis.call("GET", KEYS[2]) or "0")
+if current ~= ARGV[1] then
+    return 0
+end
+redis.call("SET", KEYS[3], ARGV[2], "EX", ARGV[3])
+redis.call("EXPIRE", KEYS[2], tonumber(ARGV[3]) + 1)
+return 1
+"""
+
+
+class ResponseCache:
+    """
+    Two-tier cache of serialized responses: an in-process L1 in front of a shared Redis L2.
+
+    Entries are grouped by route, each with its own TTL. A route can be invalidated one key at a time
+    or as a whole (e.g. all list pages after a write). Concurrent misses on the same key are collapsed
+    into a single load (single-flight). If Redis is unreachable the cache keeps working with L1 only
+    and retries Redis after 'redis_retry_seconds'.
+
+    Invalidating Redis increments a generation counter, of the route or of the key, instead of
+    deleting entries. Each entry is stamped with the generations it was loaded under and is only
+    served while both are current, and the stamp is checked again atomically when the entry is
+    stored, so a load started before an invalidation in any process can't store a stale entry.
+    Entries of older generations are left to expire.
+
+    Attributes:
+        route_ttls (dict[str, int]): L2 time-to-live in seconds of each route.
+        l1_ttl (float): L1 time-to-live in seconds; kept short since L1 is not shared between processes.
+    """
+
+    def __init__(
+        self,
+        route_ttls: dict[str, int],
+        redis_url: str | None,
+        l1_max_size: int,
+        l1_ttl: float,
+        redis_retry_seconds: float = 30,
+        enabled: bool = True,
+    ):
+        self.route_ttls = route_ttls
+        self.redis_url = redis_url
+        self.l1_ttl = l1_ttl
+        self.redis_retry_seconds = redis_retry_seconds
+        self.enabled = enabled
+        self.l2_hits = 0
+        self.l2_misses = 0
+        self._l1 = {route: TTLCache(maxsize=l1_max_size, ttl=l1_ttl) for route in route_ttls}
+        self._epochs = dict.fromkeys(route_ttls, 0)
+        self._inflight: dict[str, asyncio.Future] = {}
+        self._redis = None
+        self._redis_down_until = 0.0
+
+    @staticmethod
+    def make_key(route: str, params: dict | str) -> str:
+        """
+        Build a cache key from a route and its (already normalized) parameters.
+        """
+        if isinstance(params, dict):
+            raw = json.dumps(params, sort_keys=True, separators=(",", ":"))
+            params = hashlib.sha1(raw.encode()).hexdigest()
+        return f"cache:{route}:{params}"
+
+    def _get_redis(self):
+        if not self.redis_url or time.monotonic() < self._redis_down_until:
+            return None
+        if self._redis is None:
+            self._redis = redis.from_url(self.redis_url, socket_connect_timeout=0.5, socket_timeout=0.5)
+        return self._redis
+
+    def _redis_failed(self, error: Exception):
+        logger.warning("Response cache: Redis unavailable, using in-process cache only: %s", error)
+        self._redis_down_until = time.monotonic() + self.redis_retry_seconds
+
+    async def get_or_set(self, route: str, key: str, loader, cacheable=None) -> bytes | None:
+        """
+        Return the cached value of a key, loading and caching it on a miss.
+
+        Args:
+            route (str): Route the key belongs to; selects the TTL and the L1 tier.
+            key (str): Cache key built with make_key.
+            loader: Coroutine function returning the serialized value, or None for "do not cache".
+            cacheable (optional): Coroutine function called with a loaded value before it is cached;
+                when it returns False the value is served but not cached, e.g. because it was read
+                from a lagging replica.
+
+        Returns:
+            bytes | None: The cached or freshly loaded value.
+        """
+        if not self.enabled:
+            return await loader()
+        l1 = self._l1[route]
+        value = l1.get(key)
+        if value is not None:
+            return value
+        if key in self._inflight:
+            return await asyncio.shield(self._inflight[key])
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        epoch = self._epochs[route]
+        try:
+            value = await self._load(route, key, loader, epoch, cacheable)
+            future.set_result(value)
+            return value
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as error:
+            future.set_exception(error)
+            future.exception()  # mark as retrieved when nobody else was waiting
+            raise
+        finally:
+            del self._inflight[key]
+
+    @staticmethod
+    def _generation_keys(route: str, key: str) -> list[str]:
+        return [f"cache:{route}:generation", f"{key}:generation"]
+
+    async def _load(self, route: str, key: str, loader, epoch: int, cacheable) -> bytes | None:
+        client = self._get_redis()
+        stamp = None
+        if client is not None:
+            try:
+                route_generation, key_generation, entry = await client.mget(*self._generation_keys(route, key), key)
+                stamp = f"{int(route_generation or 0)}.{int(key_generation or 0)}".encode()
+            except (RedisError, OSError) as error:
+                self._redis_failed(error)
+                client, entry = None, None
+            entry_stamp, separator, value = (entry or b"").partition(b"\n")
+            if separator and entry_stamp == stamp:
+                self.l2_hits += 1
+                # Redis may have answered before an invalidation made while waiting for it.
+                if self._epochs[route] == epoch:
+                    self._l1[route].set(key, value)
+                return value
+            self.l2_misses += 1
+        value = await loader()
+        # Results loaded across an invalidation may already be stale: serve them, do not cache them.
+        if value is None or self._epochs[route] != epoch:
+            return value
+        if cacheable is not None and not await cacheable(value):
+            return value
+        self._l1[route].set(key, value)
+        if client is not None:
+            try:
+                await client.eval(
+                    STORE_IF_CURRENT,
+                    3,
+                    *self._generation_keys(route, key),
+                    key,
+                    stamp,
+                    stamp + b"\n" + value,
+                    self.route_ttls[route],
+                )
+            except (RedisError, OSError) as error:
+                self._redis_failed(error)
+        return value
+
+    def invalidate_local(self, route: str, key: str | None = None):
+        """
+        Drop one key of a route, or every key of the route, from the L1 of this process only.
+
+        Used when another process made the write and already invalidated Redis.
+        """
+        self._epochs[route] += 1
+        if key is None:
+            self._l1[route].clear()
+        else:
+            self._l1[route].pop(key)
+
+    async def invalidate(self, route: str, key: str | None = None):
+        """
+        Drop one key of a route, or every key of the route when no key is given.
+        """
+        self.invalidate_local(route, key)
+        client = self._get_redis() if self.enabled else None
+        if client is None:
+            return
+        try:
+            if key is None:
+                await client.incr(f"cache:{route}:generation")
+            else:
+                generation_key = self._generation_keys(route, key)[1]
+                async with client.pipeline(transaction=True) as pipe:
+                    pipe.incr(generation_key)
+                    pipe.expire(generation_key, self.route_ttls[route])
+                    await pipe.execute()
+        except (RedisError, OSError) as error:
+            self._redis_failed(error)
+
+    def stats(self) -> dict:
+        """
+        Return L1 stats per route and L2 hit/miss counters.
+        """
+        return {
+            "l1": {route: cache.stats() for route, cache in self._l1.items()},
+            "l2": {"hits": self.l2_hits, "misses": self.l2_misses},
+        }
+
+    async def close(self):
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
+
+
+article_cache = ResponseCache(
+    route_ttls={"article": CACHE_TTL_ARTICLE_SECONDS, "article_list": CACHE_TTL_ARTICLE_LIST_SECONDS},
+    redis_url=CACHE_REDIS_URL,
+    l1_max_size=CACHE_L1_MAX_SIZE,
+    l1_ttl=CACHE_L1_TTL_SECONDS,
+    redis_retry_seconds=CACHE_REDIS_RETRY_SECONDS,
+    enabled=CACHE_ENABLED,
+)
+
+
+async def invalidate_articles(*article_ids: str):
+    """
+    Invalidate cached article responses after a write.
+
+    Every list page is dropped, since any write can change any page; single articles are only
+    dropped when their ids are given.
+
+    Args:
+        *article_ids (str): The IDs of the created, updated or deleted articles.
+    """
+    for article_id in article_ids:
+        await article_cache.invalidate("article", ResponseCache.make_key("article", article_id))
+    await article_cache.invalidate("article_list")
@@ -0,0 +1,41 @@
+from pymongo import TEXT, IndexModel
+
+from utils.pagination import keyset_filter
+
+# Title matches weigh more than body matches when ranking results.
+ARTICLES_TEXT_INDEX = IndexModel(
+    [("title", TEXT), ("content", TEXT)],
+    name="articles_text",
+    weights={"title": 3, "content": 1},
+    default_language="english",
+)
+
+
+def text_search_pipeline(search: str, filters: list[dict], after: tuple | None, limit: int) -> list[dict]:
+    """
+    Build an aggregation pipeline for ranked full-text search over articles.
+
+    The search string is tokenized and stemmed by the MongoDB text index, so it is never
+    interpreted as a regular expression. Results are ordered by relevance score and then by '_id',
+    which makes (score, _id) usable as a keyset cursor.
+
+    Args:
+        search (str): The user's search terms.
+        filters (list[dict]): Additional filters (e.g. tags) applied together with the search.
+        after (tuple | None): Decoded cursor (score, _id) of the last item of the previous page.
+        limit (int): Maximum number of documents to return.
+
+    Returns:
+        list[dict]: The aggregation pipeline.
+    """
+    match = {"$text": {"$search": search}}
+    for query in filters:
+        match.update(query)
+    pipeline = [
+        {"$match": match},
+        {"$addFields": {"score": {"$meta": "textScore"}}},
+    ]
+    if after:
+        pipeline.append({"$match": keyset_filter("score", *after)})
+    pipeline.extend([{"$sort": {"score": -1, "_id": -1}}, {"$limit": limit}])
+    return pipeline
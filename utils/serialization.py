@@ -0,0 +1,85 @@
+import orjson
+from fastapi import HTTPException, Response
+
+from config.settings import ARTICLE_EXCERPT_LENGTH
+
+ARTICLE_FIELDS = ("title", "content", "excerpt", "tags", "author", "created_at", "score", "version")
+# Fields of the Article model, returned by default for single articles.
+FULL_FIELDS = ("title", "content", "tags", "author", "created_at", "score", "version")
+# Fields of the ArticleSummary model, returned by default for lists.
+SUMMARY_FIELDS = ("title", "excerpt", "tags", "author", "created_at", "score", "version")
+
+
+def parse_fields(fields: str | None, default: tuple[str, ...]) -> tuple[str, ...]:
+    """
+    Parse the 'fields' query parameter into the article fields to return.
+
+    'id' is always returned and does not need to be listed.
+
+    Args:
+        fields (str | None): Comma-separated field names, e.g. "title,tags".
+        default (tuple[str, ...]): Fields returned when the parameter is not given.
+
+    Raises:
+        HTTPException: If an unknown field is requested.
+
+    Returns:
+        tuple[str, ...]: The fields, in ARTICLE_FIELDS order.
+    """
+    if not fields:
+        return default
+    requested = {field.strip() for field in fields.split(",")} - {"", "id"}
+    unknown = requested.difference(ARTICLE_FIELDS)
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(sorted(unknown))}")
+    return tuple(field for field in ARTICLE_FIELDS if field in requested)
+
+
+def article_projection(with_score: bool = False, fields: tuple[str, ...] = FULL_FIELDS) -> dict:
+    """
+    Build a $project stage that shapes article documents like the Article response model.
+
+    '_id' is renamed to a string 'id' and missing optional fields get their model defaults on the
+    server, so the documents can be encoded to JSON as they come out of the driver, without
+    change_id_name or a pydantic round-trip. Only the requested fields leave the server.
+
+    Args:
+        with_score (bool): Include the 'score' computed by a text search stage.
+        fields (tuple[str, ...]): Fields to return besides 'id'; 'excerpt' is the start of 'content'.
+
+    Returns:
+        dict: The $project stage.
+    """
+    expressions = {
+        "title": 1,
+        "content": 1,
+        "excerpt": {"$substrCP": [{"$ifNull": ["$content", ""]}, 0, ARTICLE_EXCERPT_LENGTH]},
+        "tags": {"$ifNull": ["$tags", []]},
+        "author": {"$ifNull": ["$author", None]},
+        "created_at": {"$ifNull": ["$created_at", None]},
+        "score": "$score" if with_score else {"$literal": None},
+        "version": {"$ifNull": ["$version", 0]},
+    }
+    return {"$project": {"_id": 0, "id": {"$toString": "$_id"}, **{field: expressions[field] for field in fields}}}
+
+
+def dump_json(obj) -> bytes:
+    """
+    Encode an object to JSON bytes with orjson; values orjson does not know are encoded as strings.
+    """
+    return orjson.dumps(obj, default=str)
+
+
+def json_response(body: bytes, status_code: int = 200, etag: str | None = None) -> Response:
+    """
+    Wrap already encoded JSON in a response, bypassing response_model validation.
+    """
+    headers = {"ETag": etag} if etag else None
+    return Response(content=body, status_code=status_code, media_type="application/json", headers=headers)
+
+
+def not_modified(etag: str) -> Response:
+    """
+    Build a 304 response telling the client its copy, identified by 'etag', is still current.
+    """
+    return Response(status_code=304, headers={"ETag": etag})